@@ -1,8 +1,10 @@
+import asyncio
 import logging
+import os
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile
+from fastapi import APIRouter, Depends, File, Form, Query, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_session
@@ -15,15 +17,45 @@ from app.exceptions import (
 from app.models.activity import Activity
 from app.models.photo import Photo
 from app.schemas.auth import LoginRequest, TokenResponse
-from app.schemas.activity import ActivityResponse
-from app.schemas.photo import PhotoResponse
+from app.schemas.activity import ActivityImportResponse, ActivityResponse
+from app.schemas.job import JobQueueStatus, JobResponse, ReconciliationScopeResponse
+from app.schemas.photo import (
+    DirectUploadConfirmation,
+    PhotoBulkDelete,
+    PhotoHashLookup,
+    PhotoHashLookupResponse,
+    PhotoUploadFailure,
+    PhotoUploadResponse,
+    PhotoUploadSignature,
+)
+from app.services.activity_import import ActivityImportService
 from app.services.auth import (
     verify_admin_credentials,
     create_access_token,
     get_current_admin,
 )
-from app.services.cloudinary import upload_images_bulk, upload_pdf, delete_media
+from app.services.cache import CacheBackend, get_cache, invalidate_wing
+from app.services.cloudinary import (
+    get_images,
+    sign_upload,
+    upload_images_bulk,
+    upload_pdf,
+    verify_upload,
+)
+from app.services.content_hash import hash_upload, match_photos, reuse_photo
 from app.services.crud import CRUDService
+from app.services.jobs import (
+    DEAD,
+    RECONCILE_MEDIA_JOB,
+    UPLOAD_PHOTO_JOB,
+    JobService,
+    job_queue,
+)
+from app.services.image_ingest import normalize_uploads
+from app.services.invalidation import get_invalidation_bus
+from app.services.media_jobs import spool_upload
+from app.services.reconciliation import ACTIONS, ReconciliationService
+from app.services.snapshots import SnapshotService
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +89,36 @@ def validate_pdf_file(file: UploadFile) -> None:
         )
 
 
+async def store_report(
+    session: AsyncSession,
+    file: UploadFile,
+    folder: str
+) -> Dict[str, Optional[str]]:
+    validate_pdf_file(file)
+    
+    report_hash = await hash_upload(file)
+    existing = await CRUDService.get_activity_by_report_hash(session, report_hash)
+    if existing:
+        logger.info(f"Reusing report {existing.report_cloudinary_id} for identical upload '{file.filename}'")
+        return {
+            "report_url": existing.report_url,
+            "report_cloudinary_id": existing.report_cloudinary_id,
+            "report_hash": report_hash,
+        }
+    
+    try:
+        upload_result = await upload_pdf(file, folder)
+    except Exception as e:
+        logger.error(f"Failed to upload PDF: {e}")
+        raise ExternalServiceError("Cloudinary", "Failed to upload PDF report")
+    
+    return {
+        "report_url": upload_result["url"],
+        "report_cloudinary_id": upload_result["public_id"],
+        "report_hash": report_hash,
+    }
+
+
 @router.post("/login", response_model=TokenResponse)
 async def admin_login(credentials: LoginRequest) -> TokenResponse:
     if not verify_admin_credentials(credentials.username, credentials.password):
@@ -73,13 +135,14 @@ async def admin_login(credentials: LoginRequest) -> TokenResponse:
     return TokenResponse(access_token=access_token)
 
 
-@router.post("/photos", response_model=List[PhotoResponse])
+@router.post("/photos", response_model=PhotoUploadResponse)
 async def upload_photos(
     wing_id: int = Form(..., description="Wing ID to upload photos to"),
     files: List[UploadFile] = File(..., description="Image files to upload"),
     session: AsyncSession = Depends(get_session),
+    cache: CacheBackend = Depends(get_cache),
     current_admin: dict = Depends(get_current_admin)
-) -> List[PhotoResponse]:
+) -> PhotoUploadResponse:
     wing = await CRUDService.get_wing_by_id(session, wing_id)
     if not wing:
         raise NotFoundError("Wing", identifier=str(wing_id))
@@ -89,32 +152,226 @@ async def upload_photos(
     
     logger.info(f"Uploading {len(files)} photos to wing '{wing.slug}' by {current_admin.get('sub')}")
     
-    try:
-        folder = f"anvaya/{wing.slug}"
-        uploaded_files = await upload_images_bulk(files, folder)
-    except Exception as e:
-        logger.error(f"Cloudinary upload failed: {e}")
-        raise ExternalServiceError("Cloudinary", "Failed to upload images")
+    hashes = await asyncio.gather(*(hash_upload(file) for file in files))
+    in_wing, elsewhere = await match_photos(session, wing_id, hashes)
+    
+    duplicates = []
+    photos = []
+    pending = {}
+    repeated = []
+    seen = set()
+    for file, content_hash in zip(files, hashes):
+        if content_hash in in_wing:
+            duplicates.append(in_wing[content_hash])
+        elif content_hash in seen:
+            repeated.append((file, content_hash))
+        elif content_hash in elsewhere:
+            photos.append(reuse_photo(elsewhere[content_hash], wing_id, content_hash))
+        else:
+            pending[content_hash] = file
+        seen.add(content_hash)
+    
+    if duplicates or photos or len(pending) < len(files):
+        logger.info(
+            f"Skipping {len(files) - len(pending)} already stored photos for wing '{wing.slug}' "
+            f"({len(photos)} reused from other wings)"
+        )
     
-    photos = [
+    new_files = list(pending.values())
+    new_hashes = list(pending)
+    ingest = await normalize_uploads(new_files)
+    folder = f"anvaya/{wing.slug}"
+    upload_results = await upload_images_bulk(new_files, folder) if new_files else {"uploaded": [], "failed": []}
+    failed = [
+        PhotoUploadFailure(filename=failure["filename"], error=failure["error"])
+        for failure in upload_results["failed"]
+    ]
+    
+    if new_files and not upload_results["uploaded"] and not (photos or duplicates):
+        logger.error(f"Cloudinary upload failed for all {len(new_files)} files")
+        raise ExternalServiceError(
+            "Cloudinary",
+            "Failed to upload images",
+            failed=[failure.model_dump() for failure in failed]
+        )
+    
+    photos.extend(
         Photo(
             wing_id=wing_id,
             url=upload_result["url"],
-            cloudinary_id=upload_result["public_id"]
+            cloudinary_id=upload_result["public_id"],
+            width=upload_result["width"],
+            height=upload_result["height"],
+            size_bytes=upload_result["size_bytes"],
+            format=upload_result["format"],
+            content_hash=new_hashes[upload_result["index"]]
         )
-        for upload_result in uploaded_files
-    ]
+        for upload_result in upload_results["uploaded"]
+    )
     
-    created_photos = await CRUDService.create_photos_bulk(session, photos)
-    logger.info(f"Created {len(created_photos)} photo records for wing '{wing.slug}'")
+    created_photos = await CRUDService.create_photos_bulk(session, photos) if photos else []
+    if created_photos:
+        logger.info(f"Created {len(created_photos)} photo records for wing '{wing.slug}'")
+        await invalidate_wing(cache, wing.slug)
     
-    return created_photos
+    batch_photos = {photo.content_hash: photo for photo in created_photos}
+    batch_errors = {new_hashes[failure["index"]]: failure["error"] for failure in upload_results["failed"]}
+    for file, content_hash in repeated:
+        if content_hash in batch_photos:
+            duplicates.append(batch_photos[content_hash])
+        else:
+            failed.append(PhotoUploadFailure(filename=file.filename, error=batch_errors.get(content_hash, "Upload failed")))
+    
+    return PhotoUploadResponse(
+        photos=created_photos,
+        failed=failed,
+        duplicates=duplicates,
+        bytes_saved=ingest["bytes_saved"]
+    )
+
+
+@router.post("/photos/lookup", response_model=PhotoHashLookupResponse)
+async def lookup_photo_hashes(
+    lookup: PhotoHashLookup,
+    session: AsyncSession = Depends(get_session),
+    current_admin: dict = Depends(get_current_admin)
+) -> PhotoHashLookupResponse:
+    wing = await CRUDService.get_wing_by_id(session, lookup.wing_id)
+    if not wing:
+        raise NotFoundError("Wing", identifier=str(lookup.wing_id))
+    
+    in_wing, _ = await match_photos(session, wing.id, lookup.content_hashes)
+    return PhotoHashLookupResponse(existing=in_wing)
+
+
+@router.post("/photos/signature", response_model=PhotoUploadSignature)
+async def create_upload_signature(
+    wing_id: int = Form(..., description="Wing ID the photos will be uploaded to"),
+    session: AsyncSession = Depends(get_session),
+    current_admin: dict = Depends(get_current_admin)
+) -> PhotoUploadSignature:
+    wing = await CRUDService.get_wing_by_id(session, wing_id)
+    if not wing:
+        raise NotFoundError("Wing", identifier=str(wing_id))
+    
+    allowed_formats = sorted(ext.lstrip(".") for ext in ALLOWED_IMAGE_EXTENSIONS)
+    return PhotoUploadSignature(**sign_upload(f"anvaya/{wing.slug}", allowed_formats))
+
+
+@router.post("/photos/confirm", response_model=PhotoUploadResponse)
+async def confirm_direct_uploads(
+    confirmation: DirectUploadConfirmation,
+    session: AsyncSession = Depends(get_session),
+    cache: CacheBackend = Depends(get_cache),
+    current_admin: dict = Depends(get_current_admin)
+) -> PhotoUploadResponse:
+    wing = await CRUDService.get_wing_by_id(session, confirmation.wing_id)
+    if not wing:
+        raise NotFoundError("Wing", identifier=str(confirmation.wing_id))
+    
+    folder_prefix = f"anvaya/{wing.slug}/"
+    verified = {}
+    failed = []
+    for upload in confirmation.uploads:
+        filename = upload.original_filename or upload.public_id
+        if not upload.public_id.startswith(folder_prefix):
+            failed.append(PhotoUploadFailure(filename=filename, error="Upload is outside this wing's folder"))
+        elif not verify_upload(upload.public_id, upload.version, upload.signature):
+            failed.append(PhotoUploadFailure(filename=filename, error="Invalid upload signature"))
+        else:
+            verified[upload.public_id] = upload
+    
+    existing = await CRUDService.get_existing_cloudinary_ids(session, list(verified))
+    pending = [public_id for public_id in verified if public_id not in existing]
+    images = await get_images(pending) if pending else {}
+    
+    photos = []
+    for public_id in pending:
+        upload = verified[public_id]
+        image = images.get(public_id)
+        if not image or image["version"] != upload.version:
+            failed.append(PhotoUploadFailure(
+                filename=upload.original_filename or public_id,
+                error="Upload not found in Cloudinary"
+            ))
+            continue
+        photos.append(Photo(
+            wing_id=wing.id,
+            url=image["url"],
+            cloudinary_id=public_id,
+            width=image["width"],
+            height=image["height"],
+            size_bytes=image["size_bytes"],
+            format=image["format"]
+        ))
+    
+    created_photos = await CRUDService.create_photos_bulk(session, photos) if photos else []
+    if created_photos:
+        await invalidate_wing(cache, wing.slug)
+    
+    logger.info(
+        f"Confirmed {len(created_photos)} direct uploads for wing '{wing.slug}' "
+        f"by {current_admin.get('sub')} ({len(failed)} rejected)"
+    )
+    return PhotoUploadResponse(photos=created_photos, failed=failed)
+
+
+@router.post("/photos/async", response_model=List[JobResponse], status_code=202)
+async def queue_photo_uploads(
+    wing_id: int = Form(..., description="Wing ID to upload photos to"),
+    files: List[UploadFile] = File(..., description="Image files to upload"),
+    session: AsyncSession = Depends(get_session),
+    cache: CacheBackend = Depends(get_cache),
+    current_admin: dict = Depends(get_current_admin)
+) -> List[JobResponse]:
+    wing = await CRUDService.get_wing_by_id(session, wing_id)
+    if not wing:
+        raise NotFoundError("Wing", identifier=str(wing_id))
+    
+    for file in files:
+        validate_image_file(file)
+    
+    spooled = [await spool_upload(file) for file in files]
+    in_wing, elsewhere = await match_photos(session, wing_id, [content_hash for _, content_hash in spooled])
+    
+    jobs = []
+    reused = []
+    queued = set()
+    for file, (path, content_hash) in zip(files, spooled):
+        if content_hash in in_wing or content_hash in queued:
+            path.unlink(missing_ok=True)
+        elif content_hash in elsewhere:
+            queued.add(content_hash)
+            reused.append(reuse_photo(elsewhere[content_hash], wing_id, content_hash))
+            path.unlink(missing_ok=True)
+        else:
+            queued.add(content_hash)
+            jobs.append(JobService.enqueue(session, UPLOAD_PHOTO_JOB, {
+                "wing_id": wing_id,
+                "filename": file.filename,
+                "path": str(path),
+                "public_id": path.stem,
+                "content_hash": content_hash,
+            }))
+    
+    if reused:
+        await CRUDService.create_photos_bulk(session, reused)
+        await invalidate_wing(cache, wing.slug)
+    else:
+        await session.commit()
+    
+    logger.info(
+        f"Queued {len(jobs)} photo uploads for wing '{wing.slug}' by {current_admin.get('sub')} "
+        f"({len(files) - len(jobs)} already stored)"
+    )
+    return jobs
 
 
 @router.delete("/photos/{photo_id}")
 async def delete_photo(
     photo_id: int,
     session: AsyncSession = Depends(get_session),
+    cache: CacheBackend = Depends(get_cache),
     current_admin: dict = Depends(get_current_admin)
 ) -> dict:
     photo = await CRUDService.get_photo_by_id(session, photo_id)
@@ -123,16 +380,34 @@ async def delete_photo(
     
     logger.info(f"Deleting photo {photo_id} by {current_admin.get('sub')}")
     
-    try:
-        delete_media(photo.cloudinary_id, resource_type="image")
-    except Exception as e:
-        logger.warning(f"Failed to delete photo from Cloudinary: {e}")
-    
     await CRUDService.delete_photo(session, photo_id)
     
+    wing = await CRUDService.get_wing_by_id(session, photo.wing_id)
+    if wing:
+        await invalidate_wing(cache, wing.slug)
+    
     return {"message": "Photo deleted successfully"}
 
 
+@router.post("/photos/bulk-delete")
+async def delete_photos_bulk(
+    request: PhotoBulkDelete,
+    session: AsyncSession = Depends(get_session),
+    cache: CacheBackend = Depends(get_cache),
+    current_admin: dict = Depends(get_current_admin)
+) -> dict:
+    logger.info(f"Deleting {len(request.photo_ids)} photos by {current_admin.get('sub')}")
+    
+    deleted, wing_ids = await CRUDService.delete_photos_bulk(session, request.photo_ids)
+    
+    for wing_id in wing_ids:
+        wing = await CRUDService.get_wing_by_id(session, wing_id)
+        if wing:
+            await invalidate_wing(cache, wing.slug)
+    
+    return {"message": f"Deleted {deleted} photos", "deleted": deleted}
+
+
 @router.post("/activities", response_model=ActivityResponse)
 async def create_activity(
     wing_id: int = Form(..., description="Wing ID for the activity"),
@@ -142,27 +417,18 @@ async def create_activity(
     faculty_coordinator: Optional[str] = Form(None, max_length=200, description="Faculty coordinator name"),
     report_file: Optional[UploadFile] = File(None, description="Optional PDF report"),
     session: AsyncSession = Depends(get_session),
+    cache: CacheBackend = Depends(get_cache),
     current_admin: dict = Depends(get_current_admin)
 ) -> ActivityResponse:
     wing = await CRUDService.get_wing_by_id(session, wing_id)
     if not wing:
         raise NotFoundError("Wing", identifier=str(wing_id))
     
-    report_url: Optional[str] = None
-    report_cloudinary_id: Optional[str] = None
+    report: dict = {}
     
     if report_file and report_file.filename:
-        validate_pdf_file(report_file)
-        
-        try:
-            folder = f"anvaya/{wing.slug}/reports"
-            upload_result = await upload_pdf(report_file, folder)
-            report_url = upload_result["url"]
-            report_cloudinary_id = upload_result["public_id"]
-            logger.info(f"Uploaded report PDF for activity '{title}'")
-        except Exception as e:
-            logger.error(f"Failed to upload PDF: {e}")
-            raise ExternalServiceError("Cloudinary", "Failed to upload PDF report")
+        report = await store_report(session, report_file, f"anvaya/{wing.slug}/reports")
+        logger.info(f"Stored report PDF for activity '{title}'")
     
     activity = Activity(
         wing_id=wing_id,
@@ -170,16 +436,43 @@ async def create_activity(
         description=description.strip(),
         activity_date=activity_date,
         faculty_coordinator=faculty_coordinator.strip() if faculty_coordinator else None,
-        report_url=report_url,
-        report_cloudinary_id=report_cloudinary_id
+        **report
     )
     
     created_activity = await CRUDService.create_activity(session, activity)
     logger.info(f"Created activity '{title}' for wing '{wing.slug}' by {current_admin.get('sub')}")
+    await invalidate_wing(cache, wing.slug)
     
     return created_activity
 
 
+@router.post("/activities/import", response_model=ActivityImportResponse)
+async def import_activities(
+    file: UploadFile = File(..., description="CSV, JSON array or NDJSON file of activities"),
+    skip_invalid: bool = Query(False, description="Import valid rows even if some rows fail validation"),
+    dry_run: bool = Query(False, description="Validate the file without writing anything"),
+    session: AsyncSession = Depends(get_session),
+    cache: CacheBackend = Depends(get_cache),
+    current_admin: dict = Depends(get_current_admin)
+) -> ActivityImportResponse:
+    report, slugs = await ActivityImportService.import_file(
+        session,
+        file.file,
+        file.filename,
+        skip_invalid=skip_invalid,
+        dry_run=dry_run,
+    )
+    logger.info(
+        f"Activity import '{file.filename}' by {current_admin.get('sub')}: "
+        f"{report.imported} imported, {report.failed} failed"
+    )
+    
+    for slug in slugs:
+        await invalidate_wing(cache, slug)
+    
+    return report
+
+
 @router.put("/activities/{activity_id}", response_model=ActivityResponse)
 async def update_activity(
     activity_id: int,
@@ -189,12 +482,14 @@ async def update_activity(
     faculty_coordinator: Optional[str] = Form(None, max_length=200),
     report_file: Optional[UploadFile] = File(None),
     session: AsyncSession = Depends(get_session),
+    cache: CacheBackend = Depends(get_cache),
     current_admin: dict = Depends(get_current_admin)
 ) -> ActivityResponse:
     activity = await CRUDService.get_activity_by_id(session, activity_id)
     if not activity:
         raise NotFoundError("Activity", identifier=str(activity_id))
     
+    wing = await CRUDService.get_wing_by_id(session, activity.wing_id)
     update_data: dict = {}
     
     if title is not None:
@@ -207,26 +502,13 @@ async def update_activity(
         update_data["faculty_coordinator"] = faculty_coordinator.strip() if faculty_coordinator else None
     
     if report_file and report_file.filename:
-        validate_pdf_file(report_file)
-        
-        if activity.report_cloudinary_id:
-            try:
-                delete_media(activity.report_cloudinary_id, resource_type="raw")
-            except Exception as e:
-                logger.warning(f"Failed to delete old PDF: {e}")
-        
-        try:
-            wing = await CRUDService.get_wing_by_id(session, activity.wing_id)
-            folder = f"anvaya/{wing.slug}/reports" if wing else "anvaya/reports"
-            upload_result = await upload_pdf(report_file, folder)
-            update_data["report_url"] = upload_result["url"]
-            update_data["report_cloudinary_id"] = upload_result["public_id"]
-        except Exception as e:
-            logger.error(f"Failed to upload PDF: {e}")
-            raise ExternalServiceError("Cloudinary", "Failed to upload PDF report")
+        folder = f"anvaya/{wing.slug}/reports" if wing else "anvaya/reports"
+        update_data.update(await store_report(session, report_file, folder))
     
     updated_activity = await CRUDService.update_activity(session, activity_id, update_data)
     logger.info(f"Updated activity {activity_id} by {current_admin.get('sub')}")
+    if wing:
+        await invalidate_wing(cache, wing.slug)
     
     return updated_activity
 
@@ -235,6 +517,7 @@ async def update_activity(
 async def delete_activity(
     activity_id: int,
     session: AsyncSession = Depends(get_session),
+    cache: CacheBackend = Depends(get_cache),
     current_admin: dict = Depends(get_current_admin)
 ) -> dict:
     activity = await CRUDService.get_activity_by_id(session, activity_id)
@@ -243,12 +526,94 @@ async def delete_activity(
     
     logger.info(f"Deleting activity {activity_id} by {current_admin.get('sub')}")
     
-    if activity.report_cloudinary_id:
-        try:
-            delete_media(activity.report_cloudinary_id, resource_type="raw")
-        except Exception as e:
-            logger.warning(f"Failed to delete PDF from Cloudinary: {e}")
-    
     await CRUDService.delete_activity(session, activity_id)
     
+    wing = await CRUDService.get_wing_by_id(session, activity.wing_id)
+    if wing:
+        await invalidate_wing(cache, wing.slug)
+    
     return {"message": "Activity deleted successfully"}
+
+
+@router.get("/cache")
+async def get_cache_stats(
+    cache: CacheBackend = Depends(get_cache),
+    current_admin: dict = Depends(get_current_admin)
+) -> dict:
+    return {**cache.stats(), "worker_pid": os.getpid(), "invalidation": get_invalidation_bus().stats()}
+
+
+@router.get("/jobs", response_model=JobQueueStatus)
+async def get_job_queue_status(
+    status: Optional[str] = Query(default=DEAD, description="Only list jobs in this status"),
+    limit: int = Query(default=50, ge=1, le=500),
+    session: AsyncSession = Depends(get_session),
+    current_admin: dict = Depends(get_current_admin)
+) -> JobQueueStatus:
+    return JobQueueStatus(
+        worker_pid=os.getpid(),
+        workers=job_queue.concurrency,
+        running=job_queue.running,
+        counts=await JobService.get_counts(session),
+        oldest_pending_at=await JobService.get_oldest_pending(session),
+        jobs=await JobService.list_jobs(session, status=status, limit=limit),
+    )
+
+
+@router.post("/jobs/{job_id}/retry", response_model=JobResponse)
+async def retry_job(
+    job_id: int,
+    session: AsyncSession = Depends(get_session),
+    current_admin: dict = Depends(get_current_admin)
+) -> JobResponse:
+    job = await JobService.get_job(session, job_id)
+    if not job:
+        raise NotFoundError("Job", identifier=str(job_id))
+    if job.status != DEAD:
+        raise ValidationError(f"Only dead jobs can be retried (job is {job.status})", field="job_id")
+    
+    job = await JobService.retry(session, job)
+    logger.info(f"Requeued job {job_id} by {current_admin.get('sub')}")
+    return job
+
+
+@router.post("/media/reconcile", response_model=JobResponse, status_code=202)
+async def queue_media_reconciliation(
+    action: str = Query(default="report", description=f"One of: {', '.join(ACTIONS)}"),
+    max_pages: Optional[int] = Query(default=None, ge=1, description="Pages to process before pausing at a checkpoint"),
+    session: AsyncSession = Depends(get_session),
+    current_admin: dict = Depends(get_current_admin)
+) -> JobResponse:
+    if action not in ACTIONS:
+        raise ValidationError(f"Invalid action. Allowed: {', '.join(ACTIONS)}", field="action")
+    
+    active = await JobService.find_active(session, RECONCILE_MEDIA_JOB)
+    if active:
+        return active
+    
+    job = JobService.enqueue(
+        session, RECONCILE_MEDIA_JOB, {"action": action, "max_pages": max_pages}, max_attempts=3
+    )
+    await session.commit()
+    
+    logger.info(f"Queued media reconciliation ({action}) by {current_admin.get('sub')}")
+    return job
+
+
+@router.post("/snapshots", response_model=JobResponse, status_code=202)
+async def queue_snapshot_rebuild(
+    force: bool = Query(default=False, description="Rewrite every file even if its wing version is unchanged"),
+    session: AsyncSession = Depends(get_session),
+    current_admin: dict = Depends(get_current_admin)
+) -> JobResponse:
+    job = await SnapshotService.schedule(session, force=force)
+    logger.info(f"Queued static snapshot build by {current_admin.get('sub')}")
+    return job
+
+
+@router.get("/media/reconcile", response_model=List[ReconciliationScopeResponse])
+async def get_media_reconciliation_status(
+    session: AsyncSession = Depends(get_session),
+    current_admin: dict = Depends(get_current_admin)
+) -> List[ReconciliationScopeResponse]:
+    return await ReconciliationService.get_checkpoints(session)
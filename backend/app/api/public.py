@@ -1,77 +1,196 @@
-from collections import defaultdict
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_session
-from app.exceptions import NotFoundError
+from app.database import async_session, get_session
+from app.exceptions import NotFoundError, ValidationError
+from app.services.cache import CacheBackend, get_cache, wing_key, wings_list_key
 from app.services.crud import CRUDService
+from app.services.http_cache import conditional_response
+from app.services.pagination import build_page, decode_cursor
+from app.services.public_views import PublicViews
+from app.services.search import SearchService
+from app.services.serialization import dump_json, json_response
+from app.services.versioning import VersionService
 from app.schemas.wing import WingResponse, WingWithRelations
-from app.schemas.activity import ActivityResponse
-from app.schemas.photo import PhotoResponse
+from app.schemas.activity import ActivityPage, ActivityResponse
+from app.schemas.photo import PhotoPage
+from app.schemas.search import SearchResponse
 
 router = APIRouter()
 
 
+def activity_filters(
+    year: Optional[int] = Query(default=None, ge=2000, le=2100, description="Only activities from this year"),
+    date_from: Optional[date] = Query(default=None, description="Earliest activity date"),
+    date_to: Optional[date] = Query(default=None, description="Latest activity date"),
+    has_report: Optional[bool] = Query(default=None, description="Only activities with (true) or without (false) a report")
+) -> Dict[str, Any]:
+    if date_from and date_to and date_from > date_to:
+        raise ValidationError("date_from must not be after date_to", field="date_from")
+    
+    if year is not None:
+        date_from = max(date_from or date.min, date(year, 1, 1))
+        date_to = min(date_to or date.max, date(year, 12, 31))
+    
+    return {"date_from": date_from, "date_to": date_to, "has_report": has_report}
+
+
+def filters_key(filters: Dict[str, Any]) -> str:
+    return ":".join("" if value is None else str(value) for value in filters.values())
+
+
 @router.get("/wings", response_model=List[WingResponse])
 async def get_all_wings(
-    session: AsyncSession = Depends(get_session)
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_session),
+    cache: CacheBackend = Depends(get_cache)
 ) -> List[WingResponse]:
-    wings = await CRUDService.get_all_wings(session)
-    return wings
+    version, last_modified = await VersionService.get_global_version(session)
+    not_modified = conditional_response(request, response, version, last_modified)
+    if not_modified:
+        return not_modified
+    
+    async def load_wings() -> bytes:
+        return dump_json(await PublicViews.wings(session))
+    
+    body = await cache.get_or_set(wings_list_key(version), load_wings)
+    return json_response(body, response)
 
 
 @router.get("/wings/{slug}", response_model=WingWithRelations)
 async def get_wing_by_slug(
+    request: Request,
+    response: Response,
     slug: str,
-    session: AsyncSession = Depends(get_session)
+    activities_limit: int = Query(default=20, ge=0, le=100, description="Latest activities to include"),
+    photos_limit: int = Query(default=20, ge=0, le=100, description="Latest photos to include"),
+    session: AsyncSession = Depends(get_session),
+    cache: CacheBackend = Depends(get_cache)
 ) -> WingWithRelations:
-    wing = await CRUDService.get_wing_with_relations(session, slug)
+    wing_version = await VersionService.get_wing_version(session, slug)
+    if wing_version is None:
+        raise NotFoundError("Wing", slug=slug)
     
-    if not wing:
+    version, last_modified = wing_version
+    not_modified = conditional_response(request, response, version, last_modified)
+    if not_modified:
+        return not_modified
+    
+    async def load_wing() -> Optional[bytes]:
+        detail = await PublicViews.wing_detail(session, slug, activities_limit, photos_limit)
+        return dump_json(detail) if detail else None
+    
+    body = await cache.get_or_set(
+        wing_key(slug, f"detail:{version}:{activities_limit}:{photos_limit}"), load_wing
+    )
+    
+    if not body:
         raise NotFoundError("Wing", slug=slug)
     
-    return wing
+    return json_response(body, response)
 
 
-@router.get("/wings/{slug}/photos", response_model=List[PhotoResponse])
+@router.get("/wings/{slug}/photos", response_model=PhotoPage)
 async def get_wing_photos(
+    request: Request,
+    response: Response,
     slug: str,
     limit: int = Query(default=100, ge=1, le=500, description="Maximum photos to return"),
-    offset: int = Query(default=0, ge=0, description="Number of photos to skip"),
+    cursor: Optional[str] = Query(default=None, description="Cursor from a previous page's next_cursor"),
     session: AsyncSession = Depends(get_session)
-) -> List[PhotoResponse]:
+) -> PhotoPage:
+    after = decode_cursor(cursor, datetime.fromisoformat)
+    
+    wing_version = await VersionService.get_wing_version(session, slug)
+    if wing_version is None:
+        raise NotFoundError("Wing", slug=slug)
+    
+    not_modified = conditional_response(request, response, *wing_version)
+    if not_modified:
+        return not_modified
+    
     wing = await CRUDService.get_wing_by_slug(session, slug)
     
     if not wing:
         raise NotFoundError("Wing", slug=slug)
     
-    photos = await CRUDService.get_photos_by_wing(
-        session, wing.id, limit=limit, offset=offset
-    )
-    return photos
+    page = await PublicViews.photo_page(session, wing.id, limit=limit, cursor=after)
+    return json_response(dump_json(page), response)
 
 
-@router.get("/wings/{slug}/activities", response_model=List[ActivityResponse])
+@router.get("/wings/{slug}/activities", response_model=ActivityPage)
 async def get_wing_activities(
+    request: Request,
+    response: Response,
     slug: str,
-    session: AsyncSession = Depends(get_session)
-) -> List[ActivityResponse]:
-    wing = await CRUDService.get_wing_by_slug(session, slug)
+    limit: int = Query(default=100, ge=1, le=500, description="Maximum activities to return"),
+    cursor: Optional[str] = Query(default=None, description="Cursor from a previous page's next_cursor"),
+    filters: Dict[str, Any] = Depends(activity_filters),
+    session: AsyncSession = Depends(get_session),
+    cache: CacheBackend = Depends(get_cache)
+) -> ActivityPage:
+    after = decode_cursor(cursor, date.fromisoformat)
     
-    if not wing:
+    wing_version = await VersionService.get_wing_version(session, slug)
+    if wing_version is None:
         raise NotFoundError("Wing", slug=slug)
     
-    activities = await CRUDService.get_activities_by_wing(session, wing.id)
-    return activities
+    version, last_modified = wing_version
+    not_modified = conditional_response(request, response, version, last_modified)
+    if not_modified:
+        return not_modified
+    
+    async def load_activities() -> Optional[bytes]:
+        wing = await CRUDService.get_wing_by_slug(session, slug)
+        if not wing:
+            return None
+        return dump_json(
+            await PublicViews.activity_page(session, wing.id, limit=limit, cursor=after, **filters)
+        )
+    
+    body = await cache.get_or_set(
+        wing_key(slug, f"activities:{version}:{limit}:{cursor or ''}:{filters_key(filters)}"), load_activities
+    )
+    
+    if body is None:
+        raise NotFoundError("Wing", slug=slug)
+    
+    return json_response(body, response)
+
+
+@router.get(
+    "/activities/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def export_activities(
+    batch_size: int = Query(default=500, ge=1, le=5000, description="Rows fetched per database round-trip")
+) -> StreamingResponse:
+    async def generate() -> AsyncIterator[bytes]:
+        async with async_session() as session:
+            async for batch in CRUDService.stream_all_activities(session, batch_size):
+                yield b"".join(dump_json(activity) + b"\n" for activity in batch)
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/activities/{activity_id}", response_model=ActivityResponse)
 async def get_activity(
+    request: Request,
+    response: Response,
     activity_id: int,
     session: AsyncSession = Depends(get_session)
 ) -> ActivityResponse:
+    version, last_modified = await VersionService.get_global_version(session)
+    not_modified = conditional_response(request, response, version, last_modified)
+    if not_modified:
+        return not_modified
+    
     activity = await CRUDService.get_activity_by_id(session, activity_id)
     
     if not activity:
@@ -80,17 +199,76 @@ async def get_activity(
     return activity
 
 
-@router.get("/activities", response_model=List[ActivityResponse])
+@router.get("/activities", response_model=ActivityPage)
 async def get_all_activities(
-    limit: int = Query(default=1000, ge=1, le=5000, description="Maximum activities to return"),
+    request: Request,
+    response: Response,
+    limit: int = Query(default=100, ge=1, le=500, description="Maximum activities to return"),
+    cursor: Optional[str] = Query(default=None, description="Cursor from a previous page's next_cursor"),
+    wing: Optional[List[str]] = Query(default=None, description="Only activities from these wing slugs (repeatable)"),
+    filters: Dict[str, Any] = Depends(activity_filters),
+    session: AsyncSession = Depends(get_session)
+) -> ActivityPage:
+    after = decode_cursor(cursor, date.fromisoformat)
+    
+    version, last_modified = await VersionService.get_global_version(session)
+    not_modified = conditional_response(request, response, version, last_modified)
+    if not_modified:
+        return not_modified
+    
+    wing_ids = None
+    if wing:
+        slug_map = await CRUDService.get_wing_slug_map(session)
+        unknown = [slug for slug in wing if slug not in slug_map]
+        if unknown:
+            raise NotFoundError("Wing", slug=unknown[0])
+        wing_ids = sorted({slug_map[slug] for slug in wing})
+    
+    page = await PublicViews.activity_page(
+        session, limit=limit, cursor=after, wing_ids=wing_ids, **filters
+    )
+    return json_response(dump_json(page), response)
+
+
+@router.get("/search", response_model=SearchResponse)
+async def search(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="Search text; each word is prefix-matched"),
+    wing: Optional[str] = Query(default=None, description="Only return activities from this wing slug"),
+    date_from: Optional[date] = Query(default=None, description="Earliest activity date"),
+    date_to: Optional[date] = Query(default=None, description="Latest activity date"),
+    limit: int = Query(default=20, ge=1, le=100, description="Maximum activities to return"),
+    cursor: Optional[str] = Query(default=None, description="Cursor from a previous page's next_cursor"),
     session: AsyncSession = Depends(get_session)
-) -> List[ActivityResponse]:
-    activities = await CRUDService.get_all_activities(session, limit=limit)
-    return activities
+) -> SearchResponse:
+    if date_from and date_to and date_from > date_to:
+        raise ValidationError("date_from must not be after date_to", field="date_from")
+    after = decode_cursor(cursor, float)
+    
+    version, last_modified = await VersionService.get_global_version(session)
+    not_modified = conditional_response(request, response, version, last_modified)
+    if not_modified:
+        return not_modified
+    
+    activities = await SearchService.search_activities(
+        session, q, wing, date_from, date_to, limit=limit + 1, cursor=after
+    )
+    items, next_cursor = build_page(
+        activities, limit, key=lambda activity: (activity["rank"], activity["id"])
+    )
+    wings = [] if cursor or wing else await SearchService.search_wings(session, q)
+    
+    return json_response(
+        dump_json({"query": q, "wings": wings, "activities": items, "next_cursor": next_cursor}),
+        response,
+    )
 
 
 @router.get("/statistics/activities")
 async def get_activity_statistics(
+    request: Request,
+    response: Response,
     year: Optional[int] = Query(
         default=None,
         ge=2000,
@@ -99,37 +277,9 @@ async def get_activity_statistics(
     ),
     session: AsyncSession = Depends(get_session)
 ) -> dict:
-    activities_with_wings = await CRUDService.get_all_activities_with_wings(session)
-    
-    wing_stats: dict = defaultdict(lambda: {"name": "", "slug": "", "count": 0})
-    years_set: set = set()
-    
-    for activity, wing in activities_with_wings:
-        activity_year = activity.activity_date.year
-        years_set.add(activity_year)
-        
-        if year is not None and activity_year != year:
-            continue
-        
-        wing_stats[wing.id]["name"] = wing.name
-        wing_stats[wing.id]["slug"] = wing.slug
-        wing_stats[wing.id]["count"] += 1
-    
-    statistics = [
-        {
-            "wing_id": wing_id,
-            "wing_name": data["name"],
-            "wing_slug": data["slug"],
-            "activity_count": data["count"],
-        }
-        for wing_id, data in wing_stats.items()
-    ]
-    statistics.sort(key=lambda x: x["activity_count"], reverse=True)
-    
-    available_years = sorted(list(years_set), reverse=True)
-    
-    return {
-        "statistics": statistics,
-        "available_years": available_years,
-        "filtered_year": year,
-    }
+    version, last_modified = await VersionService.get_global_version(session)
+    not_modified = conditional_response(request, response, version, last_modified)
+    if not_modified:
+        return not_modified
+    
+    return await PublicViews.statistics(session, year)
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Optional
 from dotenv import load_dotenv
 load_dotenv()
 import os
@@ -7,6 +8,13 @@ import os
 
 class Settings(BaseSettings):
     database_url: str
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_timeout_ms: int = 15000
+    db_bulk_batch_size: int = 500
     port: int = 8000
     admin_username: str
     admin_password: str
@@ -16,6 +24,42 @@ class Settings(BaseSettings):
     cloudinary_cloud_name: str
     cloudinary_api_key: str
     cloudinary_api_secret: str
+    cloudinary_upload_prefix: Optional[str] = None
+    cloudinary_upload_concurrency: int = 4
+    cache_backend: str = "memory"
+    cache_url: Optional[str] = None
+    cache_ttl_seconds: int = 300
+    cache_max_entries: int = 1024
+    http_cache_max_age: int = 0
+    compression_minimum_size: int = 1024
+    compression_level: int = 6
+    compression_brotli_quality: int = 4
+    compression_cache_entries: int = 256
+    job_workers: int = 2
+    job_poll_interval_seconds: float = 1.0
+    job_max_attempts: int = 8
+    job_retry_base_seconds: float = 5.0
+    job_retry_max_seconds: float = 3600.0
+    job_lock_timeout_seconds: int = 300
+    job_retention_hours: int = 72
+    job_spool_dir: str = "spool"
+    reconcile_batch_size: int = 100
+    reconcile_grace_hours: int = 24
+    image_ingest_enabled: bool = True
+    image_ingest_workers: int = 2
+    image_max_edge: int = 2560
+    image_quality: int = 82
+    snapshot_enabled: bool = False
+    snapshot_dir: str = "snapshots"
+    snapshot_page_size: int = 100
+    snapshot_retain_seconds: int = 3600
+    web_workers: int = 0
+    web_workers_max: int = 4
+    metrics_dir: Optional[str] = None
+    metrics_flush_seconds: float = 5.0
+    startup_migrations: bool = True
+    invalidation_backend: str = "auto"
+    invalidation_socket_dir: Optional[str] = None
     cors_origins: str = os.getenv("CORS_ORIGINS")
     
     class Config:
@@ -1,16 +1,98 @@
+import time
+from typing import Any, Dict
+
 from sqlmodel import SQLModel, create_engine
+from sqlalchemy import event, exc, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import get_settings
+from app.metrics import db_pool_connections, record_db_query
 
 settings = get_settings()
 
+
+class PoolStats:
+    def __init__(self) -> None:
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+    
+    def record(self, wait_seconds: float) -> None:
+        self.acquisitions += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "acquisitions": self.acquisitions,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(
+                self.total_wait_seconds / self.acquisitions * 1000, 3
+            ) if self.acquisitions else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+        }
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            pool_stats.timeouts += 1
+            raise
+        finally:
+            pool_stats.record(time.perf_counter() - start)
+
+
+def _engine_options(database_url: str) -> Dict[str, Any]:
+    url = make_url(database_url)
+    options: Dict[str, Any] = {
+        "poolclass": InstrumentedPool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    
+    if url.get_backend_name() == "postgresql" and url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "server_settings": {
+                "statement_timeout": str(settings.db_statement_timeout_ms),
+            },
+        }
+    
+    return options
+
+
 engine: AsyncEngine = create_async_engine(
     settings.database_url,
     echo=False,
     future=True,
+    **_engine_options(settings.database_url),
 )
 
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    context._query_started_at = time.perf_counter()
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _record_query_time(conn, cursor, statement, parameters, context, executemany) -> None:
+    record_db_query(time.perf_counter() - context._query_started_at)
+
+
 async_session = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
@@ -21,8 +103,51 @@ async def get_session() -> AsyncSession:
         yield session
 
 
+def dialect_insert(session: AsyncSession):
+    if session.bind.dialect.name == "postgresql":
+        return pg_insert
+    return sqlite_insert
+
+
 async def init_db():
     async with engine.begin() as conn:
-        from app.models import wing, activity, photo
+        from app.models import (
+            wing,
+            activity,
+            photo,
+            activity_stat,
+            wing_version,
+            job,
+            reconciliation_checkpoint,
+        )
         
         await conn.run_sync(SQLModel.metadata.create_all)
+
+
+def get_pool_status() -> Dict[str, Any]:
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.db_max_overflow,
+        **pool_stats.to_dict(),
+    }
+
+
+db_pool_connections.set_function(lambda: {
+    ("checked_out",): engine.pool.checkedout(),
+    ("checked_in",): engine.pool.checkedin(),
+    ("overflow",): max(engine.pool.overflow(), 0),
+})
+
+
+async def check_db_health() -> Dict[str, Any]:
+    start = time.perf_counter()
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    return {
+        "latency_ms": round((time.perf_counter() - start) * 1000, 3),
+        "pool": get_pool_status(),
+    }
@@ -1,15 +1,32 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.config import get_settings
-from app.database import init_db
+from app.database import (
+    async_session,
+    check_db_health,
+    engine,
+    get_pool_status,
+    init_db,
+)
 from app.api import public, admin
+from app.compression import CompressionMiddleware
 from app.exceptions import AnvayaException
+from app.metrics import MetricsMiddleware, SharedMetrics, registry
+from app.migrations import MIGRATIONS, run_migrations
+from app.services.cache import InMemoryCache, apply_invalidation
+from app.services.image_ingest import shutdown_ingest_pool
+from app.services.invalidation import get_invalidation_bus
+from app.services.jobs import job_queue
+from app.services.snapshots import SnapshotService
+from app.services.statistics import StatisticsService
 
 settings = get_settings()
 
@@ -20,14 +37,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+shared_metrics = SharedMetrics(
+    registry, Path(settings.metrics_dir), settings.metrics_flush_seconds
+) if settings.metrics_dir else None
+
+
+async def prepare_database() -> None:
+    await init_db()
+    await run_migrations(engine, MIGRATIONS)
+    async with async_session() as session:
+        await StatisticsService.ensure_populated(session)
+    logger.info("Database initialized successfully")
+    if settings.snapshot_enabled:
+        async with async_session() as session:
+            await SnapshotService.schedule(session)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting Anvaya Club API...")
-    await init_db()
-    logger.info("Database initialized successfully")
+    if settings.startup_migrations:
+        await prepare_database()
+    invalidation_bus = get_invalidation_bus()
+    await invalidation_bus.start(apply_invalidation)
+    job_queue.start()
+    if shared_metrics:
+        await shared_metrics.start()
     yield
     logger.info("Shutting down Anvaya Club API...")
+    await job_queue.stop()
+    await invalidation_bus.stop()
+    if shared_metrics:
+        await shared_metrics.stop()
+    shutdown_ingest_pool()
 
 
 app = FastAPI(
@@ -49,6 +91,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    level=settings.compression_level,
+    brotli_quality=settings.compression_brotli_quality,
+    cache=InMemoryCache(max_entries=settings.compression_cache_entries),
+)
+
+app.add_middleware(MetricsMiddleware)
+
 
 @app.exception_handler(AnvayaException)
 async def anvaya_exception_handler(
@@ -100,6 +152,29 @@ async def health_check() -> dict:
     return {"status": "healthy"}
 
 
+@app.get("/health/db", tags=["Health"])
+async def database_health_check() -> JSONResponse:
+    try:
+        details = await check_db_health()
+    except Exception as e:
+        logger.error(f"Database health check failed: {e}")
+        return JSONResponse(
+            status_code=503,
+            content={"status": "unhealthy", "pool": get_pool_status()},
+        )
+    
+    return JSONResponse(content={"status": "healthy", **details})
+
+
+@app.get("/metrics", tags=["Health"], include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    body = await asyncio.to_thread(shared_metrics.render) if shared_metrics else registry.render()
+    return PlainTextResponse(
+        body,
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     
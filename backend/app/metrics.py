@@ -0,0 +1,347 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+LabelValues = Tuple[str, ...]
+
+logger = logging.getLogger(__name__)
+
+
+def _format_labels(names: Tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [
+        f'{name}="{value}"'
+        for name, value in zip(names, values)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    kind = "untyped"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+    
+    def collect(self) -> Dict[LabelValues, Any]:
+        raise NotImplementedError
+    
+    def merge(self, collected: Iterable[Dict[LabelValues, Any]]) -> Dict[LabelValues, Any]:
+        merged: Dict[LabelValues, Any] = {}
+        for values in collected:
+            for labels, value in values.items():
+                merged[labels] = merged.get(labels, 0) + value
+        return merged
+    
+    def samples(self, values: Dict[LabelValues, Any]) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in values.items()
+        ]
+    
+    def render(self, values: Optional[Dict[LabelValues, Any]] = None) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(self.collect() if values is None else values),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    kind = "counter"
+    
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+    
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+    
+    def collect(self) -> Dict[LabelValues, Any]:
+        return dict(self._values)
+
+
+class Gauge(Metric):
+    kind = "gauge"
+    
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+        self._callback: Optional[Callable[[], Dict[LabelValues, float]]] = None
+    
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+    
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+    
+    def set_function(self, callback: Callable[[], Dict[LabelValues, float]]) -> None:
+        self._callback = callback
+    
+    def collect(self) -> Dict[LabelValues, Any]:
+        return dict(self._callback() if self._callback else self._values)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelValues, List[float]] = {}
+    
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0.0] * (len(self.buckets) + 3)
+        
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+    
+    def collect(self) -> Dict[LabelValues, Any]:
+        return {labels: list(series) for labels, series in self._series.items()}
+    
+    def merge(self, collected: Iterable[Dict[LabelValues, Any]]) -> Dict[LabelValues, Any]:
+        merged: Dict[LabelValues, Any] = {}
+        for values in collected:
+            for labels, series in values.items():
+                total = merged.setdefault(labels, [0.0] * len(series))
+                merged[labels] = [a + b for a, b in zip(total, series)]
+        return merged
+    
+    def samples(self, values: Dict[LabelValues, Any]) -> List[str]:
+        lines: List[str] = []
+        for labels, series in values.items():
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                le = _format_labels(self.labelnames, labels, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {int(cumulative)}")
+            label_str = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{label_str} {int(series[-1])}")
+        return lines
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: List[Metric] = []
+    
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+    
+    def collect(self) -> Dict[str, List[Tuple[LabelValues, Any]]]:
+        return {metric.name: list(metric.collect().items()) for metric in self._metrics}
+    
+    def render(self, processes: Optional[List[Dict[str, Any]]] = None) -> str:
+        if processes is None:
+            return "\n".join(metric.render() for metric in self._metrics) + "\n"
+        
+        rendered = []
+        for metric in self._metrics:
+            collected = [
+                {tuple(labels): value for labels, value in process["metrics"].get(metric.name, [])}
+                for process in processes
+                if process["alive"] or metric.kind != "gauge"
+            ]
+            rendered.append(metric.render(metric.merge(collected)))
+        return "\n".join(rendered) + "\n"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SharedMetrics:
+    def __init__(self, registry: Registry, directory: Path, interval: float) -> None:
+        self.registry = registry
+        self.directory = directory
+        self.interval = interval
+        self.pid = os.getpid()
+        self.path = directory / f"{self.pid}.json"
+        self._task: Optional[asyncio.Task] = None
+    
+    def write(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(f".{self.path.name}.tmp")
+        temporary.write_text(json.dumps({"pid": self.pid, "metrics": self.registry.collect()}))
+        os.replace(temporary, self.path)
+    
+    def read_all(self) -> List[Dict[str, Any]]:
+        processes = []
+        for path in sorted(self.directory.glob("*.json")):
+            try:
+                process = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            process["alive"] = process["pid"] == self.pid or _pid_alive(process["pid"])
+            processes.append(process)
+        return processes
+    
+    def render(self) -> str:
+        self.write()
+        return self.registry.render(self.read_all())
+    
+    async def start(self) -> None:
+        await asyncio.to_thread(self.write)
+        self._task = asyncio.create_task(self._flush(), name="metrics-flush")
+    
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await asyncio.to_thread(self.write)
+    
+    async def _flush(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await asyncio.to_thread(self.write)
+            except OSError as e:
+                logger.warning(f"Failed to write metrics to {self.path}: {e}")
+
+
+registry = Registry()
+
+http_request_duration = registry.register(Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route, method and status.",
+    ("method", "route", "status"),
+))
+http_requests_in_flight = registry.register(Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being processed.",
+    ("method",),
+))
+http_request_db_queries = registry.register(Histogram(
+    "http_request_db_queries",
+    "Database queries issued per HTTP request.",
+    ("method", "route"),
+    buckets=DB_QUERY_COUNT_BUCKETS,
+))
+http_request_db_duration = registry.register(Histogram(
+    "http_request_db_duration_seconds",
+    "Total database time per HTTP request.",
+    ("method", "route"),
+))
+db_query_duration = registry.register(Histogram(
+    "db_query_duration_seconds",
+    "Latency of individual database statements.",
+))
+db_pool_connections = registry.register(Gauge(
+    "db_pool_connections",
+    "Database pool connections by state.",
+    ("state",),
+))
+cloudinary_request_duration = registry.register(Histogram(
+    "cloudinary_request_duration_seconds",
+    "Latency of Cloudinary API calls.",
+    ("operation", "outcome"),
+))
+jobs_processed = registry.register(Counter(
+    "jobs_processed_total",
+    "Background jobs processed by kind and outcome.",
+    ("kind", "outcome"),
+))
+job_duration = registry.register(Histogram(
+    "job_duration_seconds",
+    "Execution time of background jobs.",
+    ("kind",),
+))
+image_ingest_bytes = registry.register(Counter(
+    "image_ingest_bytes_total",
+    "Image bytes before and after upload normalization.",
+    ("stage",),
+))
+
+
+class RequestDBStats:
+    __slots__ = ("queries", "seconds")
+    
+    def __init__(self) -> None:
+        self.queries = 0
+        self.seconds = 0.0
+
+
+current_db_stats: ContextVar[Optional[RequestDBStats]] = ContextVar(
+    "current_db_stats", default=None
+)
+
+
+def record_db_query(seconds: float) -> None:
+    db_query_duration.observe(seconds)
+    stats = current_db_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.seconds += seconds
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope["method"]
+        status_code = 500
+        db_stats = RequestDBStats()
+        token = current_db_stats.set(db_stats)
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        http_requests_in_flight.inc(method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            http_requests_in_flight.dec(method)
+            current_db_stats.reset(token)
+            
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            http_request_duration.observe(elapsed, method, route_path, str(status_code))
+            http_request_db_queries.observe(db_stats.queries, method, route_path)
+            http_request_db_duration.observe(db_stats.seconds, method, route_path)
@@ -0,0 +1,18 @@
+from app.migrations import (
+    m0001_hot_query_indexes,
+    m0002_full_text_search,
+    m0003_activity_filter_indexes,
+    m0004_photo_metadata,
+    m0005_content_hashes,
+)
+from app.migrations.runner import get_applied_versions, run_migrations
+
+MIGRATIONS = [
+    m0001_hot_query_indexes,
+    m0002_full_text_search,
+    m0003_activity_filter_indexes,
+    m0004_photo_metadata,
+    m0005_content_hashes,
+]
+
+__all__ = ["MIGRATIONS", "get_applied_versions", "run_migrations"]
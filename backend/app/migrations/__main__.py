@@ -0,0 +1,48 @@
+import asyncio
+import sys
+
+from app.database import engine
+from app.migrations import MIGRATIONS, get_applied_versions, run_migrations
+from app.migrations.explain import find_sequential_scans
+
+
+async def upgrade() -> int:
+    applied = await run_migrations(engine, MIGRATIONS)
+    print(f"Applied {len(applied)} migration(s)")
+    return 0
+
+
+async def status() -> int:
+    applied = await get_applied_versions(engine)
+    for migration in MIGRATIONS:
+        state = "applied" if migration.VERSION in applied else "pending"
+        print(f"{migration.VERSION:04d}_{migration.NAME}: {state}")
+    return 0
+
+
+async def check() -> int:
+    violations = await find_sequential_scans(engine)
+    if not violations:
+        print("All hot queries use indexes")
+        return 0
+    
+    for name, scans in violations.items():
+        print(f"FAIL {name}: {'; '.join(scans)}")
+    return 1
+
+
+COMMANDS = {"upgrade": upgrade, "status": status, "check": check}
+
+
+async def main(command: str) -> int:
+    try:
+        return await COMMANDS[command]()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or sys.argv[1] not in COMMANDS:
+        print(f"Usage: python -m app.migrations [{'|'.join(COMMANDS)}]")
+        sys.exit(2)
+    sys.exit(asyncio.run(main(sys.argv[1])))
@@ -0,0 +1,110 @@
+import json
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.sql import Select
+
+from app.models.activity import Activity
+from app.models.photo import Photo
+
+logger = logging.getLogger(__name__)
+
+CHECKED_TABLES = {"activities", "photos"}
+
+
+def hot_queries() -> Dict[str, Select]:
+    activities_by_date = (Activity.activity_date.desc(), Activity.id.desc())
+    photos_by_upload = (Photo.uploaded_at.desc(), Photo.id.desc())
+    activity_cursor = tuple_(Activity.activity_date, Activity.id) < (date(2024, 1, 1), 1)
+    photo_cursor = tuple_(Photo.uploaded_at, Photo.id) < (datetime(2024, 1, 1), 1)
+    
+    return {
+        "wing_activities": (
+            select(Activity).where(Activity.wing_id == 1)
+            .order_by(*activities_by_date).limit(100)
+        ),
+        "wing_activities_after_cursor": (
+            select(Activity).where(Activity.wing_id == 1, activity_cursor)
+            .order_by(*activities_by_date).limit(100)
+        ),
+        "wing_photos": (
+            select(Photo).where(Photo.wing_id == 1)
+            .order_by(*photos_by_upload).limit(100)
+        ),
+        "wing_photos_after_cursor": (
+            select(Photo).where(Photo.wing_id == 1, photo_cursor)
+            .order_by(*photos_by_upload).limit(100)
+        ),
+        "all_activities": (
+            select(Activity).order_by(*activities_by_date).limit(100)
+        ),
+        "all_activities_after_cursor": (
+            select(Activity).where(activity_cursor)
+            .order_by(*activities_by_date).limit(100)
+        ),
+        "activities_in_year": (
+            select(Activity)
+            .where(Activity.activity_date >= date(2024, 1, 1), Activity.activity_date <= date(2024, 12, 31))
+            .order_by(*activities_by_date).limit(100)
+        ),
+        "activities_in_wings": (
+            select(Activity).where(Activity.wing_id.in_((1, 2)))
+            .order_by(*activities_by_date).limit(100)
+        ),
+        "activities_with_report": (
+            select(Activity).where(Activity.report_url.is_not(None))
+            .order_by(*activities_by_date).limit(100)
+        ),
+    }
+
+
+def _walk_postgres_plan(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from _walk_postgres_plan(child)
+
+
+async def find_sequential_scans(engine: AsyncEngine) -> Dict[str, List[str]]:
+    violations: Dict[str, List[str]] = {}
+    is_postgres = engine.dialect.name == "postgresql"
+    
+    async with engine.connect() as conn:
+        if is_postgres:
+            await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        
+        for name, stmt in hot_queries().items():
+            sql = str(stmt.compile(
+                dialect=engine.dialect,
+                compile_kwargs={"literal_binds": True},
+            ))
+            
+            if is_postgres:
+                result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+                plan = result.scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                scans = [
+                    f"Seq Scan on {node['Relation Name']}"
+                    for node in _walk_postgres_plan(plan[0]["Plan"])
+                    if node["Node Type"] == "Seq Scan"
+                    and node.get("Relation Name") in CHECKED_TABLES
+                ]
+            else:
+                result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")
+                scans = [
+                    row[-1] for row in result.all()
+                    if row[-1].startswith("SCAN ")
+                    and row[-1].split()[1] in CHECKED_TABLES
+                    and "USING" not in row[-1]
+                ]
+            
+            if scans:
+                violations[name] = scans
+                logger.warning(f"Hot query '{name}' falls back to a sequential scan: {scans}")
+        
+        await conn.rollback()
+    
+    return violations
@@ -0,0 +1,31 @@
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.migrations.runner import create_index_online, drop_index_online
+
+VERSION = 1
+NAME = "hot_query_indexes"
+
+
+async def upgrade(engine: AsyncEngine) -> None:
+    await create_index_online(
+        engine,
+        "ix_activities_wing_id_activity_date_desc_id",
+        "activities",
+        "wing_id, activity_date DESC, id DESC",
+    )
+    await create_index_online(
+        engine,
+        "ix_photos_wing_id_uploaded_at_desc_id",
+        "photos",
+        "wing_id, uploaded_at DESC, id DESC",
+    )
+    await create_index_online(
+        engine,
+        "ix_activities_activity_date_desc_id",
+        "activities",
+        "activity_date DESC, id DESC",
+    )
+    
+    await drop_index_online(engine, "ix_activities_wing_id_activity_date_id")
+    await drop_index_online(engine, "ix_photos_wing_id_uploaded_at_id")
+    await drop_index_online(engine, "ix_activities_activity_date_id")
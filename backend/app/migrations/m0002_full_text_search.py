@@ -0,0 +1,72 @@
+from typing import List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.migrations.runner import create_index_online
+
+VERSION = 2
+NAME = "full_text_search"
+
+POSTGRES_VECTORS = {
+    "activities": (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(faculty_coordinator, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+    ),
+    "wings": (
+        "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(about, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(vision, '') || ' ' || coalesce(mission, '')), 'C')"
+    ),
+}
+
+SQLITE_INDEXES = {
+    "activities": ("title", "description", "faculty_coordinator"),
+    "wings": ("name", "about", "vision", "mission"),
+}
+
+
+def _sqlite_statements(table: str, columns: Tuple[str, ...]) -> List[str]:
+    index = f"{table}_fts"
+    names = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    remove = (
+        f"INSERT INTO {index}({index}, rowid, {names}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    add = f"INSERT INTO {index}(rowid, {names}) VALUES (new.id, {new_values});"
+    
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5("
+        f"{names}, content='{table}', content_rowid='id', tokenize='porter unicode61')",
+        f"CREATE TRIGGER IF NOT EXISTS {index}_insert AFTER INSERT ON {table} BEGIN {add} END",
+        f"CREATE TRIGGER IF NOT EXISTS {index}_delete AFTER DELETE ON {table} BEGIN {remove} END",
+        f"CREATE TRIGGER IF NOT EXISTS {index}_update AFTER UPDATE OF {names} ON {table} "
+        f"BEGIN {remove} {add} END",
+        f"INSERT INTO {index}({index}) VALUES ('rebuild')",
+    ]
+
+
+async def upgrade(engine: AsyncEngine) -> None:
+    if engine.dialect.name != "postgresql":
+        async with engine.begin() as conn:
+            for table, columns in SQLITE_INDEXES.items():
+                for statement in _sqlite_statements(table, columns):
+                    await conn.execute(text(statement))
+        return
+    
+    for table, vector in POSTGRES_VECTORS.items():
+        async with engine.begin() as conn:
+            await conn.execute(text(
+                f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+                f"GENERATED ALWAYS AS ({vector}) STORED"
+            ))
+        await create_index_online(
+            engine,
+            f"ix_{table}_search_vector",
+            table,
+            "search_vector",
+            using="gin",
+        )
@@ -0,0 +1,16 @@
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.migrations.runner import create_index_online
+
+VERSION = 3
+NAME = "activity_filter_indexes"
+
+
+async def upgrade(engine: AsyncEngine) -> None:
+    await create_index_online(
+        engine,
+        "ix_activities_with_report_activity_date_desc_id",
+        "activities",
+        "activity_date DESC, id DESC",
+        where="report_url IS NOT NULL",
+    )
@@ -0,0 +1,13 @@
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.migrations.runner import add_column
+
+VERSION = 4
+NAME = "photo_metadata"
+
+
+async def upgrade(engine: AsyncEngine) -> None:
+    await add_column(engine, "photos", "width", "INTEGER")
+    await add_column(engine, "photos", "height", "INTEGER")
+    await add_column(engine, "photos", "size_bytes", "INTEGER")
+    await add_column(engine, "photos", "format", "VARCHAR(10)")
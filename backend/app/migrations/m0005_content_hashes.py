@@ -0,0 +1,13 @@
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.migrations.runner import add_column, create_index_online
+
+VERSION = 5
+NAME = "content_hashes"
+
+
+async def upgrade(engine: AsyncEngine) -> None:
+    await add_column(engine, "photos", "content_hash", "VARCHAR(64)")
+    await add_column(engine, "activities", "report_hash", "VARCHAR(64)")
+    await create_index_online(engine, "ix_photos_content_hash", "photos", "content_hash")
+    await create_index_online(engine, "ix_activities_report_hash", "activities", "report_hash")
@@ -0,0 +1,134 @@
+import logging
+from datetime import datetime
+from types import ModuleType
+from typing import List, Optional, Sequence, Set
+
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+MIGRATION_LOCK_ID = 734_201_001
+
+
+async def _ensure_migrations_table(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "version INTEGER PRIMARY KEY, "
+            "name VARCHAR(200) NOT NULL, "
+            "applied_at TIMESTAMP NOT NULL)"
+        ))
+
+
+async def get_applied_versions(engine: AsyncEngine) -> Set[int]:
+    await _ensure_migrations_table(engine)
+    async with engine.connect() as conn:
+        result = await conn.execute(text("SELECT version FROM schema_migrations"))
+        return {row[0] for row in result.all()}
+
+
+async def create_index_online(
+    engine: AsyncEngine,
+    name: str,
+    table: str,
+    columns: str,
+    using: Optional[str] = None,
+    where: Optional[str] = None
+) -> None:
+    target = f"{table} USING {using}" if using else table
+    predicate = f" WHERE {where}" if where else ""
+    
+    if engine.dialect.name != "postgresql":
+        async with engine.begin() as conn:
+            await conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {target} ({columns}){predicate}"))
+        return
+    
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        invalid = await conn.execute(
+            text(
+                "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE c.relname = :name AND NOT i.indisvalid"
+            ),
+            {"name": name},
+        )
+        if invalid.first() is not None:
+            logger.warning(f"Dropping invalid index {name} left by an interrupted build")
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+        
+        await conn.execute(text(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {target} ({columns}){predicate}"
+        ))
+
+
+async def add_column(
+    engine: AsyncEngine,
+    table: str,
+    column: str,
+    definition: str
+) -> None:
+    async with engine.begin() as conn:
+        existing = await conn.run_sync(
+            lambda sync_conn: {info["name"] for info in inspect(sync_conn).get_columns(table)}
+        )
+        if column not in existing:
+            await conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {definition}"))
+
+
+async def drop_index_online(engine: AsyncEngine, name: str) -> None:
+    if engine.dialect.name != "postgresql":
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        return
+    
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+
+
+async def run_migrations(
+    engine: AsyncEngine,
+    migrations: Sequence[ModuleType]
+) -> List[int]:
+    applied_now: List[int] = []
+    
+    async with engine.connect() as lock_conn:
+        if engine.dialect.name == "postgresql":
+            lock_conn = await lock_conn.execution_options(isolation_level="AUTOCOMMIT")
+            await lock_conn.execute(
+                text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID}
+            )
+        
+        try:
+            applied = await get_applied_versions(engine)
+            
+            for migration in sorted(migrations, key=lambda m: m.VERSION):
+                if migration.VERSION in applied:
+                    continue
+                
+                logger.info(f"Applying migration {migration.VERSION:04d}_{migration.NAME}")
+                await migration.upgrade(engine)
+                
+                async with engine.begin() as conn:
+                    await conn.execute(
+                        text(
+                            "INSERT INTO schema_migrations (version, name, applied_at) "
+                            "VALUES (:version, :name, :applied_at)"
+                        ),
+                        {
+                            "version": migration.VERSION,
+                            "name": migration.NAME,
+                            "applied_at": datetime.utcnow(),
+                        },
+                    )
+                applied_now.append(migration.VERSION)
+        finally:
+            if engine.dialect.name == "postgresql":
+                await lock_conn.execute(
+                    text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID}
+                )
+    
+    if applied_now:
+        logger.info(f"Applied {len(applied_now)} migration(s)")
+    return applied_now
@@ -1,5 +1,17 @@
 from app.models.wing import Wing
 from app.models.activity import Activity
 from app.models.photo import Photo
+from app.models.activity_stat import ActivityStat
+from app.models.wing_version import WingVersion
+from app.models.job import Job
+from app.models.reconciliation_checkpoint import ReconciliationCheckpoint
 
-__all__ = ["Wing", "Activity", "Photo"]
+__all__ = [
+    "Wing",
+    "Activity",
+    "Photo",
+    "ActivityStat",
+    "WingVersion",
+    "Job",
+    "ReconciliationCheckpoint",
+]
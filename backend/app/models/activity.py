@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime, date
@@ -17,6 +18,7 @@ class Activity(SQLModel, table=True):
     faculty_coordinator: Optional[str] = Field(default=None, max_length=200)
     report_url: Optional[str] = None
     report_cloudinary_id: Optional[str] = None
+    report_hash: Optional[str] = Field(default=None, max_length=64, index=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     
     wing: Optional["Wing"] = Relationship(back_populates="activities")
@@ -31,3 +33,23 @@ class Activity(SQLModel, table=True):
                 "report_url": "https://res.cloudinary.com/.../report.pdf"
             }
         }
+
+
+Index(
+    "ix_activities_wing_id_activity_date_desc_id",
+    Activity.wing_id,
+    Activity.activity_date.desc(),
+    Activity.id.desc(),
+)
+Index(
+    "ix_activities_activity_date_desc_id",
+    Activity.activity_date.desc(),
+    Activity.id.desc(),
+)
+Index(
+    "ix_activities_with_report_activity_date_desc_id",
+    Activity.activity_date.desc(),
+    Activity.id.desc(),
+    postgresql_where=Activity.report_url.is_not(None),
+    sqlite_where=Activity.report_url.is_not(None),
+)
@@ -0,0 +1,18 @@
+from sqlmodel import SQLModel, Field
+
+
+class ActivityStat(SQLModel, table=True):
+    __tablename__ = "activity_stats"
+    
+    wing_id: int = Field(foreign_key="wings.id", primary_key=True)
+    year: int = Field(primary_key=True, index=True)
+    activity_count: int = Field(default=0)
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "wing_id": 1,
+                "year": 2024,
+                "activity_count": 12
+            }
+        }
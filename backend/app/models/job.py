@@ -0,0 +1,33 @@
+from sqlalchemy import JSON, Column, Index
+from sqlmodel import SQLModel, Field
+from typing import Any, Dict, Optional
+from datetime import datetime
+
+
+class Job(SQLModel, table=True):
+    __tablename__ = "jobs"
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    kind: str = Field(max_length=50)
+    payload: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON, nullable=False))
+    status: str = Field(default="pending", max_length=20)
+    attempts: int = Field(default=0)
+    max_attempts: int = Field(default=5)
+    run_at: datetime = Field(default_factory=datetime.utcnow)
+    locked_at: Optional[datetime] = Field(default=None)
+    last_error: Optional[str] = Field(default=None)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "kind": "delete_media",
+                "payload": {"public_id": "anvaya/codezero/photo123", "resource_type": "image"},
+                "status": "pending",
+                "attempts": 0
+            }
+        }
+
+
+Index("ix_jobs_status_run_at", Job.status, Job.run_at)
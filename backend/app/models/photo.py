@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime
@@ -13,6 +14,11 @@ class Photo(SQLModel, table=True):
     wing_id: int = Field(foreign_key="wings.id", index=True)
     url: str
     cloudinary_id: str
+    width: Optional[int] = None
+    height: Optional[int] = None
+    size_bytes: Optional[int] = None
+    format: Optional[str] = Field(default=None, max_length=10)
+    content_hash: Optional[str] = Field(default=None, max_length=64, index=True)
     uploaded_at: datetime = Field(default_factory=datetime.utcnow)
     
     wing: Optional["Wing"] = Relationship(back_populates="photos")
@@ -25,3 +31,11 @@ class Photo(SQLModel, table=True):
                 "cloudinary_id": "anvaya/codezero/photo123"
             }
         }
+
+
+Index(
+    "ix_photos_wing_id_uploaded_at_desc_id",
+    Photo.wing_id,
+    Photo.uploaded_at.desc(),
+    Photo.id.desc(),
+)
@@ -0,0 +1,24 @@
+from sqlalchemy import JSON, Column
+from sqlmodel import SQLModel, Field
+from typing import Any, Dict, Optional
+from datetime import datetime
+
+
+class ReconciliationCheckpoint(SQLModel, table=True):
+    __tablename__ = "reconciliation_checkpoints"
+    
+    scope: str = Field(primary_key=True, max_length=200)
+    cursor: Optional[str] = Field(default=None)
+    stats: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON, nullable=False))
+    pass_started_at: datetime = Field(default_factory=datetime.utcnow)
+    completed_at: Optional[datetime] = Field(default=None)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "scope": "remote:codezero:image",
+                "cursor": "8edbc5b0a1c4e1c4a9a2f1b0",
+                "stats": {"scanned": 500, "orphaned": 3, "deleted": 3}
+            }
+        }
@@ -0,0 +1,19 @@
+from sqlmodel import SQLModel, Field
+from datetime import datetime
+
+
+class WingVersion(SQLModel, table=True):
+    __tablename__ = "wing_versions"
+    
+    wing_id: int = Field(foreign_key="wings.id", primary_key=True)
+    version: int = Field(default=0)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "wing_id": 1,
+                "version": 42,
+                "updated_at": "2024-01-15T10:30:00"
+            }
+        }
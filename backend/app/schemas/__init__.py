@@ -1,7 +1,29 @@
 from app.schemas.wing import WingResponse, WingWithRelations
-from app.schemas.activity import ActivityCreate, ActivityUpdate, ActivityResponse
-from app.schemas.photo import PhotoCreate, PhotoResponse
+from app.schemas.activity import (
+    ActivityCreate,
+    ActivityUpdate,
+    ActivityResponse,
+    ActivityPage,
+    ActivityImportError,
+    ActivityImportResponse,
+)
+from app.schemas.photo import (
+    PhotoCreate,
+    PhotoDerivatives,
+    PhotoResponse,
+    PhotoPage,
+    PhotoUploadFailure,
+    PhotoUploadResponse,
+    PhotoUploadSignature,
+    DirectUpload,
+    DirectUploadConfirmation,
+    PhotoHashLookup,
+    PhotoHashLookupResponse,
+    PhotoBulkDelete,
+)
 from app.schemas.auth import LoginRequest, TokenResponse
+from app.schemas.search import ActivitySearchHit, WingSearchHit, SearchResponse
+from app.schemas.job import JobResponse, JobQueueStatus, ReconciliationScopeResponse
 
 __all__ = [
     "WingResponse",
@@ -9,8 +31,27 @@ __all__ = [
     "ActivityCreate",
     "ActivityUpdate",
     "ActivityResponse",
+    "ActivityPage",
+    "ActivityImportError",
+    "ActivityImportResponse",
     "PhotoCreate",
+    "PhotoDerivatives",
     "PhotoResponse",
+    "PhotoPage",
+    "PhotoUploadFailure",
+    "PhotoUploadResponse",
+    "PhotoUploadSignature",
+    "DirectUpload",
+    "DirectUploadConfirmation",
+    "PhotoHashLookup",
+    "PhotoHashLookupResponse",
+    "PhotoBulkDelete",
     "LoginRequest",
     "TokenResponse",
+    "ActivitySearchHit",
+    "WingSearchHit",
+    "SearchResponse",
+    "JobResponse",
+    "JobQueueStatus",
+    "ReconciliationScopeResponse",
 ]
@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime, date
-from typing import Optional
+from typing import List, Optional
 
 
 class ActivityBase(BaseModel):
@@ -12,6 +12,12 @@ class ActivityBase(BaseModel):
 
 class ActivityCreate(ActivityBase):
     wing_id: int
+    title: str = Field(..., min_length=1, max_length=200)
+    description: str = Field(..., min_length=1)
+    faculty_coordinator: Optional[str] = Field(None, max_length=200)
+    
+    class Config:
+        str_strip_whitespace = True
 
 
 class ActivityUpdate(BaseModel):
@@ -30,3 +36,22 @@ class ActivityResponse(ActivityBase):
     
     class Config:
         from_attributes = True
+
+
+class ActivityPage(BaseModel):
+    items: List[ActivityResponse] = []
+    next_cursor: Optional[str] = None
+
+
+class ActivityImportError(BaseModel):
+    row: int
+    error: str
+
+
+class ActivityImportResponse(BaseModel):
+    rows: int = 0
+    imported: int = 0
+    failed: int = 0
+    dry_run: bool = False
+    errors: List[ActivityImportError] = []
+    errors_truncated: bool = False
@@ -0,0 +1,40 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+class JobResponse(BaseModel):
+    id: int
+    kind: str
+    payload: Dict[str, Any] = {}
+    status: str
+    attempts: int
+    max_attempts: int
+    run_at: datetime
+    last_error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class JobQueueStatus(BaseModel):
+    worker_pid: int
+    workers: int
+    running: bool
+    counts: Dict[str, int] = {}
+    oldest_pending_at: Optional[datetime] = None
+    jobs: List[JobResponse] = []
+
+
+class ReconciliationScopeResponse(BaseModel):
+    scope: str
+    cursor: Optional[str] = None
+    stats: Dict[str, Any] = {}
+    pass_started_at: datetime
+    completed_at: Optional[datetime] = None
+    updated_at: datetime
+    
+    class Config:
+        from_attributes = True
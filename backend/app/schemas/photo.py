@@ -1,18 +1,91 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, computed_field
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
+
+from app.services.image_derivatives import photo_derivatives
 
 
 class PhotoCreate(BaseModel):
     wing_id: int
 
 
+class PhotoDerivatives(BaseModel):
+    thumbnail: str
+    medium: str
+    full: str
+    srcset: Dict[str, str] = {}
+
+
 class PhotoResponse(BaseModel):
     id: int
     wing_id: int
     url: str
     cloudinary_id: str
+    width: Optional[int] = None
+    height: Optional[int] = None
+    size_bytes: Optional[int] = None
+    format: Optional[str] = None
+    content_hash: Optional[str] = None
     uploaded_at: Optional[datetime] = None
     
+    @computed_field
+    @property
+    def derivatives(self) -> PhotoDerivatives:
+        return PhotoDerivatives(**photo_derivatives(self.cloudinary_id, self.width, self.format))
+    
     class Config:
         from_attributes = True
+
+
+class PhotoPage(BaseModel):
+    items: List[PhotoResponse] = []
+    next_cursor: Optional[str] = None
+
+
+class PhotoUploadFailure(BaseModel):
+    filename: str
+    error: str
+
+
+class PhotoUploadResponse(BaseModel):
+    photos: List[PhotoResponse] = []
+    failed: List[PhotoUploadFailure] = []
+    duplicates: List[PhotoResponse] = []
+    bytes_saved: int = 0
+
+
+class PhotoUploadSignature(BaseModel):
+    upload_url: str
+    cloud_name: str
+    api_key: str
+    folder: str
+    timestamp: int
+    allowed_formats: str
+    transformation: str
+    signature: str
+    expires_at: int
+
+
+class DirectUpload(BaseModel):
+    public_id: str
+    version: int
+    signature: str
+    original_filename: Optional[str] = None
+
+
+class DirectUploadConfirmation(BaseModel):
+    wing_id: int
+    uploads: List[DirectUpload] = Field(..., min_length=1, max_length=200)
+
+
+class PhotoHashLookup(BaseModel):
+    wing_id: int
+    content_hashes: List[str] = Field(..., min_length=1, max_length=200)
+
+
+class PhotoHashLookupResponse(BaseModel):
+    existing: Dict[str, PhotoResponse] = {}
+
+
+class PhotoBulkDelete(BaseModel):
+    photo_ids: List[int] = Field(..., min_length=1, max_length=1000)
@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+from app.schemas.activity import ActivityResponse
+
+
+class ActivitySearchHit(ActivityResponse):
+    rank: float
+
+
+class WingSearchHit(BaseModel):
+    id: int
+    name: str
+    slug: str
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    query: str
+    wings: List[WingSearchHit] = []
+    activities: List[ActivitySearchHit] = []
+    next_cursor: Optional[str] = None
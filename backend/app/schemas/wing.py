@@ -22,6 +22,10 @@ class WingResponse(WingBase):
 class WingWithRelations(WingResponse):
     activities: List[ActivityResponse] = []
     photos: List[PhotoResponse] = []
+    activity_count: int = 0
+    photo_count: int = 0
+    activities_next_cursor: Optional[str] = None
+    photos_next_cursor: Optional[str] = None
     
     class Config:
         from_attributes = True
@@ -0,0 +1,70 @@
+import asyncio
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+import uvicorn
+
+from app.config import get_settings
+from app.database import engine
+from app.main import prepare_database
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def worker_count() -> int:
+    if settings.web_workers:
+        return settings.web_workers
+    return max(1, min(available_cpus(), settings.web_workers_max))
+
+
+async def prepare() -> None:
+    try:
+        await prepare_database()
+    finally:
+        await engine.dispose()
+
+
+def prepare_metrics_dir(workers: int) -> None:
+    directory = settings.metrics_dir
+    if not directory:
+        if workers <= 1:
+            return
+        directory = os.path.join(tempfile.gettempdir(), f"anvaya-metrics-{settings.port}")
+    
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    for stale in Path(directory).glob("*.json"):
+        stale.unlink(missing_ok=True)
+    os.environ["METRICS_DIR"] = directory
+
+
+def main() -> None:
+    workers = worker_count()
+    if settings.startup_migrations:
+        asyncio.run(prepare())
+        os.environ["STARTUP_MIGRATIONS"] = "false"
+    prepare_metrics_dir(workers)
+    
+    logger.info(f"Starting {workers} API workers on port {settings.port}")
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=settings.port,
+        workers=workers,
+        proxy_headers=True,
+        forwarded_allow_ips="*",
+        timeout_graceful_shutdown=30,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+import codecs
+import csv
+import json
+import logging
+import re
+from collections import Counter
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
+
+from pydantic import ValidationError as SchemaValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.config import get_settings
+from app.exceptions import ValidationError
+from app.models.activity import Activity
+from app.schemas.activity import ActivityCreate, ActivityImportError, ActivityImportResponse
+from app.services.crud import CRUDService
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = {".csv": "csv", ".json": "json", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+READ_CHUNK_SIZE = 64 * 1024
+MAX_REPORTED_ERRORS = 200
+
+_WHITESPACE = re.compile(r"\s*")
+
+
+class RowError(Exception):
+    pass
+
+
+def detect_format(filename: Optional[str]) -> str:
+    if not filename:
+        raise ValidationError("File must have a filename", field="file")
+    
+    ext = "." + filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    if ext not in IMPORT_FORMATS:
+        raise ValidationError(
+            f"Unsupported import format. Allowed: {', '.join(IMPORT_FORMATS)}",
+            field="file",
+        )
+    return IMPORT_FORMATS[ext]
+
+
+def _read_text(stream: BinaryIO) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    while True:
+        chunk = stream.read(READ_CHUNK_SIZE)
+        text = decoder.decode(chunk, final=not chunk)
+        if text:
+            yield text
+        if not chunk:
+            return
+
+
+def _read_lines(stream: BinaryIO) -> Iterator[str]:
+    pending = ""
+    for text in _read_text(stream):
+        pending += text
+        start = 0
+        end = pending.find("\n")
+        while end != -1:
+            yield pending[start:end + 1]
+            start = end + 1
+            end = pending.find("\n", start)
+        pending = pending[start:]
+    if pending:
+        yield pending
+
+
+def iter_csv_rows(stream: BinaryIO) -> Iterator[Tuple[int, Any]]:
+    try:
+        reader = csv.DictReader(_read_lines(stream))
+        for row in reader:
+            if None in row:
+                yield reader.line_num, RowError("Row has more fields than the header")
+                continue
+            yield reader.line_num, row
+    except csv.Error as e:
+        raise ValidationError(f"Malformed CSV: {e}", field="file")
+
+
+def iter_ndjson_rows(stream: BinaryIO) -> Iterator[Tuple[int, Any]]:
+    for line_number, line in enumerate(_read_lines(stream), start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, RowError(f"Invalid JSON: {e.msg}")
+
+
+def iter_json_rows(stream: BinaryIO) -> Iterator[Tuple[int, Any]]:
+    decoder = json.JSONDecoder()
+    chunks = _read_text(stream)
+    buffer, position, index = "", 0, 0
+    
+    def more() -> bool:
+        nonlocal buffer, position
+        chunk = next(chunks, None)
+        if chunk is None:
+            return False
+        buffer = buffer[position:] + chunk
+        position = 0
+        return True
+    
+    def peek() -> str:
+        nonlocal position
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position < len(buffer):
+                return buffer[position]
+            if not more():
+                return ""
+    
+    if peek() != "[":
+        raise ValidationError("JSON imports must be an array of activity objects", field="file")
+    position += 1
+    
+    if peek() == "]":
+        position += 1
+    else:
+        while True:
+            peek()
+            while True:
+                try:
+                    value, position = decoder.raw_decode(buffer, position)
+                    break
+                except json.JSONDecodeError as e:
+                    if not more():
+                        raise ValidationError(f"Invalid JSON in item {index + 1}: {e.msg}", field="file")
+            
+            index += 1
+            yield index, value
+            
+            separator = peek()
+            position += 1
+            if separator == "]":
+                break
+            if separator != ",":
+                raise ValidationError(f"Expected ',' or ']' after item {index}", field="file")
+    
+    if peek():
+        raise ValidationError("Unexpected data after the JSON array", field="file")
+
+
+ROW_READERS = {"csv": iter_csv_rows, "json": iter_json_rows, "ndjson": iter_ndjson_rows}
+
+
+def _blank(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def build_activity_row(
+    raw: Any,
+    wing_ids: Dict[str, int],
+    known_ids: Set[int]
+) -> Dict[str, Any]:
+    if isinstance(raw, RowError):
+        raise raw
+    if not isinstance(raw, dict):
+        raise RowError("Row must be an object")
+    
+    slug = raw.get("wing", raw.get("wing_slug"))
+    if not _blank(slug):
+        wing_id = wing_ids.get(str(slug).strip())
+        if wing_id is None:
+            raise RowError(f"Unknown wing '{slug}'")
+    elif not _blank(raw.get("wing_id")):
+        try:
+            wing_id = int(raw["wing_id"])
+        except (TypeError, ValueError):
+            raise RowError(f"Invalid wing_id '{raw['wing_id']}'")
+        if wing_id not in known_ids:
+            raise RowError(f"Unknown wing id {wing_id}")
+    else:
+        raise RowError("Missing wing (provide 'wing' slug or 'wing_id')")
+    
+    try:
+        activity = ActivityCreate.model_validate({
+            "wing_id": wing_id,
+            "title": raw.get("title"),
+            "description": raw.get("description"),
+            "activity_date": raw.get("activity_date"),
+            "faculty_coordinator": None if _blank(raw.get("faculty_coordinator")) else raw["faculty_coordinator"],
+        })
+    except SchemaValidationError as e:
+        raise RowError("; ".join(
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+            for error in e.errors()
+        ))
+    
+    return Activity(**activity.model_dump()).model_dump(exclude={"id"})
+
+
+class ActivityImportService:
+    @staticmethod
+    def _valid_rows(
+        rows: Iterator[Tuple[int, Any]],
+        wing_ids: Dict[str, int],
+        report: ActivityImportResponse
+    ) -> Iterator[Dict[str, Any]]:
+        known_ids = set(wing_ids.values())
+        for row_number, raw in rows:
+            report.rows += 1
+            try:
+                yield build_activity_row(raw, wing_ids, known_ids)
+            except RowError as e:
+                report.failed += 1
+                if len(report.errors) < MAX_REPORTED_ERRORS:
+                    report.errors.append(ActivityImportError(row=row_number, error=str(e)))
+                else:
+                    report.errors_truncated = True
+    
+    @staticmethod
+    async def import_file(
+        session: AsyncSession,
+        stream: BinaryIO,
+        filename: Optional[str],
+        skip_invalid: bool = False,
+        dry_run: bool = False,
+        batch_size: Optional[int] = None
+    ) -> Tuple[ActivityImportResponse, Set[str]]:
+        reader = ROW_READERS[detect_format(filename)]
+        wing_ids = await CRUDService.get_wing_slug_map(session)
+        report = ActivityImportResponse(dry_run=dry_run)
+        rows = ActivityImportService._valid_rows(reader(stream), wing_ids, report)
+        size = batch_size or settings.db_bulk_batch_size
+        
+        def next_batch() -> List[Dict[str, Any]]:
+            try:
+                return list(islice(rows, size))
+            except UnicodeDecodeError:
+                raise ValidationError("Import files must be UTF-8 encoded", field="file")
+        
+        year_counts: Counter = Counter()
+        inserted = 0
+        try:
+            while True:
+                batch = await run_in_threadpool(next_batch)
+                if not batch:
+                    break
+                if dry_run or (report.failed and not skip_invalid):
+                    continue
+                
+                await CRUDService.insert_activity_rows(session, batch)
+                year_counts.update((row["wing_id"], row["activity_date"].year) for row in batch)
+                inserted += len(batch)
+            
+            if dry_run or not inserted or (report.failed and not skip_invalid):
+                await session.rollback()
+                return report, set()
+            
+            await CRUDService.apply_activity_counts(session, year_counts)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        
+        report.imported = inserted
+        affected = {wing_id for wing_id, _ in year_counts}
+        slugs = {slug for slug, wing_id in wing_ids.items() if wing_id in affected}
+        logger.info(f"Imported {inserted} activities from '{filename}' ({report.failed} rows skipped)")
+        return report, slugs
@@ -0,0 +1,166 @@
+import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.config import get_settings
+from app.services.invalidation import get_invalidation_bus
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+WINGS_LIST_KEY = "wings:list"
+
+
+class CacheBackend:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+    
+    async def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+    
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        raise NotImplementedError
+    
+    async def delete_prefix(self, prefix: str) -> int:
+        raise NotImplementedError
+    
+    async def clear(self) -> None:
+        raise NotImplementedError
+    
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[Any]]],
+        ttl: Optional[int] = None
+    ) -> Optional[Any]:
+        cached = await self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        
+        self.misses += 1
+        value = await loader()
+        if value is not None:
+            await self.set(key, value, ttl or settings.cache_ttl_seconds)
+        return value
+    
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "backend": self.__class__.__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+class InMemoryCache(CacheBackend):
+    def __init__(self, max_entries: int = 1024) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    async def delete_prefix(self, prefix: str) -> int:
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+    
+    async def clear(self) -> None:
+        self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **super().stats(),
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+        }
+
+
+class RedisCache(CacheBackend):
+    def __init__(self, client: Any, namespace: str = "anvaya:cache:") -> None:
+        super().__init__()
+        self.client = client
+        self.namespace = namespace
+    
+    async def get(self, key: str) -> Optional[Any]:
+        return await self.client.get(self.namespace + key)
+    
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        await self.client.set(self.namespace + key, value, ex=ttl)
+    
+    async def delete_prefix(self, prefix: str) -> int:
+        keys = [
+            key async for key in self.client.scan_iter(match=f"{self.namespace}{prefix}*")
+        ]
+        if keys:
+            await self.client.delete(*keys)
+        return len(keys)
+    
+    async def clear(self) -> None:
+        await self.delete_prefix("")
+
+
+@lru_cache()
+def get_cache() -> CacheBackend:
+    if settings.cache_backend == "redis":
+        import redis.asyncio as redis
+        
+        client = redis.from_url(settings.cache_url)
+        logger.info("Using Redis cache backend")
+        return RedisCache(client)
+    
+    return InMemoryCache(max_entries=settings.cache_max_entries)
+
+
+def wing_key(slug: str, view: str) -> str:
+    return f"wing:{slug}:{view}"
+
+
+def wings_list_key(version: str) -> str:
+    return f"{WINGS_LIST_KEY}:{version}"
+
+
+async def invalidate_wing(cache: CacheBackend, slug: str) -> None:
+    removed = await cache.delete_prefix(wing_key(slug, ""))
+    logger.debug(f"Invalidated {removed} cache entries for wing '{slug}'")
+    
+    try:
+        await get_invalidation_bus().publish({"scope": "wing", "slug": slug})
+    except Exception as e:
+        logger.warning(f"Failed to publish invalidation for wing '{slug}': {e}")
+
+
+async def apply_invalidation(event: Dict[str, Any]) -> None:
+    cache = get_cache()
+    if event.get("scope") == "wing" and event.get("slug"):
+        removed = await cache.delete_prefix(wing_key(event["slug"], ""))
+        logger.debug(f"Invalidated {removed} cache entries for wing '{event['slug']}' from {event.get('origin')}")
+    else:
+        await cache.clear()
@@ -1,11 +1,19 @@
+import asyncio
 import logging
-from typing import Dict, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
 
 import cloudinary
+import cloudinary.api
 import cloudinary.uploader
+import cloudinary.utils
 from fastapi import UploadFile
 
 from app.config import get_settings
+from app.exceptions import ExternalServiceError
+from app.metrics import cloudinary_request_duration
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -16,39 +24,105 @@ cloudinary.config(
     api_secret=settings.cloudinary_api_secret,
 )
 
+if settings.cloudinary_upload_prefix:
+    cloudinary.config(upload_prefix=settings.cloudinary_upload_prefix)
+
+SIGNED_UPLOAD_TTL_SECONDS = 3600
+RESOURCES_PAGE_SIZE = 100
+
+_upload_executor = ThreadPoolExecutor(
+    max_workers=settings.cloudinary_upload_concurrency,
+    thread_name_prefix="cloudinary-upload",
+)
+
+
+async def call_api(
+    operation: str,
+    func: Callable[..., Dict[str, Any]],
+    *args: Any,
+    **kwargs: Any
+) -> Dict[str, Any]:
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        result = await loop.run_in_executor(
+            _upload_executor,
+            partial(func, *args, **kwargs),
+        )
+        outcome = "ok"
+        return result
+    finally:
+        cloudinary_request_duration.observe(
+            time.perf_counter() - start, operation, outcome
+        )
+
+
+async def _run_upload(
+    operation: str,
+    file_obj: Any,
+    **options: Any
+) -> Dict[str, Any]:
+    return await call_api(operation, cloudinary.uploader.upload, file_obj, **options)
+
+
+def image_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "url": result.get("secure_url", ""),
+        "public_id": result.get("public_id", ""),
+        "width": result.get("width"),
+        "height": result.get("height"),
+        "size_bytes": result.get("bytes"),
+        "format": result.get("format"),
+    }
+
 
 async def upload_image(
     file: UploadFile,
     folder: str = "anvaya"
-) -> Dict[str, str]:
+) -> Dict[str, Any]:
     await file.seek(0)
     
     logger.debug(f"Uploading image to folder: {folder}")
     
-    result = cloudinary.uploader.upload(
+    result = await _run_upload(
+        "upload_image",
         file.file,
         folder=folder,
         resource_type="image",
     )
     
-    return {
-        "url": result.get("secure_url", ""),
-        "public_id": result.get("public_id", ""),
-    }
+    return image_result(result)
 
 
 async def upload_images_bulk(
     files: List[UploadFile],
-    folder: str = "anvaya"
-) -> List[Dict[str, str]]:
-    results: List[Dict[str, str]] = []
+    folder: str = "anvaya",
+    max_concurrency: Optional[int] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    semaphore = asyncio.Semaphore(
+        max_concurrency or settings.cloudinary_upload_concurrency
+    )
+    
+    async def _upload_one(index: int, file: UploadFile) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                result = await upload_image(file, folder)
+                return {"index": index, "filename": file.filename or "", **result}
+            except Exception as e:
+                logger.warning(f"Failed to upload image {file.filename}: {e}")
+                return {"index": index, "filename": file.filename or "", "error": str(e)}
     
-    for file in files:
-        result = await upload_image(file, folder)
-        results.append(result)
+    outcomes = await asyncio.gather(*(_upload_one(index, file) for index, file in enumerate(files)))
     
-    logger.info(f"Uploaded {len(results)} images to {folder}")
-    return results
+    uploaded = [outcome for outcome in outcomes if "error" not in outcome]
+    failed = [outcome for outcome in outcomes if "error" in outcome]
+    
+    logger.info(
+        f"Uploaded {len(uploaded)}/{len(files)} images to {folder}"
+        + (f" ({len(failed)} failed)" if failed else "")
+    )
+    return {"uploaded": uploaded, "failed": failed}
 
 
 async def upload_pdf(
@@ -59,7 +133,8 @@ async def upload_pdf(
     
     logger.debug(f"Uploading PDF to folder: {folder}")
     
-    result = cloudinary.uploader.upload(
+    result = await _run_upload(
+        "upload_pdf",
         file.file,
         folder=folder,
         resource_type="auto",
@@ -71,23 +146,114 @@ async def upload_pdf(
     }
 
 
-def delete_media(
+async def upload_image_file(
+    path: str,
+    folder: str,
+    public_id: str
+) -> Dict[str, Any]:
+    logger.debug(f"Uploading spooled image {path} to folder: {folder}")
+    
+    result = await _run_upload(
+        "upload_image",
+        path,
+        folder=folder,
+        public_id=public_id,
+        overwrite=True,
+        resource_type="image",
+    )
+    
+    return image_result(result)
+
+
+async def delete_media(
     public_id: str,
     resource_type: str = "image"
+) -> None:
+    result = await call_api(
+        "destroy",
+        cloudinary.uploader.destroy,
+        public_id,
+        resource_type=resource_type,
+    )
+    if result.get("result") not in ("ok", "not found"):
+        raise ExternalServiceError(
+            "Cloudinary",
+            f"Failed to delete media {public_id}",
+            result=result.get("result"),
+        )
+    logger.debug(f"Deleted media: {public_id} ({result.get('result')})")
+
+
+async def delete_media_bulk(
+    public_ids: List[str],
+    resource_type: str = "image"
+) -> None:
+    result = await call_api(
+        "delete_resources",
+        cloudinary.api.delete_resources,
+        public_ids,
+        resource_type=resource_type,
+    )
+    outcomes = result.get("deleted", {})
+    failed = [
+        public_id for public_id in public_ids
+        if outcomes.get(public_id) not in ("deleted", "not_found")
+    ]
+    if failed:
+        raise ExternalServiceError(
+            "Cloudinary",
+            f"Failed to delete {len(failed)} of {len(public_ids)} media assets",
+            failed=failed,
+        )
+    logger.debug(f"Deleted {len(public_ids)} media assets in bulk")
+
+
+def incoming_transformation() -> str:
+    edge = settings.image_max_edge
+    return f"c_limit,w_{edge},h_{edge},q_{settings.image_quality}"
+
+
+def sign_upload(
+    folder: str,
+    allowed_formats: List[str]
+) -> Dict[str, Any]:
+    timestamp = int(time.time())
+    params = {
+        "folder": folder,
+        "timestamp": timestamp,
+        "allowed_formats": ",".join(allowed_formats),
+        "transformation": incoming_transformation(),
+    }
+    signature = cloudinary.utils.api_sign_request(params, settings.cloudinary_api_secret)
+    upload_prefix = settings.cloudinary_upload_prefix or "https://api.cloudinary.com"
+    
+    return {
+        **params,
+        "upload_url": f"{upload_prefix}/v1_1/{settings.cloudinary_cloud_name}/image/upload",
+        "cloud_name": settings.cloudinary_cloud_name,
+        "api_key": settings.cloudinary_api_key,
+        "signature": signature,
+        "expires_at": timestamp + SIGNED_UPLOAD_TTL_SECONDS,
+    }
+
+
+def verify_upload(
+    public_id: str,
+    version: int,
+    signature: str
 ) -> bool:
-    try:
-        result = cloudinary.uploader.destroy(
-            public_id,
-            resource_type=resource_type,
+    return cloudinary.utils.verify_api_response_signature(public_id, version, signature)
+
+
+async def get_images(public_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    images = {}
+    for start in range(0, len(public_ids), RESOURCES_PAGE_SIZE):
+        result = await call_api(
+            "resources_by_ids",
+            cloudinary.api.resources_by_ids,
+            public_ids[start:start + RESOURCES_PAGE_SIZE],
+            max_results=RESOURCES_PAGE_SIZE,
         )
-        success = result.get("result") == "ok"
-        
-        if success:
-            logger.debug(f"Deleted media: {public_id}")
-        else:
-            logger.warning(f"Failed to delete media {public_id}: {result}")
-        
-        return success
-    except Exception as e:
-        logger.error(f"Error deleting from Cloudinary ({public_id}): {e}")
-        return False
+        for resource in result.get("resources", []):
+            images[resource["public_id"]] = {**image_result(resource), "version": resource.get("version")}
+    return images
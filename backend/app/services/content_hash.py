@@ -0,0 +1,65 @@
+import asyncio
+import hashlib
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Optional, Tuple
+
+from fastapi import UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.photo import Photo
+from app.services.crud import CRUDService
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _chunks(stream: BinaryIO) -> Iterable[bytes]:
+    stream.seek(0)
+    return iter(lambda: stream.read(HASH_CHUNK_SIZE), b"")
+
+
+def hash_stream(stream: BinaryIO) -> str:
+    digest = hashlib.sha256()
+    for chunk in _chunks(stream):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+def copy_and_hash(stream: BinaryIO, path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("wb") as target:
+        for chunk in _chunks(stream):
+            digest.update(chunk)
+            target.write(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+async def hash_upload(file: UploadFile) -> str:
+    return await asyncio.to_thread(hash_stream, file.file)
+
+
+async def match_photos(
+    session: AsyncSession,
+    wing_id: int,
+    content_hashes: Iterable[str]
+) -> Tuple[Dict[str, Photo], Dict[str, Photo]]:
+    in_wing: Dict[str, Photo] = {}
+    elsewhere: Dict[str, Photo] = {}
+    for photo in await CRUDService.get_photos_by_content_hashes(session, list(content_hashes)):
+        matches = in_wing if photo.wing_id == wing_id else elsewhere
+        matches.setdefault(photo.content_hash, photo)
+    return in_wing, elsewhere
+
+
+def reuse_photo(source: Photo, wing_id: int, content_hash: Optional[str] = None) -> Photo:
+    return Photo(
+        wing_id=wing_id,
+        url=source.url,
+        cloudinary_id=source.cloudinary_id,
+        width=source.width,
+        height=source.height,
+        size_bytes=source.size_bytes,
+        format=source.format,
+        content_hash=content_hash or source.content_hash,
+    )
@@ -1,16 +1,80 @@
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from collections import Counter
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.sql import ColumnElement, Select
 
+from app.config import get_settings
 from app.models.wing import Wing
 from app.models.activity import Activity
 from app.models.photo import Photo
+from app.schemas.activity import ActivityResponse
+from app.schemas.photo import PhotoResponse
+from app.schemas.wing import WingResponse
+from app.services.image_derivatives import photo_derivatives
+from app.services.jobs import JobService
+from app.services.statistics import StatisticsService
+from app.services.versioning import VersionService
 
+settings = get_settings()
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+WING_COLUMNS = tuple(getattr(Wing, name) for name in WingResponse.model_fields)
+ACTIVITY_COLUMNS = tuple(getattr(Activity, name) for name in ActivityResponse.model_fields)
+PHOTO_COLUMNS = tuple(getattr(Photo, name) for name in PhotoResponse.model_fields)
+
+
+def _batches(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _activity_page(
+    stmt: Select,
+    limit: int,
+    cursor: Optional[Tuple[date, int]] = None
+) -> Select:
+    if cursor:
+        stmt = stmt.where(tuple_(Activity.activity_date, Activity.id) < cursor)
+    return stmt.order_by(Activity.activity_date.desc(), Activity.id.desc()).limit(limit)
+
+
+def _activity_filters(
+    wing_ids: Optional[Sequence[int]] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    has_report: Optional[bool] = None
+) -> List[ColumnElement]:
+    conditions: List[ColumnElement] = []
+    if wing_ids is not None:
+        conditions.append(
+            Activity.wing_id == wing_ids[0] if len(wing_ids) == 1 else Activity.wing_id.in_(wing_ids)
+        )
+    if date_from is not None:
+        conditions.append(Activity.activity_date >= date_from)
+    if date_to is not None:
+        conditions.append(Activity.activity_date <= date_to)
+    if has_report is not None:
+        conditions.append(
+            Activity.report_url.is_not(None) if has_report else Activity.report_url.is_(None)
+        )
+    return conditions
+
+
+def _photo_page(
+    stmt: Select,
+    limit: int,
+    cursor: Optional[Tuple[datetime, int]] = None
+) -> Select:
+    if cursor:
+        stmt = stmt.where(tuple_(Photo.uploaded_at, Photo.id) < cursor)
+    return stmt.order_by(Photo.uploaded_at.desc(), Photo.id.desc()).limit(limit)
+
 
 class CRUDService:
     @staticmethod
@@ -33,41 +97,66 @@ class CRUDService:
         return result.scalar_one_or_none()
     
     @staticmethod
-    async def get_wing_with_relations(
+    async def get_wing_slug_map(session: AsyncSession) -> Dict[str, int]:
+        result = await session.execute(select(Wing.slug, Wing.id))
+        return {slug: wing_id for slug, wing_id in result.all()}
+    
+    @staticmethod
+    async def get_wing_rows(session: AsyncSession) -> List[Dict[str, Any]]:
+        result = await session.execute(select(*WING_COLUMNS).order_by(Wing.id))
+        return [dict(row) for row in result.mappings()]
+    
+    @staticmethod
+    async def get_wing_overview(
         session: AsyncSession,
-        slug: str
-    ) -> Optional[Wing]:
-        result = await session.execute(
-            select(Wing)
-            .where(Wing.slug == slug)
-            .options(
-                selectinload(Wing.activities),
-                selectinload(Wing.photos)
-            )
-        )
-        wing = result.scalar_one_or_none()
-        
+        slug: str,
+        activities_limit: int = 20,
+        photos_limit: int = 20
+    ) -> Optional[Dict[str, Any]]:
+        result = await session.execute(select(*WING_COLUMNS).where(Wing.slug == slug))
+        wing = result.mappings().one_or_none()
         if not wing:
             return None
         
-        wing.activities.sort(key=lambda x: x.activity_date, reverse=True)
-        wing.photos.sort(key=lambda x: x.uploaded_at, reverse=True)
+        activities = await CRUDService.get_activity_rows(
+            session, wing["id"], limit=activities_limit
+        )
+        photos = await CRUDService.get_photo_rows_by_wing(
+            session, wing["id"], limit=photos_limit
+        )
+        activity_count = await StatisticsService.get_wing_total(session, wing["id"])
+        photo_count = await session.scalar(
+            select(func.count()).select_from(Photo).where(Photo.wing_id == wing["id"])
+        )
         
-        return wing
+        return {
+            "wing": dict(wing),
+            "activities": activities,
+            "photos": photos,
+            "activity_count": activity_count,
+            "photo_count": photo_count or 0,
+        }
     
     @staticmethod
-    async def get_activities_by_wing(
+    async def get_activity_rows(
         session: AsyncSession,
-        wing_id: int,
-        limit: int = 100
-    ) -> List[Activity]:
-        result = await session.execute(
-            select(Activity)
-            .where(Activity.wing_id == wing_id)
-            .order_by(Activity.activity_date.desc())
-            .limit(limit)
-        )
-        return list(result.scalars().all())
+        wing_id: Optional[int] = None,
+        limit: int = 100,
+        cursor: Optional[Tuple[date, int]] = None,
+        wing_ids: Optional[Sequence[int]] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        has_report: Optional[bool] = None
+    ) -> List[Dict[str, Any]]:
+        stmt = select(*ACTIVITY_COLUMNS).where(*_activity_filters(
+            [wing_id] if wing_id is not None else wing_ids,
+            date_from,
+            date_to,
+            has_report,
+        ))
+        
+        result = await session.execute(_activity_page(stmt, limit, cursor))
+        return [dict(row) for row in result.mappings()]
     
     @staticmethod
     async def get_activity_by_id(
@@ -86,6 +175,10 @@ class CRUDService:
     ) -> Activity:
         try:
             session.add(activity)
+            await StatisticsService.apply_delta(
+                session, activity.wing_id, activity.activity_date.year, 1
+            )
+            await VersionService.bump(session, [activity.wing_id])
             await session.commit()
             await session.refresh(activity)
             logger.debug(f"Created activity: {activity.id}")
@@ -95,6 +188,51 @@ class CRUDService:
             logger.error(f"Failed to create activity: {e}")
             raise
     
+    @staticmethod
+    async def create_activities_bulk(
+        session: AsyncSession,
+        activities: List[Activity],
+        batch_size: Optional[int] = None
+    ) -> List[Activity]:
+        if not activities:
+            return []
+        
+        rows = [activity.model_dump(exclude={"id"}) for activity in activities]
+        try:
+            created: List[Activity] = []
+            for batch in _batches(rows, batch_size or settings.db_bulk_batch_size):
+                result = await session.scalars(
+                    insert(Activity).returning(Activity, sort_by_parameter_order=True), batch
+                )
+                created.extend(result.all())
+            
+            await CRUDService.apply_activity_counts(
+                session,
+                Counter((activity.wing_id, activity.activity_date.year) for activity in activities),
+            )
+            await session.commit()
+            
+            logger.debug(f"Created {len(created)} activities in bulk")
+            return created
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Failed to create activities bulk: {e}")
+            raise
+    
+    @staticmethod
+    async def insert_activity_rows(session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        if rows:
+            await session.execute(insert(Activity), rows)
+    
+    @staticmethod
+    async def apply_activity_counts(
+        session: AsyncSession,
+        year_counts: Dict[Tuple[int, int], int]
+    ) -> None:
+        for (wing_id, year), count in year_counts.items():
+            await StatisticsService.apply_delta(session, wing_id, year, count)
+        await VersionService.bump(session, {wing_id for wing_id, _ in year_counts})
+    
     @staticmethod
     async def update_activity(
         session: AsyncSession,
@@ -105,11 +243,23 @@ class CRUDService:
         if not activity:
             return None
         
+        previous_key = (activity.wing_id, activity.activity_date.year)
+        previous_report_id = activity.report_cloudinary_id
+        
         try:
             for key, value in update_data.items():
                 if hasattr(activity, key):
                     setattr(activity, key, value)
             
+            if previous_report_id and activity.report_cloudinary_id != previous_report_id:
+                JobService.enqueue_media_delete(session, previous_report_id, "raw")
+            
+            current_key = (activity.wing_id, activity.activity_date.year)
+            if current_key != previous_key:
+                await StatisticsService.apply_delta(session, *previous_key, -1)
+                await StatisticsService.apply_delta(session, *current_key, 1)
+            await VersionService.bump(session, [previous_key[0], current_key[0]])
+            
             await session.commit()
             await session.refresh(activity)
             logger.debug(f"Updated activity: {activity_id}")
@@ -126,10 +276,26 @@ class CRUDService:
     ) -> bool:
         try:
             result = await session.execute(
-                delete(Activity).where(Activity.id == activity_id)
+                delete(Activity)
+                .where(Activity.id == activity_id)
+                .returning(
+                    Activity.wing_id,
+                    Activity.activity_date,
+                    Activity.report_cloudinary_id,
+                )
             )
+            deleted_row = result.first()
+            if deleted_row:
+                await StatisticsService.apply_delta(
+                    session, deleted_row.wing_id, deleted_row.activity_date.year, -1
+                )
+                await VersionService.bump(session, [deleted_row.wing_id])
+                if deleted_row.report_cloudinary_id:
+                    JobService.enqueue_media_delete(
+                        session, deleted_row.report_cloudinary_id, "raw"
+                    )
             await session.commit()
-            deleted = result.rowcount > 0
+            deleted = deleted_row is not None
             if deleted:
                 logger.debug(f"Deleted activity: {activity_id}")
             return deleted
@@ -139,61 +305,103 @@ class CRUDService:
             raise
     
     @staticmethod
-    async def get_all_activities(
+    async def stream_all_activities(
         session: AsyncSession,
-        limit: int = 1000
-    ) -> List[Activity]:
+        batch_size: int = 500
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        result = await session.stream(
+            select(*ACTIVITY_COLUMNS)
+            .order_by(Activity.activity_date.desc(), Activity.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for batch in result.mappings().partitions():
+            yield [dict(row) for row in batch]
+    
+    @staticmethod
+    async def get_photo_rows_by_wing(
+        session: AsyncSession,
+        wing_id: int,
+        limit: int = 100,
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> List[Dict[str, Any]]:
         result = await session.execute(
-            select(Activity)
-            .order_by(Activity.activity_date.desc())
-            .limit(limit)
+            _photo_page(select(*PHOTO_COLUMNS).where(Photo.wing_id == wing_id), limit, cursor)
         )
-        return list(result.scalars().all())
+        return [
+            {**row, "derivatives": photo_derivatives(row["cloudinary_id"], row["width"], row["format"])}
+            for row in result.mappings()
+        ]
     
     @staticmethod
-    async def get_all_activities_with_wings(
-        session: AsyncSession
-    ) -> List[Tuple[Activity, Wing]]:
+    async def get_photo_by_id(
+        session: AsyncSession,
+        photo_id: int
+    ) -> Optional[Photo]:
         result = await session.execute(
-            select(Activity, Wing)
-            .join(Wing, Activity.wing_id == Wing.id)
-            .order_by(Activity.activity_date.desc())
+            select(Photo).where(Photo.id == photo_id)
         )
-        return list(result.all())
+        return result.scalar_one_or_none()
     
     @staticmethod
-    async def get_photos_by_wing(
+    async def get_existing_cloudinary_ids(
         session: AsyncSession,
-        wing_id: int,
-        limit: int = 100,
-        offset: int = 0
-    ) -> List[Photo]:
+        cloudinary_ids: List[str]
+    ) -> Set[str]:
+        if not cloudinary_ids:
+            return set()
         result = await session.execute(
-            select(Photo)
-            .where(Photo.wing_id == wing_id)
-            .order_by(Photo.uploaded_at.desc())
-            .limit(limit)
-            .offset(offset)
+            select(Photo.cloudinary_id).where(Photo.cloudinary_id.in_(cloudinary_ids))
         )
-        return list(result.scalars().all())
+        return set(result.scalars().all())
     
     @staticmethod
-    async def get_latest_photos_by_wing(
+    async def get_photo_by_cloudinary_id(
         session: AsyncSession,
-        wing_id: int,
-        limit: int = 10
+        cloudinary_id: str
+    ) -> Optional[Photo]:
+        result = await session.execute(
+            select(Photo).where(Photo.cloudinary_id == cloudinary_id)
+        )
+        return result.scalars().first()
+    
+    @staticmethod
+    async def get_photos_by_content_hashes(
+        session: AsyncSession,
+        content_hashes: Sequence[str]
     ) -> List[Photo]:
-        return await CRUDService.get_photos_by_wing(session, wing_id, limit=limit)
+        if not content_hashes:
+            return []
+        result = await session.execute(
+            select(Photo).where(Photo.content_hash.in_(set(content_hashes))).order_by(Photo.id)
+        )
+        return list(result.scalars().all())
     
     @staticmethod
-    async def get_photo_by_id(
+    async def get_activity_by_report_hash(
         session: AsyncSession,
-        photo_id: int
-    ) -> Optional[Photo]:
+        report_hash: str
+    ) -> Optional[Activity]:
         result = await session.execute(
-            select(Photo).where(Photo.id == photo_id)
+            select(Activity)
+            .where(Activity.report_hash == report_hash, Activity.report_cloudinary_id.is_not(None))
+            .order_by(Activity.id)
         )
-        return result.scalar_one_or_none()
+        return result.scalars().first()
+    
+    @staticmethod
+    async def get_referenced_media(
+        session: AsyncSession,
+        public_ids: Sequence[str]
+    ) -> Set[str]:
+        if not public_ids:
+            return set()
+        photos = await session.execute(
+            select(Photo.cloudinary_id).where(Photo.cloudinary_id.in_(public_ids))
+        )
+        reports = await session.execute(
+            select(Activity.report_cloudinary_id).where(Activity.report_cloudinary_id.in_(public_ids))
+        )
+        return set(photos.scalars().all()) | set(reports.scalars().all())
     
     @staticmethod
     async def create_photo(
@@ -202,6 +410,7 @@ class CRUDService:
     ) -> Photo:
         try:
             session.add(photo)
+            await VersionService.bump(session, [photo.wing_id])
             await session.commit()
             await session.refresh(photo)
             logger.debug(f"Created photo: {photo.id}")
@@ -214,17 +423,26 @@ class CRUDService:
     @staticmethod
     async def create_photos_bulk(
         session: AsyncSession,
-        photos: List[Photo]
+        photos: List[Photo],
+        batch_size: Optional[int] = None
     ) -> List[Photo]:
+        if not photos:
+            return []
+        
+        rows = [photo.model_dump(exclude={"id"}) for photo in photos]
         try:
-            session.add_all(photos)
-            await session.commit()
+            created: List[Photo] = []
+            for batch in _batches(rows, batch_size or settings.db_bulk_batch_size):
+                result = await session.scalars(
+                    insert(Photo).returning(Photo, sort_by_parameter_order=True), batch
+                )
+                created.extend(result.all())
             
-            for photo in photos:
-                await session.refresh(photo)
+            await VersionService.bump(session, {photo.wing_id for photo in photos})
+            await session.commit()
             
-            logger.debug(f"Created {len(photos)} photos in bulk")
-            return photos
+            logger.debug(f"Created {len(created)} photos in bulk")
+            return created
         except Exception as e:
             await session.rollback()
             logger.error(f"Failed to create photos bulk: {e}")
@@ -237,10 +455,16 @@ class CRUDService:
     ) -> bool:
         try:
             result = await session.execute(
-                delete(Photo).where(Photo.id == photo_id)
+                delete(Photo)
+                .where(Photo.id == photo_id)
+                .returning(Photo.wing_id, Photo.cloudinary_id)
             )
+            deleted_row = result.first()
+            if deleted_row:
+                await VersionService.bump(session, [deleted_row.wing_id])
+                JobService.enqueue_media_delete(session, deleted_row.cloudinary_id, "image")
             await session.commit()
-            deleted = result.rowcount > 0
+            deleted = deleted_row is not None
             if deleted:
                 logger.debug(f"Deleted photo: {photo_id}")
             return deleted
@@ -248,3 +472,35 @@ class CRUDService:
             await session.rollback()
             logger.error(f"Failed to delete photo {photo_id}: {e}")
             raise
+    
+    @staticmethod
+    async def delete_photos_bulk(
+        session: AsyncSession,
+        photo_ids: List[int],
+        batch_size: Optional[int] = None
+    ) -> Tuple[int, Set[int]]:
+        unique_ids = list(dict.fromkeys(photo_ids))
+        try:
+            deleted_rows = []
+            for batch in _batches(unique_ids, batch_size or settings.db_bulk_batch_size):
+                result = await session.execute(
+                    delete(Photo)
+                    .where(Photo.id.in_(batch))
+                    .returning(Photo.wing_id, Photo.cloudinary_id)
+                )
+                deleted_rows.extend(result.all())
+            
+            wing_ids = {row.wing_id for row in deleted_rows}
+            if deleted_rows:
+                await VersionService.bump(session, wing_ids)
+                JobService.enqueue_media_delete_many(
+                    session, [row.cloudinary_id for row in deleted_rows], "image"
+                )
+            await session.commit()
+            
+            logger.debug(f"Deleted {len(deleted_rows)} photos in bulk")
+            return len(deleted_rows), wing_ids
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Failed to delete photos bulk: {e}")
+            raise
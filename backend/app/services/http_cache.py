@@ -0,0 +1,78 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+from app.config import get_settings
+
+settings = get_settings()
+
+
+def make_etag(request: Request, version: str) -> str:
+    source = f"{request.url.path}?{request.url.query}|{version}"
+    digest = hashlib.sha1(source.encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def _strip_weak(etag: str) -> str:
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {_strip_weak(tag) for tag in if_none_match.split(",")}
+    return _strip_weak(etag) in candidates
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    version: str,
+    last_modified: Optional[datetime] = None
+) -> Optional[Response]:
+    etag = make_etag(request, version)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": (
+            f"public, max-age={settings.http_cache_max_age}, must-revalidate"
+        ),
+    }
+    if last_modified is not None:
+        last_modified = _as_utc(last_modified)
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    
+    response.headers.update(headers)
+    
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, etag)
+    elif if_modified_since is not None and last_modified is not None:
+        not_modified = _not_modified_since(if_modified_since, last_modified)
+    else:
+        not_modified = False
+    
+    if not_modified:
+        return Response(status_code=304, headers={**headers, "Vary": "Accept-Encoding"})
+    return None
@@ -0,0 +1,65 @@
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+from app.config import get_settings
+
+DELIVERY_BASE_URL = "https://res.cloudinary.com"
+
+THUMBNAIL_SIZE = 400
+MEDIUM_WIDTH = 960
+FULL_WIDTH = 1920
+SRCSET_WIDTHS = (320, 640, 960, 1280, 1920)
+SRCSET_FORMATS = ("avif", "webp")
+WEB_FORMATS = {"jpg", "jpeg", "png", "gif", "webp"}
+
+
+def derivative_url(
+    cloud_name: str,
+    public_id: str,
+    transformation: str,
+    extension: str,
+    base_url: str = DELIVERY_BASE_URL
+) -> str:
+    return f"{base_url}/{cloud_name}/image/upload/{transformation}/{quote(public_id, safe='/')}.{extension}"
+
+
+def srcset_widths(width: Optional[int] = None) -> List[int]:
+    if not width:
+        return list(SRCSET_WIDTHS)
+    
+    widths = [candidate for candidate in SRCSET_WIDTHS if candidate < width]
+    if width <= SRCSET_WIDTHS[-1]:
+        widths.append(width)
+    return widths
+
+
+def build_derivatives(
+    cloud_name: str,
+    public_id: str,
+    width: Optional[int] = None,
+    format: Optional[str] = None,
+    base_url: str = DELIVERY_BASE_URL
+) -> Dict[str, Any]:
+    extension = format.lower() if format and format.lower() in WEB_FORMATS else "jpg"
+    
+    def url(transformation: str, target: str = extension) -> str:
+        return derivative_url(cloud_name, public_id, transformation, target, base_url)
+    
+    widths = srcset_widths(width)
+    return {
+        "thumbnail": url(f"c_fill,g_auto,h_{THUMBNAIL_SIZE},w_{THUMBNAIL_SIZE},q_auto"),
+        "medium": url(f"c_limit,w_{MEDIUM_WIDTH},q_auto"),
+        "full": url(f"c_limit,w_{FULL_WIDTH},q_auto"),
+        "srcset": {
+            target: ", ".join(f"{url(f'c_limit,w_{size},q_auto', target)} {size}w" for size in widths)
+            for target in SRCSET_FORMATS
+        },
+    }
+
+
+def photo_derivatives(
+    public_id: str,
+    width: Optional[int] = None,
+    format: Optional[str] = None
+) -> Dict[str, Any]:
+    return build_derivatives(get_settings().cloudinary_cloud_name, public_id, width, format)
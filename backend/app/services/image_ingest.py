@@ -0,0 +1,135 @@
+import asyncio
+import io
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import UploadFile
+
+from app.config import get_settings
+from app.metrics import image_ingest_bytes
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+EFFICIENT_FORMATS = {"JPEG", "WEBP"}
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def normalize_image(data: bytes, max_edge: int, quality: int) -> Optional[bytes]:
+    with Image.open(io.BytesIO(data)) as image:
+        if getattr(image, "is_animated", False):
+            return None
+        
+        has_exif = len(image.getexif()) > 0
+        source_format = image.format
+        icc_profile = image.info.get("icc_profile")
+        
+        normalized = ImageOps.exif_transpose(image)
+        resized = max(normalized.size) > max_edge
+        if not (has_exif or resized or source_format not in EFFICIENT_FORMATS):
+            return None
+        
+        if resized:
+            normalized.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+        
+        has_alpha = normalized.mode in ("RGBA", "LA") or (
+            normalized.mode == "P" and "transparency" in normalized.info
+        )
+        output = io.BytesIO()
+        if has_alpha:
+            normalized.convert("RGBA").save(output, "WEBP", quality=quality, icc_profile=icc_profile)
+        else:
+            normalized.convert("RGB").save(
+                output, "JPEG", quality=quality, optimize=True, progressive=True, icc_profile=icc_profile
+            )
+    
+    encoded = output.getvalue()
+    if len(encoded) >= len(data) and not (has_exif or resized):
+        return None
+    return encoded
+
+
+def ingest_enabled() -> bool:
+    return settings.image_ingest_enabled and Image is not None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=settings.image_ingest_workers)
+    return _executor
+
+
+def shutdown_ingest_pool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def normalize_bytes(data: bytes, name: str = "") -> Optional[bytes]:
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(
+            _get_executor(), normalize_image, data, settings.image_max_edge, settings.image_quality
+        )
+    except Exception as e:
+        logger.warning(f"Uploading {name or 'image'} unmodified, normalization failed: {e}")
+        return None
+
+
+def _record(before: int, after: int) -> Dict[str, int]:
+    image_ingest_bytes.inc("original", amount=before)
+    image_ingest_bytes.inc("normalized", amount=after)
+    return {"original_bytes": before, "normalized_bytes": after, "bytes_saved": before - after}
+
+
+async def normalize_uploads(files: List[UploadFile]) -> Dict[str, int]:
+    if not ingest_enabled():
+        return _record(0, 0)
+    
+    semaphore = asyncio.Semaphore(max(settings.image_ingest_workers, 1) * 2)
+    
+    async def _normalize_one(file: UploadFile) -> Tuple[int, int]:
+        async with semaphore:
+            await file.seek(0)
+            data = await file.read()
+            normalized = await normalize_bytes(data, file.filename or "")
+            if normalized is None:
+                await file.seek(0)
+                return len(data), len(data)
+            
+            await file.seek(0)
+            await asyncio.to_thread(file.file.truncate)
+            await file.write(normalized)
+            await file.seek(0)
+            return len(data), len(normalized)
+    
+    sizes = await asyncio.gather(*(_normalize_one(file) for file in files))
+    report = _record(sum(before for before, _ in sizes), sum(after for _, after in sizes))
+    logger.info(
+        f"Normalized {len(files)} images: {report['original_bytes']} -> "
+        f"{report['normalized_bytes']} bytes ({report['bytes_saved']} saved)"
+    )
+    return report
+
+
+async def normalize_file(path: Path) -> Dict[str, int]:
+    if not ingest_enabled():
+        return _record(0, 0)
+    
+    data = await asyncio.to_thread(path.read_bytes)
+    normalized = await normalize_bytes(data, path.name)
+    if normalized is None:
+        return _record(len(data), len(data))
+    
+    await asyncio.to_thread(path.write_bytes, normalized)
+    return _record(len(data), len(normalized))
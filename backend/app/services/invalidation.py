@@ -0,0 +1,209 @@
+import asyncio
+import json
+import logging
+import os
+import socket
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+from app.config import get_settings
+from app.database import engine
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+CHANNEL = "anvaya_invalidate"
+MAX_MESSAGE_BYTES = 8000
+RECONNECT_MAX_SECONDS = 30.0
+
+InvalidationHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class InvalidationBus:
+    def __init__(self) -> None:
+        self.origin = f"{os.getpid()}-{uuid4().hex[:8]}"
+        self.published = 0
+        self.received = 0
+        self._handler: Optional[InvalidationHandler] = None
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def start(self, handler: InvalidationHandler) -> None:
+        self._handler = handler
+    
+    async def stop(self) -> None:
+        self._handler = None
+    
+    async def publish(self, event: Dict[str, Any]) -> None:
+        self.published += 1
+    
+    def encode(self, event: Dict[str, Any]) -> str:
+        return json.dumps({**event, "origin": self.origin}, separators=(",", ":"))
+    
+    async def dispatch(self, message: Any) -> None:
+        try:
+            event = json.loads(message)
+        except ValueError:
+            logger.warning(f"Ignoring malformed invalidation message: {message!r}")
+            return
+        
+        if event.get("origin") == self.origin or self._handler is None:
+            return
+        
+        self.received += 1
+        try:
+            await self._handler(event)
+        except Exception as e:
+            logger.error(f"Failed to apply invalidation {event}: {e}")
+    
+    def spawn(self, message: Any) -> None:
+        task = asyncio.create_task(self.dispatch(message))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.__class__.__name__,
+            "published": self.published,
+            "received": self.received,
+        }
+
+
+class PostgresBus(InvalidationBus):
+    def __init__(self, dsn: str, channel: str = CHANNEL) -> None:
+        super().__init__()
+        self.dsn = dsn
+        self.channel = channel
+        self._task: Optional[asyncio.Task] = None
+    
+    async def start(self, handler: InvalidationHandler) -> None:
+        await super().start(handler)
+        self._task = asyncio.create_task(self._listen(), name="invalidation-listener")
+    
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await super().stop()
+    
+    async def publish(self, event: Dict[str, Any]) -> None:
+        await super().publish(event)
+        async with engine.connect() as conn:
+            await conn.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": self.channel, "payload": self.encode(event)},
+            )
+            await conn.commit()
+    
+    async def _listen(self) -> None:
+        import asyncpg
+        
+        delay = 1.0
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(
+                    self.channel,
+                    lambda _connection, _pid, _channel, payload: self.spawn(payload),
+                )
+                logger.info(f"Listening for cache invalidations on '{self.channel}'")
+                
+                # Events sent while disconnected are lost, so start from an empty cache.
+                if self._handler is not None:
+                    await self._handler({"scope": "all"})
+                delay = 1.0
+                await closed.wait()
+                logger.warning("Invalidation listener connection closed; reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Invalidation listener unavailable, retrying in {delay:.0f}s: {e}")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_SECONDS)
+
+
+class SocketBus(InvalidationBus):
+    def __init__(self, directory: Path) -> None:
+        super().__init__()
+        self.directory = directory
+        self.path = directory / f"{self.origin}.sock"
+        self._socket: Optional[socket.socket] = None
+    
+    async def start(self, handler: InvalidationHandler) -> None:
+        await super().start(handler)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+        self._socket.bind(str(self.path))
+        asyncio.get_running_loop().add_reader(self._socket.fileno(), self._on_readable)
+        logger.info(f"Listening for cache invalidations on {self.path}")
+    
+    async def stop(self) -> None:
+        if self._socket:
+            asyncio.get_running_loop().remove_reader(self._socket.fileno())
+            self._socket.close()
+            self._socket = None
+            self.path.unlink(missing_ok=True)
+        await super().stop()
+    
+    async def publish(self, event: Dict[str, Any]) -> None:
+        await super().publish(event)
+        if self._socket is None:
+            return
+        
+        message = self.encode(event).encode()
+        for peer in self.directory.glob("*.sock"):
+            if peer == self.path:
+                continue
+            try:
+                self._socket.sendto(message, str(peer))
+            except (ConnectionRefusedError, FileNotFoundError):
+                peer.unlink(missing_ok=True)
+            except BlockingIOError:
+                logger.warning(f"Dropped invalidation for busy peer {peer.name}")
+    
+    def _on_readable(self) -> None:
+        while self._socket is not None:
+            try:
+                message = self._socket.recv(MAX_MESSAGE_BYTES)
+            except BlockingIOError:
+                return
+            self.spawn(message)
+
+
+def postgres_dsn(database_url: str) -> str:
+    return make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+@lru_cache()
+def get_invalidation_bus() -> InvalidationBus:
+    backend = settings.invalidation_backend
+    if backend == "auto":
+        if settings.cache_backend == "redis":
+            backend = "none"
+        elif engine.dialect.name == "postgresql":
+            backend = "postgres"
+        else:
+            backend = "socket" if hasattr(socket, "AF_UNIX") else "none"
+    
+    if backend == "postgres":
+        return PostgresBus(postgres_dsn(settings.database_url))
+    if backend == "socket":
+        directory = settings.invalidation_socket_dir or os.path.join(
+            tempfile.gettempdir(), f"anvaya-invalidation-{settings.port}"
+        )
+        return SocketBus(Path(directory))
+    return InvalidationBus()
@@ -0,0 +1,343 @@
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import and_, delete, event, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import async_session
+from app.metrics import job_duration, jobs_processed
+from app.models.job import Job
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+DEAD = "dead"
+
+DELETE_MEDIA_JOB = "delete_media"
+UPLOAD_PHOTO_JOB = "upload_photo"
+RECONCILE_MEDIA_JOB = "reconcile_media"
+BUILD_SNAPSHOT_JOB = "build_snapshot"
+
+MEDIA_DELETE_BATCH_SIZE = 100
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+_handlers: Dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    def register(handler: JobHandler) -> JobHandler:
+        _handlers[kind] = handler
+        return handler
+    return register
+
+
+def retry_delay(attempts: int) -> float:
+    delay = min(
+        settings.job_retry_max_seconds,
+        settings.job_retry_base_seconds * 2 ** max(attempts - 1, 0),
+    )
+    return delay * random.uniform(0.5, 1.0)
+
+
+class JobService:
+    @staticmethod
+    def enqueue(
+        session: AsyncSession,
+        kind: str,
+        payload: Dict[str, Any],
+        max_attempts: Optional[int] = None
+    ) -> Job:
+        job = Job(
+            kind=kind,
+            payload=payload,
+            max_attempts=max_attempts or settings.job_max_attempts,
+        )
+        session.add(job)
+        session.info["jobs_enqueued"] = True
+        return job
+    
+    @staticmethod
+    def enqueue_media_delete(
+        session: AsyncSession,
+        public_id: str,
+        resource_type: str = "image"
+    ) -> Job:
+        return JobService.enqueue(
+            session,
+            DELETE_MEDIA_JOB,
+            {"public_id": public_id, "resource_type": resource_type},
+        )
+    
+    @staticmethod
+    def enqueue_media_delete_many(
+        session: AsyncSession,
+        public_ids: List[str],
+        resource_type: str = "image"
+    ) -> List[Job]:
+        return [
+            JobService.enqueue(
+                session,
+                DELETE_MEDIA_JOB,
+                {
+                    "public_ids": public_ids[start:start + MEDIA_DELETE_BATCH_SIZE],
+                    "resource_type": resource_type,
+                },
+            )
+            for start in range(0, len(public_ids), MEDIA_DELETE_BATCH_SIZE)
+        ]
+    
+    @staticmethod
+    async def claim(session: AsyncSession) -> Optional[Job]:
+        now = datetime.utcnow()
+        stale_before = now - timedelta(seconds=settings.job_lock_timeout_seconds)
+        claimable = or_(
+            and_(Job.status == PENDING, Job.run_at <= now),
+            and_(Job.status == RUNNING, Job.locked_at < stale_before),
+        )
+        
+        job_id = await session.scalar(
+            select(Job.id)
+            .where(claimable)
+            .order_by(Job.run_at, Job.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        if job_id is None:
+            await session.rollback()
+            return None
+        
+        result = await session.execute(
+            update(Job)
+            .where(Job.id == job_id, claimable)
+            .values(
+                status=RUNNING,
+                locked_at=now,
+                attempts=Job.attempts + 1,
+                updated_at=now,
+            )
+            .returning(Job)
+        )
+        job = result.scalar_one_or_none()
+        await session.commit()
+        return job
+    
+    @staticmethod
+    async def complete(session: AsyncSession, job_id: int) -> None:
+        await session.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(status=SUCCEEDED, locked_at=None, last_error=None, updated_at=datetime.utcnow())
+        )
+        await session.commit()
+    
+    @staticmethod
+    async def fail(session: AsyncSession, job: Job, error: str) -> str:
+        now = datetime.utcnow()
+        if job.attempts >= job.max_attempts:
+            status, run_at = DEAD, job.run_at
+        else:
+            status, run_at = PENDING, now + timedelta(seconds=retry_delay(job.attempts))
+        
+        await session.execute(
+            update(Job)
+            .where(Job.id == job.id)
+            .values(
+                status=status,
+                run_at=run_at,
+                locked_at=None,
+                last_error=error[:2000],
+                updated_at=now,
+            )
+        )
+        await session.commit()
+        return status
+    
+    @staticmethod
+    async def get_job(session: AsyncSession, job_id: int) -> Optional[Job]:
+        return await session.get(Job, job_id)
+    
+    @staticmethod
+    async def find_active(session: AsyncSession, kind: str) -> Optional[Job]:
+        result = await session.execute(
+            select(Job)
+            .where(Job.kind == kind, Job.status.in_((PENDING, RUNNING)))
+            .order_by(Job.id)
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+    
+    @staticmethod
+    async def retry(session: AsyncSession, job: Job) -> Job:
+        job.status = PENDING
+        job.attempts = 0
+        job.run_at = datetime.utcnow()
+        job.updated_at = job.run_at
+        session.info["jobs_enqueued"] = True
+        await session.commit()
+        await session.refresh(job)
+        return job
+    
+    @staticmethod
+    async def get_counts(session: AsyncSession) -> Dict[str, int]:
+        result = await session.execute(
+            select(Job.status, func.count()).group_by(Job.status)
+        )
+        return {status: count for status, count in result.all()}
+    
+    @staticmethod
+    async def get_oldest_pending(session: AsyncSession) -> Optional[datetime]:
+        return await session.scalar(
+            select(func.min(Job.run_at)).where(Job.status == PENDING)
+        )
+    
+    @staticmethod
+    async def list_jobs(
+        session: AsyncSession,
+        status: Optional[str] = None,
+        limit: int = 50
+    ) -> List[Job]:
+        stmt = select(Job).order_by(Job.updated_at.desc(), Job.id.desc()).limit(limit)
+        if status:
+            stmt = stmt.where(Job.status == status)
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+    
+    @staticmethod
+    async def purge_finished(session: AsyncSession, older_than: datetime) -> int:
+        result = await session.execute(
+            delete(Job).where(Job.status == SUCCEEDED, Job.updated_at < older_than)
+        )
+        await session.commit()
+        return result.rowcount or 0
+
+
+class JobWorker:
+    def __init__(self, concurrency: int, poll_interval: float) -> None:
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._tasks: List[asyncio.Task] = []
+        self._last_purge = 0.0
+    
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+    
+    def notify(self) -> None:
+        self._wake.set()
+    
+    def start(self) -> None:
+        if self.running or self.concurrency <= 0:
+            return
+        
+        self._stopping = False
+        self._wake = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._run(index), name=f"job-worker-{index}")
+            for index in range(self.concurrency)
+        ]
+        logger.info(f"Started {self.concurrency} background job workers")
+    
+    async def stop(self, timeout: float = 10.0) -> None:
+        if not self._tasks:
+            return
+        
+        self._stopping = True
+        self._wake.set()
+        _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks = []
+        logger.info("Stopped background job workers")
+    
+    async def _run(self, index: int) -> None:
+        while not self._stopping:
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Job worker {index} failed to poll the queue: {e}")
+                processed = False
+            
+            if processed:
+                continue
+            
+            await self._purge_if_due()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+    
+    async def run_once(self) -> bool:
+        async with async_session() as session:
+            job = await JobService.claim(session)
+        if job is None:
+            return False
+        
+        await self._execute(job)
+        return True
+    
+    async def _execute(self, job: Job) -> None:
+        handler = _handlers.get(job.kind)
+        start = time.perf_counter()
+        try:
+            if handler is None:
+                raise LookupError(f"No handler registered for job kind '{job.kind}'")
+            await handler(job.payload)
+        except Exception as e:
+            job_duration.observe(time.perf_counter() - start, job.kind)
+            async with async_session() as session:
+                status = await JobService.fail(session, job, f"{type(e).__name__}: {e}")
+            jobs_processed.inc(job.kind, "dead" if status == DEAD else "retry")
+            log = logger.error if status == DEAD else logger.warning
+            log(f"Job {job.id} ({job.kind}) failed on attempt {job.attempts}/{job.max_attempts}: {e}")
+            return
+        
+        job_duration.observe(time.perf_counter() - start, job.kind)
+        async with async_session() as session:
+            await JobService.complete(session, job.id)
+        jobs_processed.inc(job.kind, "ok")
+        logger.debug(f"Job {job.id} ({job.kind}) succeeded")
+    
+    async def _purge_if_due(self) -> None:
+        if time.monotonic() - self._last_purge < 600:
+            return
+        
+        self._last_purge = time.monotonic()
+        older_than = datetime.utcnow() - timedelta(hours=settings.job_retention_hours)
+        try:
+            async with async_session() as session:
+                removed = await JobService.purge_finished(session, older_than)
+            if removed:
+                logger.info(f"Purged {removed} finished background jobs")
+        except Exception as e:
+            logger.warning(f"Failed to purge finished background jobs: {e}")
+
+
+job_queue = JobWorker(
+    concurrency=settings.job_workers,
+    poll_interval=settings.job_poll_interval_seconds,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_job_workers(session: Session) -> None:
+    if session.info.pop("jobs_enqueued", False):
+        job_queue.notify()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_job_wakeup(session: Session) -> None:
+    session.info.pop("jobs_enqueued", None)
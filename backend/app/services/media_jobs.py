@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, Dict, Tuple
+from uuid import uuid4
+
+from fastapi import UploadFile
+
+from app.config import get_settings
+from app.database import async_session
+from app.models.photo import Photo
+from app.services.cache import get_cache, invalidate_wing
+from app.services.cloudinary import delete_media, delete_media_bulk, upload_image_file
+from app.services.content_hash import copy_and_hash, match_photos, reuse_photo
+from app.services.crud import CRUDService
+from app.services.image_ingest import normalize_file
+from app.services.jobs import (
+    DELETE_MEDIA_JOB,
+    RECONCILE_MEDIA_JOB,
+    UPLOAD_PHOTO_JOB,
+    job_handler,
+)
+from app.services.reconciliation import CloudinaryMediaStore, MediaReconciler
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+async def spool_upload(file: UploadFile) -> Tuple[Path, str]:
+    spool_dir = Path(settings.job_spool_dir)
+    spool_dir.mkdir(parents=True, exist_ok=True)
+    
+    suffix = Path(file.filename or "").suffix.lower()
+    path = spool_dir / f"{uuid4().hex}{suffix}"
+    
+    content_hash = await asyncio.to_thread(copy_and_hash, file.file, path)
+    return path, content_hash
+
+
+@job_handler(DELETE_MEDIA_JOB)
+async def run_media_delete(payload: Dict[str, Any]) -> None:
+    resource_type = payload.get("resource_type", "image")
+    public_ids = payload["public_ids"] if "public_ids" in payload else [payload["public_id"]]
+    
+    async with async_session() as session:
+        shared = await CRUDService.get_referenced_media(session, public_ids)
+    if shared:
+        logger.info(f"Keeping {len(shared)} media assets that are still referenced by other records")
+        public_ids = [public_id for public_id in public_ids if public_id not in shared]
+    
+    if len(public_ids) > 1:
+        await delete_media_bulk(public_ids, resource_type=resource_type)
+    elif public_ids:
+        await delete_media(public_ids[0], resource_type=resource_type)
+
+
+@job_handler(UPLOAD_PHOTO_JOB)
+async def run_photo_upload(payload: Dict[str, Any]) -> None:
+    path = Path(payload["path"])
+    
+    async with async_session() as session:
+        wing = await CRUDService.get_wing_by_id(session, payload["wing_id"])
+        if not wing:
+            logger.warning(f"Discarding upload of {payload['filename']}: wing {payload['wing_id']} no longer exists")
+            path.unlink(missing_ok=True)
+            return
+        
+        content_hash = payload.get("content_hash")
+        in_wing, elsewhere = await match_photos(session, wing.id, [content_hash] if content_hash else [])
+        if content_hash in in_wing:
+            logger.info(f"Skipping upload of {payload['filename']}: already stored in wing '{wing.slug}'")
+            path.unlink(missing_ok=True)
+            return
+        
+        if content_hash in elsewhere:
+            photo = reuse_photo(elsewhere[content_hash], wing.id)
+        else:
+            ingest = await normalize_file(path)
+            if ingest["bytes_saved"]:
+                logger.info(f"Normalized {payload['filename']}: saved {ingest['bytes_saved']} bytes")
+            result = await upload_image_file(str(path), f"anvaya/{wing.slug}", payload["public_id"])
+            if await CRUDService.get_photo_by_cloudinary_id(session, result["public_id"]):
+                photo = None
+            else:
+                photo = Photo(
+                    wing_id=wing.id,
+                    url=result["url"],
+                    cloudinary_id=result["public_id"],
+                    width=result["width"],
+                    height=result["height"],
+                    size_bytes=result["size_bytes"],
+                    format=result["format"],
+                    content_hash=content_hash,
+                )
+        
+        if photo:
+            await CRUDService.create_photos_bulk(session, [photo])
+            logger.info(f"Created photo record for {payload['filename']} in wing '{wing.slug}'")
+    
+    await invalidate_wing(get_cache(), wing.slug)
+    path.unlink(missing_ok=True)
+
+
+@job_handler(RECONCILE_MEDIA_JOB)
+async def run_media_reconciliation(payload: Dict[str, Any]) -> None:
+    reconciler = MediaReconciler(CloudinaryMediaStore(), action=payload.get("action", "report"))
+    report = await reconciler.run(max_pages=payload.get("max_pages"))
+    if not report["complete"]:
+        logger.info("Media reconciliation paused at its page budget; the next run resumes from the checkpoints")
@@ -0,0 +1,43 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from app.exceptions import ValidationError
+
+T = TypeVar("T")
+
+SortValue = Union[date, datetime, float]
+
+
+def encode_cursor(sort_value: SortValue, row_id: int) -> str:
+    raw_value = sort_value if isinstance(sort_value, float) else sort_value.isoformat()
+    payload = json.dumps([raw_value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: Optional[str],
+    value_type: Callable[[Any], SortValue]
+) -> Optional[Tuple[SortValue, int]]:
+    if not cursor:
+        return None
+    
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return value_type(raw_value), int(row_id)
+    except (ValueError, TypeError, binascii.Error):
+        raise ValidationError("Invalid pagination cursor", field="cursor")
+
+
+def build_page(
+    rows: Sequence[T],
+    limit: int,
+    key: Callable[[T], Tuple[SortValue, int]]
+) -> Tuple[List[T], Optional[str]]:
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    return items, encode_cursor(*key(items[-1]))
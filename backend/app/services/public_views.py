@@ -0,0 +1,83 @@
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.crud import CRUDService
+from app.services.pagination import build_page
+from app.services.statistics import StatisticsService
+
+
+def _photo_key(photo: Dict[str, Any]) -> Tuple[datetime, int]:
+    return photo["uploaded_at"], photo["id"]
+
+
+def _activity_key(activity: Dict[str, Any]) -> Tuple[date, int]:
+    return activity["activity_date"], activity["id"]
+
+
+class PublicViews:
+    @staticmethod
+    async def wings(session: AsyncSession) -> List[Dict[str, Any]]:
+        return await CRUDService.get_wing_rows(session)
+    
+    @staticmethod
+    async def wing_detail(
+        session: AsyncSession,
+        slug: str,
+        activities_limit: int = 20,
+        photos_limit: int = 20
+    ) -> Optional[Dict[str, Any]]:
+        overview = await CRUDService.get_wing_overview(
+            session,
+            slug,
+            activities_limit=activities_limit + 1,
+            photos_limit=photos_limit + 1,
+        )
+        if not overview:
+            return None
+        
+        activities, activities_next_cursor = build_page(overview["activities"], activities_limit, key=_activity_key)
+        photos, photos_next_cursor = build_page(overview["photos"], photos_limit, key=_photo_key)
+        return {
+            **overview["wing"],
+            "activities": activities,
+            "photos": photos,
+            "activity_count": overview["activity_count"],
+            "photo_count": overview["photo_count"],
+            "activities_next_cursor": activities_next_cursor,
+            "photos_next_cursor": photos_next_cursor,
+        }
+    
+    @staticmethod
+    async def photo_page(
+        session: AsyncSession,
+        wing_id: int,
+        limit: int = 100,
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> Dict[str, Any]:
+        photos = await CRUDService.get_photo_rows_by_wing(session, wing_id, limit=limit + 1, cursor=cursor)
+        items, next_cursor = build_page(photos, limit, key=_photo_key)
+        return {"items": items, "next_cursor": next_cursor}
+    
+    @staticmethod
+    async def activity_page(
+        session: AsyncSession,
+        wing_id: Optional[int] = None,
+        limit: int = 100,
+        cursor: Optional[Tuple[date, int]] = None,
+        **filters: Any
+    ) -> Dict[str, Any]:
+        activities = await CRUDService.get_activity_rows(
+            session, wing_id, limit=limit + 1, cursor=cursor, **filters
+        )
+        items, next_cursor = build_page(activities, limit, key=_activity_key)
+        return {"items": items, "next_cursor": next_cursor}
+    
+    @staticmethod
+    async def statistics(session: AsyncSession, year: Optional[int] = None) -> Dict[str, Any]:
+        return {
+            "statistics": await StatisticsService.get_wing_counts(session, year=year),
+            "available_years": await StatisticsService.get_available_years(session),
+            "filtered_year": year,
+        }
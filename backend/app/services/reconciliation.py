@@ -0,0 +1,383 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import cloudinary.api
+from sqlalchemy import select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import async_session
+from app.exceptions import ValidationError
+from app.models.activity import Activity
+from app.models.job import Job
+from app.models.photo import Photo
+from app.models.reconciliation_checkpoint import ReconciliationCheckpoint
+from app.models.wing import Wing
+from app.services.cache import get_cache, invalidate_wing
+from app.services.cloudinary import call_api
+from app.services.crud import CRUDService
+from app.services.jobs import DELETE_MEDIA_JOB, PENDING, RUNNING
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+RESOURCE_TYPES = ("image", "raw")
+ACTIONS = ("report", "delete", "relink")
+API_BATCH_LIMIT = 100
+SAMPLE_SIZE = 50
+
+Resource = Dict[str, Any]
+PageResult = Tuple[Dict[str, Any], Optional[str]]
+
+
+def _parse_created_at(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    
+    parsed = value if isinstance(value, datetime) else datetime.fromisoformat(
+        str(value).replace("Z", "+00:00")
+    )
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _chunks(items: List[str], size: int) -> Iterable[List[str]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _merge_stats(total: Dict[str, Any], page: Dict[str, Any]) -> Dict[str, Any]:
+    merged = dict(total)
+    for key, value in page.items():
+        if isinstance(value, list):
+            merged[key] = (merged.get(key, []) + value)[:SAMPLE_SIZE]
+        else:
+            merged[key] = merged.get(key, 0) + value
+    return merged
+
+
+class MediaStore:
+    async def list_resources(
+        self,
+        prefix: str,
+        resource_type: str,
+        cursor: Optional[str],
+        max_results: int
+    ) -> Tuple[List[Resource], Optional[str]]:
+        raise NotImplementedError
+    
+    async def find_existing(self, public_ids: Set[str], resource_type: str) -> Set[str]:
+        raise NotImplementedError
+    
+    async def delete_resources(self, public_ids: List[str], resource_type: str) -> Set[str]:
+        raise NotImplementedError
+
+
+class CloudinaryMediaStore(MediaStore):
+    async def list_resources(
+        self,
+        prefix: str,
+        resource_type: str,
+        cursor: Optional[str],
+        max_results: int
+    ) -> Tuple[List[Resource], Optional[str]]:
+        options: Dict[str, Any] = {
+            "type": "upload",
+            "prefix": prefix,
+            "resource_type": resource_type,
+            "max_results": min(max_results, 500),
+        }
+        if cursor:
+            options["next_cursor"] = cursor
+        
+        result = await call_api("list_resources", cloudinary.api.resources, **options)
+        return result.get("resources", []), result.get("next_cursor")
+    
+    async def find_existing(self, public_ids: Set[str], resource_type: str) -> Set[str]:
+        existing: Set[str] = set()
+        for chunk in _chunks(sorted(public_ids), API_BATCH_LIMIT):
+            result = await call_api(
+                "resources_by_ids",
+                cloudinary.api.resources_by_ids,
+                chunk,
+                resource_type=resource_type,
+                max_results=len(chunk),
+            )
+            existing.update(resource["public_id"] for resource in result.get("resources", []))
+        return existing
+    
+    async def delete_resources(self, public_ids: List[str], resource_type: str) -> Set[str]:
+        deleted: Set[str] = set()
+        for chunk in _chunks(public_ids, API_BATCH_LIMIT):
+            result = await call_api(
+                "delete_resources",
+                cloudinary.api.delete_resources,
+                chunk,
+                resource_type=resource_type,
+            )
+            deleted.update(
+                public_id
+                for public_id, outcome in result.get("deleted", {}).items()
+                if outcome in ("deleted", "not_found")
+            )
+        return deleted
+
+
+class MediaReconciler:
+    def __init__(
+        self,
+        store: MediaStore,
+        action: str = "report",
+        batch_size: Optional[int] = None,
+        grace_period: Optional[timedelta] = None
+    ) -> None:
+        if action not in ACTIONS:
+            raise ValidationError(
+                f"Unknown reconciliation action '{action}'. Allowed: {', '.join(ACTIONS)}",
+                field="action"
+            )
+        
+        self.store = store
+        self.action = action
+        self.batch_size = batch_size or settings.reconcile_batch_size
+        self.grace_period = grace_period if grace_period is not None else timedelta(
+            hours=settings.reconcile_grace_hours
+        )
+        self._pages_left: Optional[int] = None
+    
+    async def run(self, max_pages: Optional[int] = None) -> Dict[str, Any]:
+        self._pages_left = max_pages
+        
+        async with async_session() as session:
+            wings = await CRUDService.get_all_wings(session)
+            in_progress = set((await session.execute(
+                select(ReconciliationCheckpoint.scope)
+                .where(ReconciliationCheckpoint.cursor.is_not(None))
+            )).scalars().all())
+        
+        scopes: List[Tuple[str, Callable[[AsyncSession, Optional[str]], Awaitable[PageResult]]]] = [
+            (
+                f"remote:{wing.slug}:{resource_type}",
+                self._remote_scanner(wing, resource_type),
+            )
+            for wing in wings
+            for resource_type in RESOURCE_TYPES
+        ]
+        scopes.append(("database:photos", self._scan_photo_rows))
+        scopes.append(("database:reports", self._scan_report_rows))
+        scopes.sort(key=lambda item: item[0] not in in_progress)
+        
+        results = {}
+        for scope, scanner in scopes:
+            results[scope] = await self._run_scope(scope, scanner)
+        
+        report = {
+            "action": self.action,
+            "complete": all(result["complete"] for result in results.values()),
+            "scopes": results,
+        }
+        logger.info(
+            f"Media reconciliation ({self.action}) finished: "
+            f"{sum(result.get('orphaned', 0) for result in results.values())} orphaned, "
+            f"{sum(result.get('dangling', 0) for result in results.values())} dangling"
+        )
+        return report
+    
+    def _take_page(self) -> bool:
+        if self._pages_left is None:
+            return True
+        if self._pages_left <= 0:
+            return False
+        self._pages_left -= 1
+        return True
+    
+    async def _run_scope(
+        self,
+        scope: str,
+        scanner: Callable[[AsyncSession, Optional[str]], Awaitable[PageResult]]
+    ) -> Dict[str, Any]:
+        run_stats: Dict[str, Any] = {}
+        
+        async with async_session() as session:
+            checkpoint = await session.get(ReconciliationCheckpoint, scope)
+            if checkpoint is None:
+                checkpoint = ReconciliationCheckpoint(scope=scope)
+                session.add(checkpoint)
+            
+            if checkpoint.cursor is None:
+                checkpoint.stats = {}
+                checkpoint.pass_started_at = datetime.utcnow()
+                checkpoint.completed_at = None
+            
+            complete = False
+            while self._take_page():
+                page_stats, next_cursor = await scanner(session, checkpoint.cursor)
+                run_stats = _merge_stats(run_stats, page_stats)
+                
+                now = datetime.utcnow()
+                checkpoint.stats = _merge_stats(checkpoint.stats, page_stats)
+                checkpoint.cursor = next_cursor
+                checkpoint.updated_at = now
+                if next_cursor is None:
+                    checkpoint.completed_at = now
+                    complete = True
+                await session.commit()
+                
+                if complete:
+                    break
+            
+            return {"complete": complete, "cursor": checkpoint.cursor, **run_stats}
+    
+    def _remote_scanner(
+        self,
+        wing: Wing,
+        resource_type: str
+    ) -> Callable[[AsyncSession, Optional[str]], Awaitable[PageResult]]:
+        async def scan(session: AsyncSession, cursor: Optional[str]) -> PageResult:
+            resources, next_cursor = await self.store.list_resources(
+                f"anvaya/{wing.slug}/", resource_type, cursor, self.batch_size
+            )
+            public_ids = {resource["public_id"] for resource in resources}
+            referenced = await self._referenced_ids(session, public_ids)
+            
+            cutoff = datetime.utcnow() - self.grace_period
+            orphans = [
+                resource for resource in resources
+                if resource["public_id"] not in referenced
+                and (_parse_created_at(resource.get("created_at")) or cutoff) <= cutoff
+            ]
+            stats: Dict[str, Any] = {
+                "scanned": len(resources),
+                "orphaned": len(orphans),
+                "orphan_samples": [resource["public_id"] for resource in orphans],
+            }
+            
+            if orphans and self.action == "delete":
+                deleted = await self.store.delete_resources(
+                    [resource["public_id"] for resource in orphans], resource_type
+                )
+                stats["deleted"] = len(deleted)
+            elif orphans and self.action == "relink":
+                stats["relinked"] = await self._relink(session, wing, resource_type, orphans)
+            
+            return stats, next_cursor
+        
+        return scan
+    
+    async def _referenced_ids(self, session: AsyncSession, public_ids: Set[str]) -> Set[str]:
+        if not public_ids:
+            return set()
+        
+        result = await session.execute(union(
+            select(Photo.cloudinary_id).where(Photo.cloudinary_id.in_(public_ids)),
+            select(Activity.report_cloudinary_id).where(Activity.report_cloudinary_id.in_(public_ids)),
+        ))
+        return set(result.scalars().all())
+    
+    async def _pending_deletes(self, session: AsyncSession, public_ids: Set[str]) -> Set[str]:
+        if not public_ids:
+            return set()
+        
+        result = await session.execute(
+            select(Job.payload).where(
+                Job.kind == DELETE_MEDIA_JOB,
+                Job.status.in_((PENDING, RUNNING)),
+            )
+        )
+        queued: Set[str] = set()
+        for payload in result.scalars().all():
+            if payload.get("public_id"):
+                queued.add(payload["public_id"])
+            queued.update(payload.get("public_ids") or [])
+        return queued & public_ids
+    
+    async def _relink(
+        self,
+        session: AsyncSession,
+        wing: Wing,
+        resource_type: str,
+        orphans: List[Resource]
+    ) -> int:
+        if resource_type != "image":
+            return 0
+        
+        candidates = [
+            resource for resource in orphans
+            if not resource["public_id"].startswith(f"anvaya/{wing.slug}/reports/")
+        ]
+        being_deleted = await self._pending_deletes(
+            session, {resource["public_id"] for resource in candidates}
+        )
+        photos = [
+            Photo(
+                wing_id=wing.id,
+                url=resource["secure_url"],
+                cloudinary_id=resource["public_id"],
+                width=resource.get("width"),
+                height=resource.get("height"),
+                size_bytes=resource.get("bytes"),
+                format=resource.get("format"),
+                uploaded_at=_parse_created_at(resource.get("created_at")) or datetime.utcnow(),
+            )
+            for resource in candidates
+            if resource["public_id"] not in being_deleted
+        ]
+        if not photos:
+            return 0
+        
+        await CRUDService.create_photos_bulk(session, photos)
+        await invalidate_wing(get_cache(), wing.slug)
+        logger.info(f"Relinked {len(photos)} orphaned images to wing '{wing.slug}'")
+        return len(photos)
+    
+    async def _scan_photo_rows(self, session: AsyncSession, cursor: Optional[str]) -> PageResult:
+        rows = (await session.execute(
+            select(Photo.id, Photo.cloudinary_id)
+            .where(Photo.id > int(cursor or 0))
+            .order_by(Photo.id)
+            .limit(self.batch_size)
+        )).all()
+        
+        existing = await self.store.find_existing({row.cloudinary_id for row in rows}, "image")
+        dangling = [row.cloudinary_id for row in rows if row.cloudinary_id not in existing]
+        
+        next_cursor = str(rows[-1].id) if len(rows) == self.batch_size else None
+        return {
+            "scanned": len(rows),
+            "dangling": len(dangling),
+            "dangling_samples": dangling,
+        }, next_cursor
+    
+    async def _scan_report_rows(self, session: AsyncSession, cursor: Optional[str]) -> PageResult:
+        rows = (await session.execute(
+            select(Activity.id, Activity.report_cloudinary_id)
+            .where(Activity.id > int(cursor or 0), Activity.report_cloudinary_id.is_not(None))
+            .order_by(Activity.id)
+            .limit(self.batch_size)
+        )).all()
+        
+        public_ids = {row.report_cloudinary_id for row in rows}
+        existing: Set[str] = set()
+        for resource_type in RESOURCE_TYPES:
+            missing = public_ids - existing
+            if missing:
+                existing |= await self.store.find_existing(missing, resource_type)
+        dangling = [row.report_cloudinary_id for row in rows if row.report_cloudinary_id not in existing]
+        
+        next_cursor = str(rows[-1].id) if len(rows) == self.batch_size else None
+        return {
+            "scanned": len(rows),
+            "dangling": len(dangling),
+            "dangling_samples": dangling,
+        }, next_cursor
+
+
+class ReconciliationService:
+    @staticmethod
+    async def get_checkpoints(session: AsyncSession) -> List[ReconciliationCheckpoint]:
+        result = await session.execute(
+            select(ReconciliationCheckpoint).order_by(ReconciliationCheckpoint.scope)
+        )
+        return list(result.scalars().all())
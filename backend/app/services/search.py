@@ -0,0 +1,102 @@
+import re
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import ColumnElement, cast, column, func, literal_column, select, table, tuple_
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.models.activity import Activity
+from app.models.wing import Wing
+from app.services.crud import ACTIVITY_COLUMNS
+
+SEARCH_CONFIG = "english"
+MAX_SEARCH_TERMS = 8
+WING_RESULTS_LIMIT = 5
+
+ACTIVITY_WEIGHTS = (10.0, 1.0, 5.0)
+WING_WEIGHTS = (10.0, 5.0, 1.0, 1.0)
+
+_TERM = re.compile(r"\w+")
+
+
+def search_terms(query: str) -> List[str]:
+    return _TERM.findall(query.lower())[:MAX_SEARCH_TERMS]
+
+
+def _match(model: Any, terms: List[str], dialect: str) -> Tuple[Select, ColumnElement]:
+    name = model.__tablename__
+    
+    if dialect == "postgresql":
+        vector = literal_column(f"{name}.search_vector")
+        query = func.to_tsquery(
+            cast(SEARCH_CONFIG, REGCONFIG),
+            " & ".join(f"{term}:*" for term in terms),
+        )
+        return select().select_from(model).where(vector.op("@@")(query)), func.ts_rank_cd(vector, query)
+    
+    index = table(f"{name}_fts", column("rowid"))
+    weights = ACTIVITY_WEIGHTS if model is Activity else WING_WEIGHTS
+    stmt = (
+        select()
+        .select_from(model)
+        .join(index, index.c.rowid == model.id)
+        .where(literal_column(index.name).op("MATCH")(" ".join(f'"{term}"*' for term in terms)))
+    )
+    return stmt, -func.bm25(literal_column(index.name), *weights)
+
+
+class SearchService:
+    @staticmethod
+    async def search_activities(
+        session: AsyncSession,
+        query: str,
+        wing_slug: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        limit: int = 20,
+        cursor: Optional[Tuple[float, int]] = None
+    ) -> List[Dict[str, Any]]:
+        terms = search_terms(query)
+        if not terms:
+            return []
+        
+        stmt, rank = _match(Activity, terms, session.bind.dialect.name)
+        stmt = stmt.add_columns(*ACTIVITY_COLUMNS, rank.label("rank"))
+        if wing_slug:
+            stmt = stmt.where(
+                Activity.wing_id == select(Wing.id).where(Wing.slug == wing_slug).scalar_subquery()
+            )
+        if date_from:
+            stmt = stmt.where(Activity.activity_date >= date_from)
+        if date_to:
+            stmt = stmt.where(Activity.activity_date <= date_to)
+        
+        ranked = stmt.subquery()
+        page = select(ranked)
+        if cursor:
+            page = page.where(tuple_(ranked.c.rank, ranked.c.id) < cursor)
+        page = page.order_by(ranked.c.rank.desc(), ranked.c.id.desc()).limit(limit)
+        
+        result = await session.execute(page)
+        return [dict(row) for row in result.mappings()]
+    
+    @staticmethod
+    async def search_wings(
+        session: AsyncSession,
+        query: str,
+        limit: int = WING_RESULTS_LIMIT
+    ) -> List[Dict[str, Any]]:
+        terms = search_terms(query)
+        if not terms:
+            return []
+        
+        stmt, rank = _match(Wing, terms, session.bind.dialect.name)
+        stmt = (
+            stmt.add_columns(Wing.id, Wing.name, Wing.slug, rank.label("rank"))
+            .order_by(rank.desc(), Wing.id)
+            .limit(limit)
+        )
+        result = await session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
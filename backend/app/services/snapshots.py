@@ -0,0 +1,294 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import async_session, engine
+from app.services.crud import CRUDService
+from app.models.job import Job
+from app.services.jobs import BUILD_SNAPSHOT_JOB, JobService, job_handler
+from app.services.public_views import PublicViews
+from app.services.serialization import dump_json
+from app.services.statistics import StatisticsService
+from app.services.versioning import VersionService
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+LOCK_FILE = ".lock"
+MANIFEST_FORMAT = 2
+HASH_LENGTH = 16
+SHARED = "shared"
+
+_lock = asyncio.Lock()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    temporary.write_bytes(data)
+    os.replace(temporary, path)
+
+
+def _acquire_lock(root: Path) -> IO[str]:
+    root.mkdir(parents=True, exist_ok=True)
+    handle = (root / LOCK_FILE).open("a")
+    if fcntl is not None:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+    return handle
+
+
+def encoded_variants(body: bytes) -> Dict[str, bytes]:
+    variants = {"": body, ".gz": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(body, quality=11)
+    return variants
+
+
+def hashed_path(relative: str, sha256: str) -> str:
+    stem, _, extension = relative.rpartition(".")
+    return f"{stem}.{sha256[:HASH_LENGTH]}.{extension}"
+
+
+def write_file(
+    root: Path,
+    relative: str,
+    body: bytes,
+    previous: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    sha256 = hashlib.sha256(body).hexdigest()
+    entry = {"path": hashed_path(relative, sha256), "sha256": sha256, "bytes": len(body)}
+    target = root / entry["path"]
+    if previous == entry and target.exists():
+        return entry
+    
+    for suffix, data in encoded_variants(body).items():
+        _write_atomic(target.with_name(target.name + suffix), data)
+    return entry
+
+
+def remove_files(root: Path, paths: Iterable[str]) -> None:
+    for path in paths:
+        target = root / path
+        for suffix in ("", ".gz", ".br"):
+            target.with_name(target.name + suffix).unlink(missing_ok=True)
+
+
+def load_manifest(root: Path) -> Dict[str, Any]:
+    try:
+        manifest = json.loads((root / MANIFEST_FILE).read_bytes())
+    except (OSError, ValueError):
+        return {"format": MANIFEST_FORMAT, "scopes": {}, "retired": {}}
+    
+    if manifest.get("format") != MANIFEST_FORMAT:
+        legacy = [relative for scope in manifest.get("scopes", {}).values() for relative in scope.get("files", {})]
+        return {"format": MANIFEST_FORMAT, "scopes": {}, "retired": dict.fromkeys(legacy, time.time())}
+    return manifest
+
+
+def file_paths(scope: Optional[Dict[str, Any]]) -> List[str]:
+    return [entry["path"] for entry in (scope or {}).get("files", {}).values()]
+
+
+def wing_path(slug: str, view: str = "") -> str:
+    return f"api/wings/{slug}/{view}" if view else f"api/wings/{slug}.json"
+
+
+async def _paged(
+    loader: Callable[..., Awaitable[Dict[str, Any]]],
+    key: str,
+    page_size: int
+) -> List[Tuple[int, Dict[str, Any]]]:
+    pages = []
+    cursor = None
+    while True:
+        page = await loader(limit=page_size, cursor=cursor)
+        number = len(pages) + 1
+        pages.append((number, page))
+        if not page["next_cursor"]:
+            return pages
+        last = page["items"][-1]
+        cursor = (last[key], last["id"])
+
+
+class SnapshotService:
+    @staticmethod
+    async def render_wing(
+        session: AsyncSession,
+        wing_id: int,
+        slug: str
+    ) -> Dict[str, bytes]:
+        page_size = settings.snapshot_page_size
+        files = {wing_path(slug): dump_json(await PublicViews.wing_detail(session, slug))}
+        
+        async def photos(**page: Any) -> Dict[str, Any]:
+            return await PublicViews.photo_page(session, wing_id, **page)
+        
+        async def activities(**page: Any) -> Dict[str, Any]:
+            return await PublicViews.activity_page(session, wing_id, **page)
+        
+        for view, loader, key in (("photos", photos, "uploaded_at"), ("activities", activities, "activity_date")):
+            pages = await _paged(loader, key, page_size)
+            for number, page in pages:
+                next_page = number + 1 if number < len(pages) else None
+                files[wing_path(slug, f"{view}/{number}.json")] = dump_json({**page, "next_page": next_page})
+        return files
+    
+    @staticmethod
+    async def render_shared(session: AsyncSession) -> Dict[str, bytes]:
+        files = {
+            "api/wings.json": dump_json(await PublicViews.wings(session)),
+            "api/statistics/activities.json": dump_json(await PublicViews.statistics(session)),
+        }
+        for year in await StatisticsService.get_available_years(session):
+            files[f"api/statistics/activities/{year}.json"] = dump_json(
+                await PublicViews.statistics(session, year)
+            )
+        return files
+    
+    @staticmethod
+    async def refresh(
+        wing_ids: Optional[Iterable[int]] = None,
+        force: bool = False,
+        root: Optional[Path] = None
+    ) -> Dict[str, int]:
+        root = Path(root or settings.snapshot_dir)
+        async with _lock:
+            lock = await asyncio.to_thread(_acquire_lock, root)
+            try:
+                return await SnapshotService._refresh(root, wing_ids, force)
+            finally:
+                lock.close()
+    
+    @staticmethod
+    async def _refresh(
+        root: Path,
+        wing_ids: Optional[Iterable[int]],
+        force: bool
+    ) -> Dict[str, int]:
+        manifest = await asyncio.to_thread(load_manifest, root)
+        scopes: Dict[str, Any] = manifest["scopes"]
+        retired: Dict[str, float] = manifest["retired"]
+        rebuilt = {"wings": 0, "files": 0, "removed": 0}
+        now = time.time()
+        
+        async def store(scope: str, version: str, files: Dict[str, bytes]) -> None:
+            previous = scopes.get(scope)
+            scopes[scope] = await SnapshotService._store(root, previous, version, files)
+            current = set(file_paths(scopes[scope]))
+            retired.update((path, now) for path in file_paths(previous) if path not in current)
+            for path in current:
+                retired.pop(path, None)
+            rebuilt["files"] += len(files)
+        
+        async with async_session() as session:
+            slug_map = await CRUDService.get_wing_slug_map(session)
+            wanted = set(wing_ids) if wing_ids is not None else set(slug_map.values())
+            
+            for slug in [scope for scope in scopes if scope != SHARED and scope not in slug_map]:
+                retired.update((path, now) for path in file_paths(scopes.pop(slug)))
+                rebuilt["removed"] += 1
+            
+            for slug, wing_id in sorted(slug_map.items()):
+                if wing_id not in wanted and slug in scopes:
+                    continue
+                version, _ = await VersionService.get_wing_version(session, slug)
+                if not force and scopes.get(slug, {}).get("version") == version:
+                    continue
+                
+                await store(slug, version, await SnapshotService.render_wing(session, wing_id, slug))
+                rebuilt["wings"] += 1
+            
+            version, _ = await VersionService.get_global_version(session)
+            if force or scopes.get(SHARED, {}).get("version") != version:
+                await store(SHARED, version, await SnapshotService.render_shared(session))
+        
+        expired = [
+            path for path, retired_at in retired.items()
+            if now - retired_at >= settings.snapshot_retain_seconds
+        ]
+        for path in expired:
+            del retired[path]
+        
+        manifest["version"] = scopes[SHARED]["version"]
+        manifest["generated_at"] = datetime.utcnow().isoformat()
+        await asyncio.to_thread(_write_atomic, root / MANIFEST_FILE, json.dumps(manifest, indent=2).encode())
+        await asyncio.to_thread(remove_files, root, expired)
+        
+        if rebuilt["files"] or rebuilt["removed"]:
+            logger.info(
+                f"Snapshot refreshed in {root}: {rebuilt['wings']} wings, {rebuilt['files']} files rendered, "
+                f"{rebuilt['removed']} wings removed, {len(expired)} retired files deleted"
+            )
+        return rebuilt
+    
+    @staticmethod
+    async def schedule(session: AsyncSession, force: bool = False) -> Job:
+        active = await JobService.find_active(session, BUILD_SNAPSHOT_JOB)
+        if active and active.payload.get("wing_ids") is None:
+            return active
+        
+        job = JobService.enqueue(session, BUILD_SNAPSHOT_JOB, {"wing_ids": None, "force": force})
+        await session.commit()
+        return job
+    
+    @staticmethod
+    async def _store(
+        root: Path,
+        previous: Optional[Dict[str, Any]],
+        version: str,
+        files: Dict[str, bytes]
+    ) -> Dict[str, Any]:
+        previous_files = (previous or {}).get("files", {})
+        
+        def write_all() -> Dict[str, Any]:
+            return {
+                relative: write_file(root, relative, body, previous_files.get(relative))
+                for relative, body in files.items()
+            }
+        
+        return {"version": version, "files": await asyncio.to_thread(write_all)}
+
+
+@job_handler(BUILD_SNAPSHOT_JOB)
+async def run_snapshot_refresh(payload: Dict[str, Any]) -> None:
+    await SnapshotService.refresh(payload.get("wing_ids"), force=payload.get("force", False))
+
+
+async def main(force: bool) -> int:
+    try:
+        report = await SnapshotService.refresh(force=force)
+    finally:
+        await engine.dispose()
+    print(f"Wrote {report['files']} files for {report['wings']} wings to {settings.snapshot_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    
+    if len(sys.argv) != 2 or sys.argv[1] not in ("build", "rebuild"):
+        print("Usage: python -m app.services.snapshots [build|rebuild]")
+        sys.exit(2)
+    sys.exit(asyncio.run(main(force=sys.argv[1] == "rebuild")))
@@ -0,0 +1,117 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, extract, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import dialect_insert
+from app.models.wing import Wing
+from app.models.activity import Activity
+from app.models.activity_stat import ActivityStat
+
+logger = logging.getLogger(__name__)
+
+
+class StatisticsService:
+    @staticmethod
+    async def apply_delta(
+        session: AsyncSession,
+        wing_id: int,
+        year: int,
+        delta: int
+    ) -> None:
+        if delta == 0:
+            return
+        
+        insert = dialect_insert(session)
+        stmt = insert(ActivityStat).values(
+            wing_id=wing_id,
+            year=year,
+            activity_count=max(delta, 0),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ActivityStat.wing_id, ActivityStat.year],
+            set_={"activity_count": ActivityStat.activity_count + delta},
+        )
+        await session.execute(stmt)
+    
+    @staticmethod
+    async def rebuild(session: AsyncSession) -> int:
+        activity_year = extract("year", Activity.activity_date)
+        result = await session.execute(
+            select(
+                Activity.wing_id,
+                activity_year.label("year"),
+                func.count(Activity.id),
+            ).group_by(Activity.wing_id, activity_year)
+        )
+        rows = [
+            ActivityStat(wing_id=wing_id, year=int(year), activity_count=count)
+            for wing_id, year, count in result.all()
+        ]
+        
+        try:
+            await session.execute(delete(ActivityStat))
+            session.add_all(rows)
+            await session.commit()
+            logger.info(f"Rebuilt activity statistics ({len(rows)} wing/year rows)")
+            return len(rows)
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Failed to rebuild activity statistics: {e}")
+            raise
+    
+    @staticmethod
+    async def ensure_populated(session: AsyncSession) -> None:
+        has_stats = await session.execute(select(ActivityStat.wing_id).limit(1))
+        if has_stats.first() is not None:
+            return
+        
+        has_activities = await session.execute(select(Activity.id).limit(1))
+        if has_activities.first() is not None:
+            await StatisticsService.rebuild(session)
+    
+    @staticmethod
+    async def get_wing_counts(
+        session: AsyncSession,
+        year: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        total = func.sum(ActivityStat.activity_count)
+        stmt = (
+            select(Wing.id, Wing.name, Wing.slug, total.label("activity_count"))
+            .join(ActivityStat, ActivityStat.wing_id == Wing.id)
+            .group_by(Wing.id, Wing.name, Wing.slug)
+            .having(total > 0)
+            .order_by(total.desc())
+        )
+        if year is not None:
+            stmt = stmt.where(ActivityStat.year == year)
+        
+        result = await session.execute(stmt)
+        return [
+            {
+                "wing_id": wing_id,
+                "wing_name": name,
+                "wing_slug": slug,
+                "activity_count": int(count),
+            }
+            for wing_id, name, slug, count in result.all()
+        ]
+    
+    @staticmethod
+    async def get_wing_total(session: AsyncSession, wing_id: int) -> int:
+        total = await session.scalar(
+            select(func.coalesce(func.sum(ActivityStat.activity_count), 0))
+            .where(ActivityStat.wing_id == wing_id)
+        )
+        return int(total or 0)
+    
+    @staticmethod
+    async def get_available_years(session: AsyncSession) -> List[int]:
+        result = await session.execute(
+            select(ActivityStat.year)
+            .where(ActivityStat.activity_count > 0)
+            .distinct()
+            .order_by(ActivityStat.year.desc())
+        )
+        return [int(year) for year in result.scalars().all()]
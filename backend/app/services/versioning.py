@@ -0,0 +1,65 @@
+import logging
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import dialect_insert
+from app.models.wing import Wing
+from app.models.wing_version import WingVersion
+from app.services.jobs import BUILD_SNAPSHOT_JOB, JobService
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class VersionService:
+    @staticmethod
+    async def bump(session: AsyncSession, wing_ids: Iterable[int]) -> None:
+        now = datetime.utcnow()
+        insert = dialect_insert(session)
+        wing_ids = set(wing_ids)
+        
+        for wing_id in wing_ids:
+            stmt = insert(WingVersion).values(wing_id=wing_id, version=1, updated_at=now)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[WingVersion.wing_id],
+                set_={"version": WingVersion.version + 1, "updated_at": now},
+            )
+            await session.execute(stmt)
+        
+        if settings.snapshot_enabled and wing_ids:
+            JobService.enqueue(session, BUILD_SNAPSHOT_JOB, {"wing_ids": sorted(wing_ids)})
+    
+    @staticmethod
+    async def get_wing_version(
+        session: AsyncSession,
+        slug: str
+    ) -> Optional[Tuple[str, Optional[datetime]]]:
+        result = await session.execute(
+            select(Wing.id, WingVersion.version, WingVersion.updated_at)
+            .outerjoin(WingVersion, WingVersion.wing_id == Wing.id)
+            .where(Wing.slug == slug)
+        )
+        row = result.first()
+        if row is None:
+            return None
+        
+        wing_id, version, updated_at = row
+        return f"{wing_id}.{version or 0}", updated_at
+    
+    @staticmethod
+    async def get_global_version(
+        session: AsyncSession
+    ) -> Tuple[str, Optional[datetime]]:
+        result = await session.execute(
+            select(
+                func.count(Wing.id),
+                func.coalesce(func.sum(WingVersion.version), 0),
+                func.max(WingVersion.updated_at),
+            ).outerjoin(WingVersion, WingVersion.wing_id == Wing.id)
+        )
+        wing_count, version_sum, updated_at = result.one()
+        return f"{wing_count}.{version_sum}", updated_at
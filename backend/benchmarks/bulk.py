@@ -0,0 +1,147 @@
+import argparse
+import asyncio
+import json
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+from benchmarks.env import DEFAULT_DATABASE_URL, configure
+
+BATCH_SIZES = (10, 100, 1000)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare per-row and bulk write paths by round-trips and latency"
+    )
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--sizes", type=int, nargs="*", default=list(BATCH_SIZES))
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the median is reported")
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    configure(args.database_url)
+
+    from sqlalchemy import event, select
+
+    from app.database import async_session, engine
+    from app.models.activity import Activity
+    from app.models.photo import Photo
+    from app.models.wing import Wing
+    from app.services.crud import CRUDService
+    from benchmarks.seed import reset_schema
+
+    round_trips = {"count": 0}
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_round_trip(*_: Any) -> None:
+        round_trips["count"] += 1
+
+    await reset_schema()
+    async with async_session() as session:
+        session.add(Wing(name="Bench", slug="bench", about="a", vision="v", mission="m"))
+        await session.commit()
+        wing_id = (await session.execute(select(Wing.id))).scalar_one()
+
+    def make_photos(count: int) -> List[Photo]:
+        stamp = time.perf_counter_ns()
+        return [
+            Photo(wing_id=wing_id, url=f"https://example.com/{stamp}/{index}.jpg", cloudinary_id=f"bench/{stamp}/{index}")
+            for index in range(count)
+        ]
+
+    def make_activities(count: int) -> List[Activity]:
+        return [
+            Activity(
+                wing_id=wing_id,
+                title=f"Bulk activity {index}",
+                description="Inserted by the bulk write benchmark",
+                activity_date=date(2024, 1 + index % 12, 1 + index % 28),
+            )
+            for index in range(count)
+        ]
+
+    async def per_row_photo_insert(count: int) -> None:
+        async with async_session() as session:
+            photos = make_photos(count)
+            session.add_all(photos)
+            await session.commit()
+            for photo in photos:
+                await session.refresh(photo)
+
+    async def bulk_photo_insert(count: int) -> None:
+        async with async_session() as session:
+            await CRUDService.create_photos_bulk(session, make_photos(count))
+
+    async def per_row_activity_insert(count: int) -> None:
+        async with async_session() as session:
+            for activity in make_activities(count):
+                await CRUDService.create_activity(session, activity)
+
+    async def bulk_activity_insert(count: int) -> None:
+        async with async_session() as session:
+            await CRUDService.create_activities_bulk(session, make_activities(count))
+
+    async def photo_ids(count: int) -> List[int]:
+        async with async_session() as session:
+            created = await CRUDService.create_photos_bulk(session, make_photos(count))
+            return [photo.id for photo in created]
+
+    async def per_row_photo_delete(ids: List[int]) -> None:
+        async with async_session() as session:
+            for photo_id in ids:
+                await CRUDService.delete_photo(session, photo_id)
+
+    async def bulk_photo_delete(ids: List[int]) -> None:
+        async with async_session() as session:
+            await CRUDService.delete_photos_bulk(session, ids)
+
+    async def measure(
+        operation: Callable[[Any], Awaitable[None]],
+        prepare: Callable[[int], Awaitable[Any]],
+        size: int
+    ) -> Dict[str, float]:
+        samples = []
+        for _ in range(args.repeat):
+            argument = await prepare(size)
+            round_trips["count"] = 0
+            start = time.perf_counter()
+            await operation(argument)
+            samples.append((time.perf_counter() - start, round_trips["count"]))
+        elapsed, trips = sorted(samples)[len(samples) // 2]
+        return {"round_trips": trips, "ms": round(elapsed * 1000, 2)}
+
+    async def as_count(size: int) -> int:
+        return size
+
+    cases = [
+        ("photo insert", per_row_photo_insert, bulk_photo_insert, as_count),
+        ("activity insert", per_row_activity_insert, bulk_activity_insert, as_count),
+        ("photo delete", per_row_photo_delete, bulk_photo_delete, photo_ids),
+    ]
+
+    results = []
+    print(f"{'operation':<16} {'rows':>5}  {'per-row trips':>13} {'per-row ms':>10}  {'bulk trips':>10} {'bulk ms':>8}")
+    for name, per_row, bulk, prepare in cases:
+        for size in args.sizes:
+            before = await measure(per_row, prepare, size)
+            after = await measure(bulk, prepare, size)
+            results.append({"operation": name, "rows": size, "per_row": before, "bulk": after})
+            print(
+                f"{name:<16} {size:>5}  {before['round_trips']:>13} {before['ms']:>10.2f}  "
+                f"{after['round_trips']:>10} {after['ms']:>8.2f}"
+            )
+
+    await engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    report = asyncio.run(main(arguments))
+    if arguments.output:
+        arguments.output.write_text(json.dumps(report, indent=2))
+        print(f"Results written to {arguments.output}")
@@ -0,0 +1,63 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "throughput_rps")
+
+
+def load(path: Path) -> Dict[str, Any]:
+    return json.loads(path.read_text())
+
+
+def delta(before: float, after: float) -> float:
+    if not before:
+        return 0.0
+    return (after - before) / before * 100
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="Fail when p95 latency regresses by more than this percentage",
+    )
+    args = parser.parse_args()
+
+    baseline = load(args.baseline)
+    candidate = load(args.candidate)
+    print(f"baseline {baseline.get('commit')}  ->  candidate {candidate.get('commit')}\n")
+
+    regressions = []
+    for name, after in candidate["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            print(f"{name:<24} (new scenario)")
+            continue
+
+        changes = "  ".join(
+            f"{metric} {before[metric]:.2f}->{after[metric]:.2f} ({delta(before[metric], after[metric]):+.1f}%)"
+            for metric in METRICS
+        )
+        print(f"{name:<24} {changes}")
+
+        if delta(before["p95_ms"], after["p95_ms"]) > args.threshold:
+            regressions.append(name)
+
+    print(
+        f"\npeak_rss_mb {baseline.get('peak_rss_mb')} -> {candidate.get('peak_rss_mb')}"
+    )
+
+    if regressions:
+        print(f"p95 regressions over {args.threshold}%: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,14 @@
+import os
+
+DEFAULT_DATABASE_URL = "sqlite+aiosqlite:///./benchmarks/bench.db"
+
+
+def configure(database_url: str) -> None:
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("ADMIN_USERNAME", "bench-admin")
+    os.environ.setdefault("ADMIN_PASSWORD", "bench-password")
+    os.environ.setdefault("JWT_SECRET", "bench-secret-key-with-enough-length-for-hs256")
+    os.environ.setdefault("CLOUDINARY_CLOUD_NAME", "bench")
+    os.environ.setdefault("CLOUDINARY_API_KEY", "bench")
+    os.environ.setdefault("CLOUDINARY_API_SECRET", "bench")
+    os.environ.setdefault("CORS_ORIGINS", "http://localhost:5173")
@@ -0,0 +1,292 @@
+import argparse
+import asyncio
+import json
+import random
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.env import DEFAULT_DATABASE_URL, configure
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+class Scenario:
+    def __init__(
+        self,
+        name: str,
+        method: str,
+        build: Callable[[int], Dict[str, Any]],
+        admin: bool = False
+    ) -> None:
+        self.name = name
+        self.method = method
+        self.build = build
+        self.admin = admin
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the Anvaya API in-process")
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--wings", type=int, default=5)
+    parser.add_argument("--activities", type=int, default=500, help="Activities per wing")
+    parser.add_argument("--photos", type=int, default=500, help="Photos per wing")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario")
+    parser.add_argument("--cloudinary-latency-ms", type=float, default=50.0)
+    parser.add_argument("--only", nargs="*", help="Run only these scenarios")
+    parser.add_argument("--skip-seed", action="store_true")
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args()
+
+
+def stub_cloudinary(latency_seconds: float) -> None:
+    import cloudinary.uploader
+
+    counter = {"uploads": 0}
+
+    def fake_upload(file: Any, folder: str = "anvaya", **options: Any) -> Dict[str, Any]:
+        time.sleep(latency_seconds)
+        counter["uploads"] += 1
+        public_id = f"{folder}/bench-{counter['uploads']}"
+        return {
+            "secure_url": f"https://res.cloudinary.com/bench/image/upload/{public_id}.jpg",
+            "public_id": public_id,
+        }
+
+    def fake_destroy(public_id: str, **options: Any) -> Dict[str, Any]:
+        time.sleep(latency_seconds)
+        return {"result": "ok"}
+
+    cloudinary.uploader.upload = fake_upload
+    cloudinary.uploader.destroy = fake_destroy
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+    }
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in kilobytes on Linux and bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_scenario(
+    client: Any,
+    scenario: Scenario,
+    total: int,
+    concurrency: int,
+    headers: Dict[str, str]
+) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    indices = iter(range(total))
+
+    async def worker() -> None:
+        nonlocal errors
+        for index in indices:
+            request = scenario.build(index)
+            if scenario.admin:
+                request.setdefault("headers", {}).update(headers)
+            start = time.perf_counter()
+            response = await client.request(scenario.method, request.pop("url"), **request)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+def build_scenarios(
+    slugs: List[str],
+    wing_ids: List[int],
+    activity_ids: List[int],
+    photo_ids: List[int],
+    images: List[Tuple[str, bytes, str]],
+    rng: random.Random
+) -> List[Scenario]:
+    deletable_activities = list(activity_ids)
+    deletable_photos = list(photo_ids)
+    rng.shuffle(deletable_activities)
+    rng.shuffle(deletable_photos)
+
+    return [
+        Scenario("public_wings", "GET", lambda i: {"url": "/api/wings"}),
+        Scenario("public_wing_overview", "GET", lambda i: {
+            "url": f"/api/wings/{rng.choice(slugs)}",
+        }),
+        Scenario("public_wing_photos", "GET", lambda i: {
+            "url": f"/api/wings/{rng.choice(slugs)}/photos",
+            "params": {"limit": 50},
+        }),
+        Scenario("public_wing_activities", "GET", lambda i: {
+            "url": f"/api/wings/{rng.choice(slugs)}/activities",
+        }),
+        Scenario("public_activities", "GET", lambda i: {"url": "/api/activities"}),
+        Scenario("public_activity", "GET", lambda i: {
+            "url": f"/api/activities/{rng.choice(activity_ids)}",
+        }),
+        Scenario("public_statistics", "GET", lambda i: {
+            "url": "/api/statistics/activities",
+            "params": {"year": rng.randint(2018, 2024)} if i % 2 else {},
+        }),
+        Scenario("admin_create_activity", "POST", lambda i: {
+            "url": "/api/admin/activities",
+            "data": {
+                "wing_id": rng.choice(wing_ids),
+                "title": f"Bench activity {i}",
+                "description": "Created by the benchmark harness",
+                "activity_date": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            },
+        }, admin=True),
+        Scenario("admin_update_activity", "PUT", lambda i: {
+            "url": f"/api/admin/activities/{rng.choice(activity_ids)}",
+            "data": {"title": f"Updated by bench {i}"},
+        }, admin=True),
+        Scenario("admin_upload_photos", "POST", lambda i: {
+            "url": "/api/admin/photos",
+            "data": {"wing_id": rng.choice(wing_ids)},
+            "files": [("files", images[(i * 3 + n) % len(images)]) for n in range(3)],
+        }, admin=True),
+        Scenario("admin_delete_photo", "DELETE", lambda i: {
+            "url": f"/api/admin/photos/{deletable_photos.pop()}",
+        }, admin=True),
+        Scenario("admin_delete_activity", "DELETE", lambda i: {
+            "url": f"/api/admin/activities/{deletable_activities.pop()}",
+        }, admin=True),
+    ]
+
+
+async def main(args: argparse.Namespace) -> Dict[str, Any]:
+    configure(args.database_url)
+    stub_cloudinary(args.cloudinary_latency_ms / 1000)
+
+    import httpx
+    from sqlalchemy import select
+
+    from app.config import get_settings
+    from app.database import async_session, engine
+    from app.main import app
+    from app.models.activity import Activity
+    from app.models.photo import Photo
+    from app.models.wing import Wing
+    from benchmarks.seed import sample_images, seed_dataset
+
+    dataset: Dict[str, int] = {}
+    if not args.skip_seed:
+        print(f"Seeding {args.wings} wings x {args.activities} activities x {args.photos} photos...")
+        dataset = await seed_dataset(args.wings, args.activities, args.photos)
+
+    async with async_session() as session:
+        wings = (await session.execute(select(Wing.id, Wing.slug))).all()
+        activity_ids = list((await session.execute(select(Activity.id))).scalars().all())
+        photo_ids = list((await session.execute(select(Photo.id))).scalars().all())
+
+    images: List[Tuple[str, bytes, str]] = []
+    if not args.only or "admin_upload_photos" in args.only:
+        print(f"Generating {args.requests * 3} sample images...")
+        images = sample_images(args.requests * 3)
+
+    settings = get_settings()
+    rng = random.Random(7)
+    scenarios = build_scenarios(
+        [slug for _, slug in wings],
+        [wing_id for wing_id, _ in wings],
+        activity_ids,
+        photo_ids,
+        images,
+        rng,
+    )
+    if args.only:
+        scenarios = [scenario for scenario in scenarios if scenario.name in args.only]
+
+    transport = httpx.ASGITransport(app=app)
+    results: Dict[str, Any] = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        login = await client.post("/api/admin/login", json={
+            "username": settings.admin_username,
+            "password": settings.admin_password,
+        })
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        for scenario in scenarios:
+            total = args.requests
+            if scenario.name == "admin_delete_photo":
+                total = min(total, len(photo_ids))
+            elif scenario.name == "admin_delete_activity":
+                total = min(total, len(activity_ids))
+
+            results[scenario.name] = await run_scenario(
+                client, scenario, total, args.concurrency, headers
+            )
+            summary = results[scenario.name]
+            print(
+                f"{scenario.name:<24} {summary['throughput_rps']:>9.1f} rps  "
+                f"p50 {summary['p50_ms']:>8.2f} ms  p95 {summary['p95_ms']:>8.2f} ms  "
+                f"p99 {summary['p99_ms']:>8.2f} ms  errors {summary['errors']}"
+            )
+
+    await engine.dispose()
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds"),
+        "database": engine.dialect.name,
+        "dataset": dataset or {"wings": len(wings)},
+        "config": {
+            "concurrency": args.concurrency,
+            "requests_per_scenario": args.requests,
+            "cloudinary_latency_ms": args.cloudinary_latency_ms,
+        },
+        "peak_rss_mb": peak_rss_mb(),
+        "scenarios": results,
+    }
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    report = asyncio.run(main(arguments))
+
+    output = arguments.output
+    if output is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = report["timestamp"].replace(":", "").replace("-", "")
+        output = RESULTS_DIR / f"{stamp}-{report['commit'] or 'local'}.json"
+
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nPeak RSS: {report['peak_rss_mb']} MB")
+    print(f"Results written to {output}")
@@ -0,0 +1,122 @@
+import io
+import random
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Tuple
+
+from PIL import Image, ImageDraw
+from sqlalchemy import insert, select, text
+from sqlmodel import SQLModel
+
+from app.database import async_session, engine
+from app.migrations import MIGRATIONS, run_migrations
+from app.models.activity import Activity
+from app.models.photo import Photo
+from app.models.wing import Wing
+from app.services.statistics import StatisticsService
+
+BATCH_SIZE = 1000
+IMAGE_SIZE = (1600, 1200)
+
+
+async def reset_schema() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.execute(text("DROP TABLE IF EXISTS schema_migrations"))
+        await conn.run_sync(SQLModel.metadata.create_all)
+    await run_migrations(engine, MIGRATIONS)
+
+
+async def _insert_batches(model, rows) -> None:
+    async with async_session() as session:
+        for start in range(0, len(rows), BATCH_SIZE):
+            await session.execute(insert(model), rows[start:start + BATCH_SIZE])
+        await session.commit()
+
+
+async def seed_dataset(
+    wings: int,
+    activities_per_wing: int,
+    photos_per_wing: int,
+    seed: int = 42
+) -> Dict[str, int]:
+    rng = random.Random(seed)
+    await reset_schema()
+
+    await _insert_batches(Wing, [
+        {
+            "name": f"Wing {index}",
+            "slug": f"wing-{index}",
+            "about": "About text " * 40,
+            "vision": "Vision text " * 20,
+            "mission": "Mission text " * 30,
+        }
+        for index in range(wings)
+    ])
+
+    async with async_session() as session:
+        wing_ids = list((await session.execute(select(Wing.id))).scalars().all())
+
+    first_day = date(2018, 1, 1)
+    now = datetime(2025, 1, 1)
+
+    activities = [
+        {
+            "wing_id": wing_id,
+            "title": f"Activity {wing_id}-{index}",
+            "description": "Description of the activity. " * rng.randint(5, 40),
+            "activity_date": first_day + timedelta(days=rng.randint(0, 365 * 7)),
+            "faculty_coordinator": f"Coordinator {rng.randint(1, 50)}",
+            "report_url": None,
+            "report_cloudinary_id": None,
+            "created_at": now - timedelta(minutes=rng.randint(0, 10**6)),
+        }
+        for wing_id in wing_ids
+        for index in range(activities_per_wing)
+    ]
+    await _insert_batches(Activity, activities)
+
+    photos = [
+        {
+            "wing_id": wing_id,
+            "url": f"https://res.cloudinary.com/bench/image/upload/anvaya/{wing_id}/{index}.jpg",
+            "cloudinary_id": f"anvaya/{wing_id}/{index}",
+            "uploaded_at": now - timedelta(minutes=rng.randint(0, 10**6)),
+        }
+        for wing_id in wing_ids
+        for index in range(photos_per_wing)
+    ]
+    await _insert_batches(Photo, photos)
+
+    async with async_session() as session:
+        await StatisticsService.rebuild(session)
+
+    return {
+        "wings": len(wing_ids),
+        "activities": len(activities),
+        "photos": len(photos),
+    }
+
+
+def sample_images(count: int, seed: int = 42) -> List[Tuple[str, bytes, str]]:
+    rng = random.Random(seed)
+    noise = Image.effect_noise(IMAGE_SIZE, 48).convert("RGB")
+    gradient = Image.linear_gradient("L").resize(IMAGE_SIZE).convert("RGB")
+    base = Image.blend(gradient, noise, 0.35)
+
+    images = []
+    for index in range(count):
+        image = base.copy()
+        draw = ImageDraw.Draw(image)
+        for _ in range(12):
+            x, y = rng.randrange(IMAGE_SIZE[0] - 200), rng.randrange(IMAGE_SIZE[1] - 200)
+            color = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+            draw.rectangle((x, y, x + rng.randint(40, 200), y + rng.randint(40, 200)), fill=color)
+
+        buffer = io.BytesIO()
+        if index % 4 == 3:
+            image.save(buffer, format="PNG")
+            images.append((f"bench-{index}.png", buffer.getvalue(), "image/png"))
+        else:
+            image.save(buffer, format="JPEG", quality=90)
+            images.append((f"bench-{index}.jpg", buffer.getvalue(), "image/jpeg"))
+    return images
@@ -1,16 +1,22 @@
 import asyncio
 from sqlmodel import SQLModel
-from sqlalchemy import select
+from sqlalchemy import select, text
 from app.database import async_session, engine, init_db
+from app.migrations import MIGRATIONS, run_migrations
 from app.models.wing import Wing
 import app.models.activity
 import app.models.photo
+import app.models.activity_stat
+import app.models.wing_version
+import app.models.job
+import app.models.reconciliation_checkpoint
 
 
 async def reset_db():
     async with engine.begin() as conn:
         print("Dropping existing tables...")
         await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.execute(text("DROP TABLE IF EXISTS schema_migrations"))
         print("Creating new tables...")
         await conn.run_sync(SQLModel.metadata.create_all)
 
@@ -72,6 +78,7 @@ async def seed_wings():
 async def main():
     print("Initializing database...")
     await reset_db()
+    await run_migrations(engine, MIGRATIONS)
     print("✓ Database tables recreated!")
     
     print("\nSeeding wings data...")
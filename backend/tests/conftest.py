@@ -0,0 +1,104 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator
+from urllib.parse import parse_qs, urlparse
+
+import cloudinary
+import pytest
+
+TEST_DIR = Path(tempfile.mkdtemp(prefix="anvaya-tests-"))
+
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{TEST_DIR / 'test.db'}"
+os.environ["ADMIN_USERNAME"] = "test-admin"
+os.environ["ADMIN_PASSWORD"] = "test-password"
+os.environ["JWT_SECRET"] = "test-secret-key-with-enough-length-for-hs256"
+os.environ["CLOUDINARY_CLOUD_NAME"] = "test"
+os.environ["CLOUDINARY_API_KEY"] = "test"
+os.environ["CLOUDINARY_API_SECRET"] = "test"
+os.environ["CORS_ORIGINS"] = "http://localhost:5173"
+os.environ["JOB_WORKERS"] = "0"
+os.environ["INVALIDATION_BACKEND"] = "none"
+os.environ["SNAPSHOT_ENABLED"] = "false"
+os.environ["SNAPSHOT_DIR"] = str(TEST_DIR / "snapshot")
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from init_db import seed_wings
+
+
+class StubUploadHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(self.server.delay)
+        
+        if b"not-an-image" in body:
+            status, payload = 400, {"error": {"message": "Invalid image file"}}
+        else:
+            public_id = f"anvaya/stub/{self.server.server_port}-{self.server.uploads}"
+            self.server.uploads += 1
+            status, payload = 200, {
+                "public_id": public_id,
+                "secure_url": f"https://res.cloudinary.com/test/image/upload/{public_id}.jpg",
+                "width": 640,
+                "height": 480,
+                "bytes": len(body),
+                "format": "jpg",
+            }
+        
+        self._respond(status, payload)
+    
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        public_ids = [public_id for key, values in query.items() if key.startswith("public_ids") for public_id in values]
+        resources = [self.server.resources[public_id] for public_id in public_ids if public_id in self.server.resources]
+        self._respond(200, {"resources": resources})
+    
+    def _respond(self, status, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def upload_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubUploadHandler)
+    server.uploads = 0
+    server.resources = {}
+    server.delay = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    cloudinary.config(upload_prefix=f"http://127.0.0.1:{server.server_port}")
+    yield server
+    cloudinary.config(upload_prefix=None)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    with TestClient(app) as test_client:
+        test_client.portal.call(seed_wings)
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def admin_headers(client: TestClient) -> Dict[str, str]:
+    response = client.post(
+        "/api/admin/login",
+        json={"username": os.environ["ADMIN_USERNAME"], "password": os.environ["ADMIN_PASSWORD"]},
+    )
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
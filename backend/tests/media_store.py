@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.services.reconciliation import MediaStore, Resource
+
+
+class InMemoryMediaStore(MediaStore):
+    def __init__(self) -> None:
+        self.resources: Dict[Tuple[str, str], Resource] = {}
+        self.calls: Dict[str, int] = {}
+    
+    def add(
+        self,
+        public_id: str,
+        resource_type: str = "image",
+        created_at: Optional[datetime] = None
+    ) -> Resource:
+        resource = {
+            "public_id": public_id,
+            "resource_type": resource_type,
+            "created_at": (created_at or datetime.utcnow()).isoformat() + "Z",
+            "secure_url": f"https://res.cloudinary.com/fake/{resource_type}/upload/{public_id}",
+        }
+        self.resources[(resource_type, public_id)] = resource
+        return resource
+    
+    def _count(self, operation: str) -> None:
+        self.calls[operation] = self.calls.get(operation, 0) + 1
+    
+    async def list_resources(
+        self,
+        prefix: str,
+        resource_type: str,
+        cursor: Optional[str],
+        max_results: int
+    ) -> Tuple[List[Resource], Optional[str]]:
+        self._count("list_resources")
+        public_ids = sorted(
+            public_id
+            for kind, public_id in self.resources
+            if kind == resource_type and public_id.startswith(prefix) and public_id > (cursor or "")
+        )
+        page = public_ids[:max_results]
+        next_cursor = page[-1] if len(public_ids) > max_results else None
+        return [self.resources[(resource_type, public_id)] for public_id in page], next_cursor
+    
+    async def find_existing(self, public_ids: Set[str], resource_type: str) -> Set[str]:
+        self._count("find_existing")
+        return {
+            public_id for public_id in public_ids
+            if (resource_type, public_id) in self.resources
+        }
+    
+    async def delete_resources(self, public_ids: List[str], resource_type: str) -> Set[str]:
+        self._count("delete_resources")
+        for public_id in public_ids:
+            self.resources.pop((resource_type, public_id), None)
+        return set(public_ids)
@@ -0,0 +1,98 @@
+import json
+
+from app.services.activity_import import _read_lines
+
+
+def _titles(client, slug):
+    response = client.get("/api/activities", params={"wing": slug, "limit": 100})
+    assert response.status_code == 200, response.text
+    return {item["title"] for item in response.json()["items"]}
+
+
+def test_import_csv_upload(client, admin_headers):
+    body = (
+        "﻿wing,title,description,activity_date,faculty_coordinator\n"
+        "codezero,CSV Hackathon,\"Overnight build, with \"\"quotes\"\"\",2024-03-01,Dr. Rao\n"
+        "kalavaibhava,Kalā Utsav,\"Dance\nand music\",2024-03-02,\n"
+    ).encode("utf-8")
+    
+    response = client.post(
+        "/api/admin/activities/import",
+        files={"file": ("activities.csv", body, "text/csv")},
+        headers=admin_headers,
+    )
+    
+    assert response.status_code == 200, response.text
+    assert response.json()["rows"] == 2
+    assert response.json()["imported"] == 2
+    assert response.json()["errors"] == []
+    assert "CSV Hackathon" in _titles(client, "codezero")
+    assert "Kalā Utsav" in _titles(client, "kalavaibhava")
+
+
+def test_import_csv_reports_row_errors(client, admin_headers):
+    body = (
+        "wing,title,description,activity_date\n"
+        "codezero,CSV Valid Row,Fine,2024-04-01\n"
+        "nowhere,CSV Bad Wing,Fine,2024-04-02\n"
+    ).encode("utf-8")
+    
+    response = client.post(
+        "/api/admin/activities/import",
+        params={"skip_invalid": "true"},
+        files={"file": ("activities.csv", body, "text/csv")},
+        headers=admin_headers,
+    )
+    
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert result["imported"] == 1
+    assert result["failed"] == 1
+    assert result["errors"][0]["row"] == 3
+
+
+def test_import_ndjson_upload(client, admin_headers):
+    rows = [
+        {"wing": "ugrs", "title": "NDJSON Paper Talk", "description": "Talk", "activity_date": "2024-05-01"},
+        {"wing": "uthsaha", "title": "NDJSON Relay", "description": "Run", "activity_date": "2024-05-02"},
+    ]
+    body = "\n".join(json.dumps(row, ensure_ascii=False) for row in rows).encode("utf-8")
+    
+    response = client.post(
+        "/api/admin/activities/import",
+        files={"file": ("activities.ndjson", body, "application/x-ndjson")},
+        headers=admin_headers,
+    )
+    
+    assert response.status_code == 200, response.text
+    assert response.json()["imported"] == 2
+    assert "NDJSON Relay" in _titles(client, "uthsaha")
+
+
+def test_import_dry_run_writes_nothing(client, admin_headers):
+    body = b"wing,title,description,activity_date\nshespark,CSV Dry Run,Preview,2024-06-01\n"
+    
+    response = client.post(
+        "/api/admin/activities/import",
+        params={"dry_run": "true"},
+        files={"file": ("activities.csv", body, "text/csv")},
+        headers=admin_headers,
+    )
+    
+    assert response.status_code == 200, response.text
+    assert response.json()["dry_run"] is True
+    assert "CSV Dry Run" not in _titles(client, "shespark")
+
+
+def test_read_lines_handles_split_characters():
+    class Chunked:
+        def __init__(self, data):
+            self.data = data
+        
+        def read(self, size=-1):
+            chunk, self.data = self.data[:3], self.data[3:]
+            return chunk
+    
+    lines = list(_read_lines(Chunked("﻿a,ā\r\nb,ü\nlast".encode("utf-8"))))
+    
+    assert lines == ["a,ā\r\n", "b,ü\n", "last"]
@@ -0,0 +1,98 @@
+import asyncio
+import fnmatch
+from datetime import date
+
+from app.database import async_session
+from app.models.activity import Activity
+from app.services.cache import WINGS_LIST_KEY, InMemoryCache, RedisCache, get_cache
+from app.services.crud import CRUDService
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+    
+    async def get(self, key):
+        return self.values.get(key)
+    
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+    
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+    
+    async def scan_iter(self, match):
+        for key in list(self.values):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+
+async def _load(value):
+    return value
+
+
+def test_in_memory_cache_counts_hits_and_evicts_least_recently_used():
+    cache = InMemoryCache(max_entries=2)
+    
+    async def scenario():
+        await cache.get_or_set("a", lambda: _load(b"1"))
+        await cache.get_or_set("b", lambda: _load(b"2"))
+        await cache.get_or_set("a", lambda: _load(b"stale"))
+        await cache.get_or_set("c", lambda: _load(b"3"))
+        return await cache.get("a"), await cache.get("b")
+    
+    assert asyncio.run(scenario()) == (b"1", None)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_in_memory_cache_expires_entries():
+    cache = InMemoryCache()
+    
+    async def scenario():
+        await cache.set("wing:ugrs:detail", b"old", ttl=0)
+        return await cache.get("wing:ugrs:detail")
+    
+    assert asyncio.run(scenario()) is None
+
+
+def test_redis_cache_deletes_by_prefix():
+    cache = RedisCache(FakeRedis())
+    
+    async def scenario():
+        await cache.set("wing:ugrs:detail", b"1", ttl=60)
+        await cache.set("wing:ugrs:activities", b"2", ttl=60)
+        await cache.set("wing:uthsaha:detail", b"3", ttl=60)
+        removed = await cache.delete_prefix("wing:ugrs:")
+        return removed, await cache.get("wing:uthsaha:detail")
+    
+    assert asyncio.run(scenario()) == (2, b"3")
+
+
+async def _create_activity_without_invalidation(slug, title):
+    async with async_session() as session:
+        wing = await CRUDService.get_wing_by_slug(session, slug)
+        await CRUDService.create_activity(session, Activity(
+            wing_id=wing.id,
+            title=title,
+            description="Written without touching the cache",
+            activity_date=date(2024, 7, 1),
+        ))
+
+
+def test_wing_responses_follow_the_wing_version(client):
+    before = client.get("/api/wings/ugrs/activities")
+    detail = client.get("/api/wings/ugrs")
+    wings = client.get("/api/wings")
+    assert before.status_code == detail.status_code == wings.status_code == 200
+    
+    client.portal.call(_create_activity_without_invalidation, "ugrs", "Versioned Cache Seminar")
+    
+    titles = {item["title"] for item in client.get("/api/wings/ugrs/activities").json()["items"]}
+    latest = {item["title"] for item in client.get("/api/wings/ugrs").json()["activities"]}
+    assert "Versioned Cache Seminar" in titles
+    assert "Versioned Cache Seminar" in latest
+    assert client.get("/api/wings").headers["etag"] != wings.headers["etag"]
+    assert len([key for key in get_cache()._entries if key.startswith(WINGS_LIST_KEY)]) >= 2
@@ -0,0 +1,41 @@
+import asyncio
+import io
+import time
+
+from fastapi import UploadFile
+
+from app.services.cloudinary import upload_images_bulk
+
+UPLOAD_DELAY_SECONDS = 0.3
+
+
+def _files(*contents):
+    return [
+        UploadFile(file=io.BytesIO(content), filename=f"photo-{index}.jpg")
+        for index, content in enumerate(contents)
+    ]
+
+
+def test_bulk_upload_runs_concurrently(upload_server):
+    upload_server.delay = UPLOAD_DELAY_SECONDS
+    files = _files(*(b"image-%d" % index for index in range(4)))
+    
+    started = time.perf_counter()
+    result = asyncio.run(upload_images_bulk(files, max_concurrency=4))
+    elapsed = time.perf_counter() - started
+    
+    assert len(result["uploaded"]) == 4
+    assert result["failed"] == []
+    assert elapsed < UPLOAD_DELAY_SECONDS * 3
+    assert [outcome["index"] for outcome in result["uploaded"]] == [0, 1, 2, 3]
+
+
+def test_bulk_upload_reports_partial_failures(upload_server):
+    files = _files(b"image-a", b"not-an-image", b"image-b")
+    
+    result = asyncio.run(upload_images_bulk(files))
+    
+    assert [outcome["filename"] for outcome in result["uploaded"]] == ["photo-0.jpg", "photo-2.jpg"]
+    assert result["uploaded"][0]["width"] == 640
+    assert [outcome["index"] for outcome in result["failed"]] == [1]
+    assert "Invalid image file" in result["failed"][0]["error"]
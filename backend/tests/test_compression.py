@@ -0,0 +1,34 @@
+import asyncio
+
+from app.compression import CompressionMiddleware
+from app.services.cache import InMemoryCache
+
+
+def test_compressed_variants_are_cached_by_etag_and_encoding():
+    cache = InMemoryCache(max_entries=2)
+    middleware = CompressionMiddleware(app=None, cache=cache)
+    body = b'{"items": []}' * 200
+    
+    async def scenario():
+        gzip_body = await middleware._compress(body, "gzip", 'W/"a"')
+        await middleware._compress(body, "gzip", 'W/"a"')
+        await middleware._compress(body, "gzip", 'W/"b"')
+        return gzip_body
+    
+    assert asyncio.run(scenario())[:2] == b"\x1f\x8b"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["entries"] == 2
+
+
+def test_not_modified_responses_vary_on_accept_encoding(client):
+    first = client.get("/api/wings", headers={"Accept-Encoding": "gzip"})
+    assert first.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in first.headers["vary"]
+    
+    second = client.get(
+        "/api/wings",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]},
+    )
+    
+    assert second.status_code == 304
+    assert second.headers["vary"] == "Accept-Encoding"
@@ -0,0 +1,113 @@
+import hashlib
+import io
+import os
+
+from PIL import Image
+
+
+def _jpeg():
+    image = Image.frombytes("RGB", (32, 32), os.urandom(32 * 32 * 3))
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def _hash(content):
+    return hashlib.sha256(content).hexdigest()
+
+
+def _wing_id(client, slug):
+    response = client.get(f"/api/wings/{slug}")
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+
+def _upload(client, admin_headers, slug, *contents):
+    response = client.post(
+        "/api/admin/photos",
+        data={"wing_id": _wing_id(client, slug)},
+        files=[("files", (f"photo-{index}.jpg", content, "image/jpeg")) for index, content in enumerate(contents)],
+        headers=admin_headers,
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _create_activity(client, admin_headers, title, report):
+    response = client.post(
+        "/api/admin/activities",
+        data={
+            "wing_id": _wing_id(client, "ugrs"),
+            "title": title,
+            "description": "Report dedup",
+            "activity_date": "2024-05-01",
+        },
+        files={"report_file": ("report.pdf", report, "application/pdf")},
+        headers=admin_headers,
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_upload_reports_photo_already_in_wing(client, admin_headers, upload_server):
+    image = _jpeg()
+    first = _upload(client, admin_headers, "codezero", image)
+    
+    second = _upload(client, admin_headers, "codezero", image)
+    
+    assert second["photos"] == []
+    assert [photo["id"] for photo in second["duplicates"]] == [first["photos"][0]["id"]]
+    assert upload_server.uploads == 1
+
+
+def test_upload_reports_repeated_file_in_same_request(client, admin_headers, upload_server):
+    image, other = _jpeg(), _jpeg()
+    
+    result = _upload(client, admin_headers, "codezero", image, other, image)
+    
+    assert len(result["photos"]) == 2
+    assert result["failed"] == []
+    assert [photo["id"] for photo in result["duplicates"]] == [result["photos"][0]["id"]]
+    assert upload_server.uploads == 2
+
+
+def test_upload_reuses_photo_from_other_wing(client, admin_headers, upload_server):
+    image = _jpeg()
+    original = _upload(client, admin_headers, "codezero", image)["photos"][0]
+    
+    result = _upload(client, admin_headers, "kalavaibhava", image, image)
+    
+    assert len(result["photos"]) == 1
+    reused = result["photos"][0]
+    assert reused["wing_id"] == _wing_id(client, "kalavaibhava")
+    assert reused["cloudinary_id"] == original["cloudinary_id"]
+    assert [photo["id"] for photo in result["duplicates"]] == [reused["id"]]
+    assert upload_server.uploads == 1
+
+
+def test_activity_reuses_identical_report(client, admin_headers, upload_server):
+    report = b"%PDF-1.4\n" + os.urandom(256)
+    
+    first = _create_activity(client, admin_headers, "Report Original", report)
+    second = _create_activity(client, admin_headers, "Report Copy", report)
+    
+    assert second["report_cloudinary_id"] == first["report_cloudinary_id"]
+    assert second["report_url"] == first["report_url"]
+    assert upload_server.uploads == 1
+
+
+def test_async_upload_reuses_repeated_photo_once(client, admin_headers, upload_server):
+    image = _jpeg()
+    _upload(client, admin_headers, "codezero", image)
+    
+    response = client.post(
+        "/api/admin/photos/async",
+        data={"wing_id": _wing_id(client, "shespark")},
+        files=[("files", (f"photo-{index}.jpg", image, "image/jpeg")) for index in range(2)],
+        headers=admin_headers,
+    )
+    
+    assert response.status_code == 202, response.text
+    assert response.json() == []
+    photos = client.get("/api/wings/shespark/photos", params={"limit": 100}).json()["items"]
+    assert sum(photo["content_hash"] == _hash(image) for photo in photos) == 1
@@ -0,0 +1,103 @@
+import cloudinary.utils
+
+from app.config import get_settings
+
+settings = get_settings()
+
+
+def _wing_id(client, slug):
+    response = client.get(f"/api/wings/{slug}")
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+
+def _signed(public_id, version, **claims):
+    signature = cloudinary.utils.api_sign_request(
+        {"public_id": public_id, "version": version}, settings.cloudinary_api_secret, signature_version=1
+    )
+    return {"public_id": public_id, "version": version, "signature": signature, **claims}
+
+
+def test_signature_covers_upload_constraints(client, admin_headers):
+    response = client.post(
+        "/api/admin/photos/signature",
+        data={"wing_id": _wing_id(client, "codezero")},
+        headers=admin_headers,
+    )
+    
+    assert response.status_code == 200, response.text
+    signed = response.json()
+    assert signed["allowed_formats"] == "gif,jpeg,jpg,png,webp"
+    assert signed["transformation"] == f"c_limit,w_{settings.image_max_edge},h_{settings.image_max_edge},q_{settings.image_quality}"
+    params = {key: signed[key] for key in ("folder", "timestamp", "allowed_formats", "transformation")}
+    assert signed["signature"] == cloudinary.utils.api_sign_request(params, settings.cloudinary_api_secret)
+
+
+def test_confirm_reads_metadata_from_cloudinary(client, admin_headers, upload_server):
+    public_id = "anvaya/codezero/direct-metadata"
+    upload_server.resources[public_id] = {
+        "public_id": public_id,
+        "version": 1700000001,
+        "secure_url": f"https://res.cloudinary.com/test/image/upload/v1700000001/{public_id}.webp",
+        "width": 1600,
+        "height": 900,
+        "bytes": 123456,
+        "format": "webp",
+    }
+    
+    response = client.post(
+        "/api/admin/photos/confirm",
+        json={
+            "wing_id": _wing_id(client, "codezero"),
+            "uploads": [_signed(
+                public_id, 1700000001, format="exe", width=1, height=1, bytes=1, content_hash="0" * 64
+            )],
+        },
+        headers=admin_headers,
+    )
+    
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert result["failed"] == [] and result["duplicates"] == []
+    photo = result["photos"][0]
+    assert photo["url"] == upload_server.resources[public_id]["secure_url"]
+    assert (photo["width"], photo["height"], photo["size_bytes"], photo["format"]) == (1600, 900, 123456, "webp")
+    assert photo["content_hash"] is None
+
+
+def test_confirm_rejects_unknown_or_tampered_uploads(client, admin_headers, upload_server):
+    upload_server.resources["anvaya/codezero/direct-replaced"] = {
+        "public_id": "anvaya/codezero/direct-replaced",
+        "version": 1700000003,
+        "secure_url": "https://res.cloudinary.com/test/image/upload/v1700000003/anvaya/codezero/direct-replaced.jpg",
+        "width": 10,
+        "height": 10,
+        "bytes": 10,
+        "format": "jpg",
+    }
+    forged = _signed("anvaya/codezero/direct-forged", 1700000004)
+    forged["signature"] = "0" * 40
+    
+    response = client.post(
+        "/api/admin/photos/confirm",
+        json={
+            "wing_id": _wing_id(client, "codezero"),
+            "uploads": [
+                _signed("anvaya/codezero/direct-missing", 1700000002, original_filename="missing.jpg"),
+                _signed("anvaya/codezero/direct-replaced", 1700000002, original_filename="replaced.jpg"),
+                _signed("anvaya/ugrs/direct-elsewhere", 1700000005, original_filename="elsewhere.jpg"),
+                forged,
+            ],
+        },
+        headers=admin_headers,
+    )
+    
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert result["photos"] == []
+    assert {failure["filename"]: failure["error"] for failure in result["failed"]} == {
+        "elsewhere.jpg": "Upload is outside this wing's folder",
+        "anvaya/codezero/direct-forged": "Invalid upload signature",
+        "missing.jpg": "Upload not found in Cloudinary",
+        "replaced.jpg": "Upload not found in Cloudinary",
+    }
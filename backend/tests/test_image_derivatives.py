@@ -0,0 +1,53 @@
+from app.database import async_session
+from app.models.photo import Photo
+from app.services.crud import CRUDService
+from app.services.image_derivatives import build_derivatives, srcset_widths
+
+
+def test_srcset_never_upscales():
+    assert srcset_widths(800) == [320, 640, 800]
+    assert srcset_widths(4000) == [320, 640, 960, 1280, 1920]
+    assert srcset_widths(None) == [320, 640, 960, 1280, 1920]
+
+
+def test_build_derivatives_urls():
+    derivatives = build_derivatives("demo", "anvaya/ugrs/group photo", width=1000, format="PNG")
+    
+    base = "https://res.cloudinary.com/demo/image/upload"
+    assert derivatives["thumbnail"] == f"{base}/c_fill,g_auto,h_400,w_400,q_auto/anvaya/ugrs/group%20photo.png"
+    assert derivatives["medium"] == f"{base}/c_limit,w_960,q_auto/anvaya/ugrs/group%20photo.png"
+    assert derivatives["srcset"]["webp"].split(", ")[-1] == (
+        f"{base}/c_limit,w_1000,q_auto/anvaya/ugrs/group%20photo.webp 1000w"
+    )
+    assert set(derivatives["srcset"]) == {"avif", "webp"}
+
+
+def test_build_derivatives_falls_back_to_jpg_for_non_web_formats():
+    derivatives = build_derivatives("demo", "anvaya/ugrs/scan", format="heic", base_url="http://cdn.test")
+    
+    assert derivatives["full"] == "http://cdn.test/demo/image/upload/c_limit,w_1920,q_auto/anvaya/ugrs/scan.jpg"
+
+
+async def _add_photo(slug):
+    async with async_session() as session:
+        wing = await CRUDService.get_wing_by_slug(session, slug)
+        await CRUDService.create_photo(session, Photo(
+            wing_id=wing.id,
+            url="https://res.cloudinary.com/test/image/upload/anvaya/shespark/derived.jpg",
+            cloudinary_id="anvaya/shespark/derived",
+            width=1200,
+            height=800,
+            size_bytes=250000,
+            format="jpg",
+        ))
+
+
+def test_photo_responses_include_derivatives(client):
+    client.portal.call(_add_photo, "shespark")
+    
+    photos = client.get("/api/wings/shespark/photos").json()["items"]
+    photo = next(item for item in photos if item["cloudinary_id"] == "anvaya/shespark/derived")
+    
+    assert photo["width"] == 1200
+    assert photo["derivatives"]["thumbnail"].endswith("/anvaya/shespark/derived.jpg")
+    assert photo["derivatives"]["srcset"]["avif"].endswith("derived.avif 1200w")
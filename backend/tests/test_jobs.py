@@ -0,0 +1,140 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, update
+
+from app.database import async_session
+from app.models.job import Job
+from app.services.jobs import DEAD, PENDING, SUCCEEDED, JobService, JobWorker, job_handler, settings
+
+FLAKY_JOB = "test_flaky"
+RECORD_JOB = "test_record"
+
+flaky_failures = {"remaining": 0}
+recorded = []
+
+
+@job_handler(FLAKY_JOB)
+async def run_flaky(payload):
+    if flaky_failures["remaining"] > 0:
+        flaky_failures["remaining"] -= 1
+        raise RuntimeError("upstream unavailable")
+
+
+@job_handler(RECORD_JOB)
+async def run_record(payload):
+    await asyncio.sleep(0.01)
+    recorded.append(payload["n"])
+
+
+async def _clear_jobs():
+    async with async_session() as session:
+        await session.execute(delete(Job))
+        await session.commit()
+
+
+async def _enqueue(kind, payloads, max_attempts=None):
+    async with async_session() as session:
+        jobs = [JobService.enqueue(session, kind, payload, max_attempts=max_attempts) for payload in payloads]
+        await session.commit()
+        return [job.id for job in jobs]
+
+
+async def _get(job_id):
+    async with async_session() as session:
+        return await JobService.get_job(session, job_id)
+
+
+async def _make_due(job_id):
+    async with async_session() as session:
+        await session.execute(update(Job).where(Job.id == job_id).values(run_at=datetime.utcnow()))
+        await session.commit()
+
+
+@pytest.fixture
+def worker(client):
+    client.portal.call(_clear_jobs)
+    yield JobWorker(concurrency=4, poll_interval=0.05)
+    client.portal.call(_clear_jobs)
+
+
+def test_failed_job_backs_off_exponentially(client, worker):
+    flaky_failures["remaining"] = 2
+    job_id, = client.portal.call(_enqueue, FLAKY_JOB, [{}], 5)
+    base = timedelta(seconds=settings.job_retry_base_seconds)
+    
+    for attempt in (1, 2):
+        before = datetime.utcnow()
+        assert client.portal.call(worker.run_once) is True
+        job = client.portal.call(_get, job_id)
+        delay = job.run_at - before
+        
+        assert job.status == PENDING
+        assert job.attempts == attempt
+        assert "upstream unavailable" in job.last_error
+        assert base * 2 ** (attempt - 1) * 0.5 - timedelta(seconds=1) <= delay <= base * 2 ** (attempt - 1)
+        assert client.portal.call(worker.run_once) is False
+        client.portal.call(_make_due, job_id)
+    
+    assert client.portal.call(worker.run_once) is True
+    assert client.portal.call(_get, job_id).status == SUCCEEDED
+
+
+def test_job_is_dead_after_max_attempts_and_can_be_retried(client, admin_headers, worker):
+    flaky_failures["remaining"] = 3
+    job_id, = client.portal.call(_enqueue, FLAKY_JOB, [{}], 3)
+    
+    for _ in range(3):
+        client.portal.call(_make_due, job_id)
+        assert client.portal.call(worker.run_once) is True
+    
+    job = client.portal.call(_get, job_id)
+    assert job.status == DEAD
+    assert job.attempts == 3
+    assert client.portal.call(worker.run_once) is False
+    
+    listed = client.get("/api/admin/jobs", params={"status": DEAD}, headers=admin_headers).json()
+    assert [item["id"] for item in listed["jobs"]] == [job_id]
+    
+    response = client.post(f"/api/admin/jobs/{job_id}/retry", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert response.json()["status"] == PENDING
+    assert response.json()["attempts"] == 0
+    
+    assert client.portal.call(worker.run_once) is True
+    assert client.portal.call(_get, job_id).status == SUCCEEDED
+    assert client.post(f"/api/admin/jobs/{job_id}/retry", headers=admin_headers).status_code == 422
+
+
+def test_concurrent_workers_claim_each_job_once(client, worker):
+    recorded.clear()
+    job_ids = client.portal.call(_enqueue, RECORD_JOB, [{"n": n} for n in range(20)])
+    
+    async def drain():
+        worker.start()
+        try:
+            for _ in range(200):
+                if len(recorded) >= 20:
+                    break
+                await asyncio.sleep(0.05)
+        finally:
+            await worker.stop()
+    
+    client.portal.call(drain)
+    
+    assert sorted(recorded) == list(range(20))
+    assert {client.portal.call(_get, job_id).attempts for job_id in job_ids} == {1}
+
+
+def test_claim_skips_jobs_already_claimed(client, worker):
+    job_id, = client.portal.call(_enqueue, RECORD_JOB, [{"n": 0}])
+    
+    async def claim_twice():
+        async with async_session() as first, async_session() as second:
+            return await JobService.claim(first), await JobService.claim(second)
+    
+    claimed, second = client.portal.call(claim_twice)
+    
+    assert claimed.id == job_id
+    assert second is None
@@ -0,0 +1,41 @@
+import json
+import os
+
+from app.metrics import Counter, Gauge, Histogram, Registry, SharedMetrics
+
+
+def _registry():
+    registry = Registry()
+    requests = registry.register(Counter("requests_total", "Requests.", ("route",)))
+    in_flight = registry.register(Gauge("in_flight", "In flight."))
+    latency = registry.register(Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0)))
+    return registry, requests, in_flight, latency
+
+
+def test_shared_metrics_merge_workers(tmp_path):
+    registry, requests, in_flight, latency = _registry()
+    requests.inc("/api/wings", amount=2)
+    in_flight.inc()
+    latency.observe(0.05)
+    
+    other, other_requests, other_in_flight, other_latency = _registry()
+    other_requests.inc("/api/wings", amount=3)
+    other_in_flight.inc(amount=5)
+    other_latency.observe(0.5)
+    (tmp_path / "999999999.json").write_text(json.dumps({"pid": 999999999, "metrics": other.collect()}))
+    
+    body = SharedMetrics(registry, tmp_path, interval=5).render()
+    
+    assert 'requests_total{route="/api/wings"} 5' in body
+    assert 'latency_seconds_bucket{le="0.1"} 1' in body
+    assert 'latency_seconds_bucket{le="1.0"} 2' in body
+    assert "latency_seconds_count 2" in body
+    assert "in_flight 1\n" in body
+    assert (tmp_path / f"{os.getpid()}.json").exists()
+
+
+def test_single_process_render_is_unchanged():
+    registry, requests, _, _ = _registry()
+    requests.inc("/api/wings")
+    
+    assert 'requests_total{route="/api/wings"} 1' in registry.render()
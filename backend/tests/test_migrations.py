@@ -0,0 +1,20 @@
+from app.database import engine
+from app.migrations import MIGRATIONS, get_applied_versions, run_migrations
+from app.migrations.explain import find_sequential_scans
+
+
+async def _upgrade():
+    await run_migrations(engine, MIGRATIONS)
+    return await get_applied_versions(engine)
+
+
+def test_all_migrations_apply(client):
+    applied = client.portal.call(_upgrade)
+    
+    assert applied >= {migration.VERSION for migration in MIGRATIONS}
+
+
+def test_hot_queries_use_indexes(client):
+    client.portal.call(_upgrade)
+    
+    assert client.portal.call(find_sequential_scans, engine) == {}
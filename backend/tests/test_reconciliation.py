@@ -0,0 +1,151 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, select
+
+from app.database import async_session
+from app.models.photo import Photo
+from app.models.reconciliation_checkpoint import ReconciliationCheckpoint
+from app.services.crud import CRUDService
+from app.services.jobs import JobService
+from app.services.reconciliation import MediaReconciler, MediaStore
+from tests.media_store import InMemoryMediaStore
+
+GRACE = timedelta(hours=1)
+OLD = datetime.utcnow() - timedelta(days=2)
+
+
+async def _reset_checkpoints():
+    async with async_session() as session:
+        await session.execute(delete(ReconciliationCheckpoint))
+        await session.commit()
+
+
+async def _add_photos(slug, public_ids):
+    async with async_session() as session:
+        wing = await CRUDService.get_wing_by_slug(session, slug)
+        for public_id in public_ids:
+            session.add(Photo(wing_id=wing.id, url=f"https://example.com/{public_id}", cloudinary_id=public_id))
+        await session.commit()
+
+
+async def _stored_photo_ids(public_ids):
+    async with async_session() as session:
+        result = await session.execute(select(Photo.cloudinary_id).where(Photo.cloudinary_id.in_(public_ids)))
+        return set(result.scalars().all())
+
+
+async def _checkpoint(scope):
+    async with async_session() as session:
+        return await session.get(ReconciliationCheckpoint, scope)
+
+
+async def _pending_deletes(public_ids):
+    async with async_session() as session:
+        JobService.enqueue_media_delete(session, "anvaya/ugrs/pending-single")
+        JobService.enqueue_media_delete_many(
+            session, ["anvaya/ugrs/pending-bulk-1", "anvaya/ugrs/pending-bulk-2"]
+        )
+        await session.commit()
+        return await MediaReconciler(MediaStore())._pending_deletes(session, public_ids)
+
+
+def test_report_finds_orphans_and_dangling_rows(client):
+    store = InMemoryMediaStore()
+    store.add("anvaya/codezero/linked", created_at=OLD)
+    store.add("anvaya/codezero/orphan", created_at=OLD)
+    store.add("anvaya/codezero/too-new")
+    client.portal.call(_add_photos, "codezero", ["anvaya/codezero/linked", "anvaya/codezero/missing"])
+    client.portal.call(_reset_checkpoints)
+    
+    report = client.portal.call(MediaReconciler(store, grace_period=GRACE).run)
+    
+    assert report["complete"] is True
+    remote = report["scopes"]["remote:codezero:image"]
+    assert remote["scanned"] == 3
+    assert remote["orphan_samples"] == ["anvaya/codezero/orphan"]
+    assert "anvaya/codezero/missing" in report["scopes"]["database:photos"]["dangling_samples"]
+    assert "anvaya/codezero/linked" not in report["scopes"]["database:photos"]["dangling_samples"]
+    assert ("image", "anvaya/codezero/orphan") in store.resources
+
+
+def test_delete_removes_only_orphans(client):
+    store = InMemoryMediaStore()
+    store.add("anvaya/kalavaibhava/linked", created_at=OLD)
+    store.add("anvaya/kalavaibhava/orphan", created_at=OLD)
+    client.portal.call(_add_photos, "kalavaibhava", ["anvaya/kalavaibhava/linked"])
+    client.portal.call(_reset_checkpoints)
+    
+    report = client.portal.call(MediaReconciler(store, action="delete", grace_period=GRACE).run)
+    
+    assert report["scopes"]["remote:kalavaibhava:image"]["deleted"] == 1
+    assert set(store.resources) == {("image", "anvaya/kalavaibhava/linked")}
+
+
+def test_interrupted_scan_resumes_from_checkpoint(client):
+    class RecordingStore(InMemoryMediaStore):
+        def __init__(self):
+            super().__init__()
+            self.listed = []
+        
+        async def list_resources(self, prefix, resource_type, cursor, max_results):
+            if prefix == "anvaya/uthsaha/" and resource_type == "image":
+                self.listed.append(cursor)
+            return await super().list_resources(prefix, resource_type, cursor, max_results)
+    
+    store = RecordingStore()
+    for number in range(5):
+        store.add(f"anvaya/uthsaha/orphan-{number}", created_at=OLD)
+    reconciler = MediaReconciler(store, batch_size=2, grace_period=GRACE)
+    
+    for budget in range(1, 20):
+        client.portal.call(_reset_checkpoints)
+        store.listed.clear()
+        report = client.portal.call(reconciler.run, budget)
+        if store.listed:
+            break
+    
+    assert report["complete"] is False
+    assert client.portal.call(_checkpoint, "remote:uthsaha:image").cursor == "anvaya/uthsaha/orphan-1"
+    
+    report = client.portal.call(reconciler.run)
+    
+    checkpoint = client.portal.call(_checkpoint, "remote:uthsaha:image")
+    assert report["complete"] is True
+    assert store.listed == [None, "anvaya/uthsaha/orphan-1", "anvaya/uthsaha/orphan-3"]
+    assert checkpoint.cursor is None
+    assert checkpoint.stats["scanned"] == 5
+    assert checkpoint.stats["orphaned"] == 5
+    assert checkpoint.completed_at is not None
+
+
+def test_pending_deletes_match_single_and_bulk_jobs(client):
+    public_ids = {
+        "anvaya/ugrs/pending-single",
+        "anvaya/ugrs/pending-bulk-2",
+        "anvaya/ugrs/not-queued",
+    }
+    
+    pending = client.portal.call(_pending_deletes, public_ids)
+    
+    assert pending == {"anvaya/ugrs/pending-single", "anvaya/ugrs/pending-bulk-2"}
+
+
+def test_relink_skips_images_queued_for_deletion(client):
+    store = InMemoryMediaStore()
+    store.add("anvaya/shespark/queued", created_at=OLD)
+    store.add("anvaya/shespark/recovered", created_at=OLD)
+    
+    async def queue_delete():
+        async with async_session() as session:
+            JobService.enqueue_media_delete_many(session, ["anvaya/shespark/queued"])
+            await session.commit()
+    
+    client.portal.call(queue_delete)
+    client.portal.call(_reset_checkpoints)
+    
+    report = client.portal.call(MediaReconciler(store, action="relink", grace_period=GRACE).run)
+    
+    assert report["scopes"]["remote:shespark:image"]["relinked"] == 1
+    assert client.portal.call(
+        _stored_photo_ids, ["anvaya/shespark/queued", "anvaya/shespark/recovered"]
+    ) == {"anvaya/shespark/recovered"}
@@ -0,0 +1,16 @@
+from app import serve
+
+
+def test_worker_count_uses_available_cpus_with_cap(monkeypatch):
+    monkeypatch.setattr(serve.settings, "web_workers", 0)
+    monkeypatch.setattr(serve.settings, "web_workers_max", 4)
+    monkeypatch.setattr(serve.os, "sched_getaffinity", lambda pid: {0, 1}, raising=False)
+    assert serve.worker_count() == 2
+    
+    monkeypatch.setattr(serve.os, "sched_getaffinity", lambda pid: set(range(64)), raising=False)
+    assert serve.worker_count() == 4
+
+
+def test_worker_count_prefers_explicit_setting(monkeypatch):
+    monkeypatch.setattr(serve.settings, "web_workers", 6)
+    assert serve.worker_count() == 6
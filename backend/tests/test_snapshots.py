@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from app.services import snapshots
+from app.services.snapshots import MANIFEST_FILE, SnapshotService
+
+
+def _manifest(root):
+    return json.loads((root / MANIFEST_FILE).read_text())
+
+
+def _paths(manifest):
+    return {
+        logical: entry["path"]
+        for scope in manifest["scopes"].values()
+        for logical, entry in scope["files"].items()
+    }
+
+
+def _wing_ids(client):
+    return {wing["slug"]: wing["id"] for wing in client.get("/api/wings").json()}
+
+
+@pytest.fixture
+def retain(monkeypatch):
+    def set_retain(seconds):
+        monkeypatch.setattr(snapshots.settings, "snapshot_retain_seconds", seconds)
+    return set_retain
+
+
+def test_partial_refresh_builds_missing_wings(client, tmp_path):
+    wing_ids = _wing_ids(client)
+    
+    client.portal.call(SnapshotService.refresh, [wing_ids["codezero"]], False, tmp_path)
+    
+    manifest = _manifest(tmp_path)
+    assert set(manifest["scopes"]) == {"shared", *wing_ids}
+    for logical, path in _paths(manifest).items():
+        stem = logical.rsplit(".", 1)[0]
+        assert path.startswith(stem + ".") and path != logical
+        assert (tmp_path / path).exists()
+        assert (tmp_path / (path + ".gz")).exists()
+    assert json.loads((tmp_path / _paths(manifest)["api/wings.json"]).read_text())
+
+
+def test_changed_file_gets_new_path_and_old_one_is_retained(client, admin_headers, tmp_path, retain):
+    wing_ids = _wing_ids(client)
+    retain(3600)
+    client.portal.call(SnapshotService.refresh, None, False, tmp_path)
+    before = _paths(_manifest(tmp_path))
+    
+    response = client.post(
+        "/api/admin/activities",
+        data={
+            "wing_id": wing_ids["uthsaha"],
+            "title": "Snapshot Refresh",
+            "description": "Changes the wing file",
+            "activity_date": "2024-06-01",
+        },
+        headers=admin_headers,
+    )
+    assert response.status_code == 200, response.text
+    client.portal.call(SnapshotService.refresh, [wing_ids["uthsaha"]], False, tmp_path)
+    
+    manifest = _manifest(tmp_path)
+    after = _paths(manifest)
+    old_path = before["api/wings/uthsaha.json"]
+    assert after["api/wings/uthsaha.json"] != old_path
+    assert after["api/wings/codezero.json"] == before["api/wings/codezero.json"]
+    assert "Snapshot Refresh" in (tmp_path / after["api/wings/uthsaha.json"]).read_text()
+    assert (tmp_path / old_path).exists()
+    assert old_path in manifest["retired"]
+    
+    retain(0)
+    client.portal.call(SnapshotService.refresh, None, False, tmp_path)
+    
+    assert not (tmp_path / old_path).exists()
+    assert not (tmp_path / (old_path + ".gz")).exists()
+    assert old_path not in _manifest(tmp_path)["retired"]
+    assert (tmp_path / after["api/wings/uthsaha.json"]).exists()
@@ -45,7 +45,9 @@ const ImageSlideshow: React.FC<ImageSlideshowProps> = ({
       <AnimatePresence mode="wait">
         <motion.img
           key={currentIndex}
-          src={photos[currentIndex].url}
+          src={photos[currentIndex].derivatives?.medium ?? photos[currentIndex].url}
+          srcSet={photos[currentIndex].derivatives?.srcset.webp}
+          sizes="(min-width: 1024px) 64rem, 100vw"
           alt={`Slide ${currentIndex + 1}`}
           className="w-full h-full object-cover"
           initial={{ opacity: 0 }}
@@ -2,6 +2,7 @@ import React, { useState } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import { X } from 'lucide-react';
 import { Photo } from '@/types/photo';
+import ResponsiveImage from './ResponsiveImage';
 
 interface PhotoGalleryProps {
   photos: Photo[];
@@ -31,8 +32,10 @@ const PhotoGallery: React.FC<PhotoGalleryProps> = ({ photos }) => {
             className="aspect-square rounded-lg overflow-hidden cursor-pointer shadow-sm hover:shadow-md"
             onClick={() => setSelectedPhoto(photo)}
           >
-            <img
-              src={photo.url}
+            <ResponsiveImage
+              photo={photo}
+              variant="thumbnail"
+              sizes="(min-width: 1024px) 25vw, (min-width: 768px) 33vw, (min-width: 640px) 50vw, 100vw"
               alt={`Photo ${photo.id}`}
               className="w-full h-full object-cover"
               loading="lazy"
@@ -60,8 +63,10 @@ const PhotoGallery: React.FC<PhotoGalleryProps> = ({ photos }) => {
               >
                 <X size={32} />
               </button>
-              <img
-                src={selectedPhoto.url}
+              <ResponsiveImage
+                photo={selectedPhoto}
+                variant="full"
+                sizes="(min-width: 1024px) 64rem, 100vw"
                 alt="Full size"
                 className="max-w-full max-h-[90vh] object-contain rounded-lg"
               />
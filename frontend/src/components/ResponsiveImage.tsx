@@ -0,0 +1,37 @@
+import React from 'react';
+import { Photo } from '@/types/photo';
+
+interface ResponsiveImageProps extends React.ImgHTMLAttributes<HTMLImageElement> {
+  photo: Photo;
+  variant: 'thumbnail' | 'medium' | 'full';
+  sizes?: string;
+}
+
+const ResponsiveImage: React.FC<ResponsiveImageProps> = ({
+  photo,
+  variant,
+  sizes = '100vw',
+  ...imgProps
+}) => {
+  const derivatives = photo.derivatives;
+
+  if (!derivatives) {
+    return <img src={photo.url} {...imgProps} />;
+  }
+
+  return (
+    <picture className="contents">
+      {Object.entries(derivatives.srcset).map(([format, srcSet]) => (
+        <source key={format} type={`image/${format}`} srcSet={srcSet} sizes={sizes} />
+      ))}
+      <img
+        src={derivatives[variant]}
+        width={photo.width ?? undefined}
+        height={photo.height ?? undefined}
+        {...imgProps}
+      />
+    </picture>
+  );
+};
+
+export default ResponsiveImage;
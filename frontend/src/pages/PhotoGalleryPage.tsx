@@ -21,7 +21,7 @@ const PhotoGalleryPage: React.FC = () => {
         setLoading(true);
         setError(null);
         const data = await publicApi.getWingPhotos(slug);
-        setPhotos(data);
+        setPhotos(data.items);
       } catch (err) {
         setError('Failed to load photos. Please try again later.');
         console.error(err);
@@ -15,6 +15,7 @@ const WingPage: React.FC = () => {
   const [wing, setWing] = useState<WingWithRelations | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     const fetchWingData = async () => {
@@ -36,6 +37,26 @@ const WingPage: React.FC = () => {
     fetchWingData();
   }, [slug]);
 
+  const loadMoreActivities = async () => {
+    if (!slug || !wing?.activities_next_cursor) return;
+
+    try {
+      setLoadingMore(true);
+      const page = await publicApi.getWingActivities(slug, {
+        cursor: wing.activities_next_cursor,
+      });
+      setWing({
+        ...wing,
+        activities: [...wing.activities, ...page.items],
+        activities_next_cursor: page.next_cursor,
+      });
+    } catch (err) {
+      console.error(err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   if (loading) {
     return (
       <div className="flex items-center justify-center min-h-[60vh]">
@@ -85,12 +106,12 @@ const WingPage: React.FC = () => {
               )}
             </div>
 
-            {wing.photos.length > 0 && (
+            {wing.photo_count > 0 && (
               <div className="mt-8 text-center">
                 <Link to={getWingGalleryRoute(slug!)}>
                   <Button variant="outline" className="inline-flex items-center text-white border-white hover:bg-white/20 hover:text-white backdrop-blur-sm transition-all duration-300">
                     <Image size={20} className="mr-2" />
-                    View Full Gallery ({wing.photos.length} photos)
+                    View Full Gallery ({wing.photo_count} photos)
                   </Button>
                 </Link>
               </div>
@@ -133,6 +154,15 @@ const WingPage: React.FC = () => {
               {wing.activities.map((activity) => (
                 <ActivityCard key={activity.id} activity={activity} />
               ))}
+              {wing.activities_next_cursor && (
+                <div className="text-center">
+                  <Button variant="outline" onClick={loadMoreActivities} disabled={loadingMore}>
+                    {loadingMore
+                      ? 'Loading...'
+                      : `Load More (${wing.activity_count - wing.activities.length} remaining)`}
+                  </Button>
+                </div>
+              )}
             </div>
           ) : (
             <div className="text-center py-16 bg-primary-50 rounded-2xl border border-primary-100">
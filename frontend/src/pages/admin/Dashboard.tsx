@@ -16,9 +16,12 @@ const Dashboard: React.FC = () => {
   const [activeTab, setActiveTab] = useState<'photos' | 'activities'>('photos');
   
   const [photos, setPhotos] = useState<Photo[]>([]);
+  const [photosCursor, setPhotosCursor] = useState<string | null>(null);
   const [uploadingPhotos, setUploadingPhotos] = useState(false);
   
   const [activities, setActivities] = useState<Activity[]>([]);
+  const [activitiesCursor, setActivitiesCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [showActivityForm, setShowActivityForm] = useState(false);
   const [activityForm, setActivityForm] = useState({
     title: '',
@@ -60,16 +63,41 @@ const Dashboard: React.FC = () => {
     try {
       if (activeTab === 'photos') {
         const data = await publicApi.getWingPhotos(wing.slug);
-        setPhotos(data);
+        setPhotos(data.items);
+        setPhotosCursor(data.next_cursor);
       } else {
         const data = await publicApi.getWingActivities(wing.slug);
-        setActivities(data);
+        setActivities(data.items);
+        setActivitiesCursor(data.next_cursor);
       }
     } catch (error) {
       console.error('Failed to fetch wing data:', error);
     }
   };
 
+  const loadMore = async () => {
+    const wing = wings.find((w) => w.id === selectedWing);
+    const cursor = activeTab === 'photos' ? photosCursor : activitiesCursor;
+    if (!wing || !cursor) return;
+
+    try {
+      setLoadingMore(true);
+      if (activeTab === 'photos') {
+        const page = await publicApi.getWingPhotos(wing.slug, { cursor });
+        setPhotos((current) => [...current, ...page.items]);
+        setPhotosCursor(page.next_cursor);
+      } else {
+        const page = await publicApi.getWingActivities(wing.slug, { cursor });
+        setActivities((current) => [...current, ...page.items]);
+        setActivitiesCursor(page.next_cursor);
+      }
+    } catch (error) {
+      console.error('Failed to load more wing data:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handlePhotoUpload = async (e: React.ChangeEvent<HTMLInputElement>) => {
     if (!e.target.files || !selectedWing) return;
     
@@ -77,9 +105,21 @@ const Dashboard: React.FC = () => {
     setUploadingPhotos(true);
 
     try {
-      await adminApi.uploadPhotos(selectedWing, files);
+      const result = await adminApi.uploadPhotos(selectedWing, files);
       await fetchWingData();
-      alert('Photos uploaded successfully!');
+      if (result.failed.length) {
+        alert(
+          `Uploaded ${result.photos.length} photos. Failed: ` +
+            result.failed.map((failure) => failure.filename).join(', ')
+        );
+      } else if (result.duplicates.length) {
+        alert(
+          `Uploaded ${result.photos.length} photos. ` +
+            `Skipped ${result.duplicates.length} already in this wing.`
+        );
+      } else {
+        alert('Photos uploaded successfully!');
+      }
     } catch (error) {
       alert('Failed to upload photos');
       console.error(error);
@@ -223,8 +263,9 @@ const Dashboard: React.FC = () => {
                 {photos.map((photo) => (
                   <div key={photo.id} className="relative group">
                     <img
-                      src={photo.url}
+                      src={photo.derivatives?.thumbnail ?? photo.url}
                       alt={`Photo ${photo.id}`}
+                      loading="lazy"
                       className="w-full aspect-square object-cover rounded-lg"
                     />
                     <button
@@ -236,6 +277,13 @@ const Dashboard: React.FC = () => {
                   </div>
                 ))}
               </div>
+              {photosCursor && (
+                <div className="mt-6 text-center">
+                  <Button variant="outline" onClick={loadMore} disabled={loadingMore}>
+                    {loadingMore ? 'Loading...' : 'Load More'}
+                  </Button>
+                </div>
+              )}
             </Card>
           </div>
         )}
@@ -349,6 +397,13 @@ const Dashboard: React.FC = () => {
                   </div>
                 ))}
               </div>
+              {activitiesCursor && (
+                <div className="mt-6 text-center">
+                  <Button variant="outline" onClick={loadMore} disabled={loadingMore}>
+                    {loadingMore ? 'Loading...' : 'Load More'}
+                  </Button>
+                </div>
+              )}
             </Card>
           </div>
         )}
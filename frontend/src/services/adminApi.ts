@@ -1,7 +1,18 @@
+import axios from 'axios';
 import api, { setAuthToken } from './api';
 import { LoginCredentials, AuthToken } from '@/types/auth';
 import { Activity } from '@/types/activity';
-import { Photo } from '@/types/photo';
+import {
+  DirectUpload,
+  Photo,
+  PhotoHashLookupResponse,
+  PhotoUploadFailure,
+  PhotoUploadResponse,
+  PhotoUploadSignature,
+} from '@/types/photo';
+
+const DIRECT_UPLOAD_CONCURRENCY = 4;
+const HASH_LOOKUP_BATCH = 200;
 
 export interface CreateActivityParams {
   wingId: number;
@@ -31,25 +42,140 @@ export async function login(credentials: LoginCredentials): Promise<AuthToken> {
   return response.data;
 }
 
-export async function uploadPhotos(wingId: number, files: File[]): Promise<Photo[]> {
-  if (!files.length) {
-    throw new Error('At least one file is required');
-  }
-
+export async function getUploadSignature(wingId: number): Promise<PhotoUploadSignature> {
   const formData = new FormData();
   formData.append('wing_id', wingId.toString());
-  
-  files.forEach((file) => {
-    formData.append('files', file);
-  });
 
-  const response = await api.post<Photo[]>('/api/admin/photos', formData, {
+  const response = await api.post<PhotoUploadSignature>('/api/admin/photos/signature', formData, {
     headers: { 'Content-Type': 'multipart/form-data' },
   });
-  
+
   return response.data;
 }
 
+async function hashFile(file: File): Promise<string | undefined> {
+  if (!globalThis.crypto?.subtle) return undefined;
+
+  const digest = await crypto.subtle.digest('SHA-256', await file.arrayBuffer());
+  return Array.from(new Uint8Array(digest), (byte) => byte.toString(16).padStart(2, '0')).join('');
+}
+
+export async function lookupPhotoHashes(
+  wingId: number,
+  contentHashes: string[]
+): Promise<Record<string, Photo>> {
+  const existing: Record<string, Photo> = {};
+
+  for (let start = 0; start < contentHashes.length; start += HASH_LOOKUP_BATCH) {
+    const response = await api.post<PhotoHashLookupResponse>('/api/admin/photos/lookup', {
+      wing_id: wingId,
+      content_hashes: contentHashes.slice(start, start + HASH_LOOKUP_BATCH),
+    });
+    Object.assign(existing, response.data.existing);
+  }
+
+  return existing;
+}
+
+async function uploadToCloudinary(
+  file: File,
+  signature: PhotoUploadSignature
+): Promise<DirectUpload> {
+  const formData = new FormData();
+  formData.append('file', file);
+  formData.append('api_key', signature.api_key);
+  formData.append('folder', signature.folder);
+  formData.append('timestamp', signature.timestamp.toString());
+  formData.append('allowed_formats', signature.allowed_formats);
+  formData.append('transformation', signature.transformation);
+  formData.append('signature', signature.signature);
+
+  const response = await axios.post<DirectUpload>(signature.upload_url, formData);
+  const { public_id, version } = response.data;
+
+  return {
+    public_id,
+    version,
+    signature: response.data.signature,
+    original_filename: file.name,
+  };
+}
+
+export async function confirmUploads(
+  wingId: number,
+  uploads: DirectUpload[]
+): Promise<PhotoUploadResponse> {
+  const response = await api.post<PhotoUploadResponse>('/api/admin/photos/confirm', {
+    wing_id: wingId,
+    uploads,
+  });
+
+  return response.data;
+}
+
+export async function uploadPhotos(
+  wingId: number,
+  files: File[]
+): Promise<PhotoUploadResponse> {
+  if (!files.length) {
+    throw new Error('At least one file is required');
+  }
+
+  const hashes = await Promise.all(files.map(hashFile));
+  const known = hashes.filter((hash): hash is string => Boolean(hash));
+  const existing = known.length ? await lookupPhotoHashes(wingId, [...new Set(known)]) : {};
+
+  const seen = new Set<string>();
+  const duplicates: Photo[] = [];
+  const pending: File[] = [];
+  files.forEach((file, index) => {
+    const hash = hashes[index];
+    if (hash && existing[hash]) {
+      duplicates.push(existing[hash]);
+    } else if (!hash || !seen.has(hash)) {
+      if (hash) seen.add(hash);
+      pending.push(file);
+    }
+  });
+
+  if (!pending.length) {
+    return { photos: [], failed: [], duplicates };
+  }
+
+  const signature = await getUploadSignature(wingId);
+  const uploads: DirectUpload[] = [];
+  const failed: PhotoUploadFailure[] = [];
+
+  const worker = async () => {
+    for (let file = pending.shift(); file; file = pending.shift()) {
+      try {
+        uploads.push(await uploadToCloudinary(file, signature));
+      } catch (error) {
+        failed.push({
+          filename: file.name,
+          error: error instanceof Error ? error.message : 'Upload failed',
+        });
+      }
+    }
+  };
+
+  await Promise.all(
+    Array.from({ length: Math.min(DIRECT_UPLOAD_CONCURRENCY, pending.length) }, worker)
+  );
+
+  if (!uploads.length) {
+    throw new Error(`Failed to upload ${failed.length} photos`);
+  }
+
+  const result = await confirmUploads(wingId, uploads);
+
+  return {
+    photos: result.photos,
+    failed: [...failed, ...result.failed],
+    duplicates,
+  };
+}
+
 export async function deletePhoto(photoId: number): Promise<void> {
   await api.delete(`/api/admin/photos/${photoId}`);
 }
@@ -121,6 +247,9 @@ export async function deleteActivity(activityId: number): Promise<void> {
 
 export const adminApi = {
   login,
+  getUploadSignature,
+  confirmUploads,
+  lookupPhotoHashes,
   uploadPhotos,
   deletePhoto,
   createActivity,
@@ -1,7 +1,59 @@
+import axios from 'axios';
 import api from './api';
 import { Wing, WingWithRelations } from '@/types/wing';
-import { Activity } from '@/types/activity';
-import { Photo } from '@/types/photo';
+import { Activity, ActivityPage, SearchResponse } from '@/types/activity';
+import { PhotoPage } from '@/types/photo';
+
+const SNAPSHOT_BASE_URL = import.meta.env.VITE_SNAPSHOT_BASE_URL?.replace(/\/+$/, '');
+
+const SNAPSHOT_TIMEOUT_MS = 5000;
+const SNAPSHOT_MANIFEST_TTL_MS = 60000;
+
+interface SnapshotManifest {
+  scopes: Record<string, { files: Record<string, { path: string }> }>;
+}
+
+let snapshotPaths: Promise<Map<string, string> | undefined> | undefined;
+let snapshotPathsLoadedAt = 0;
+
+async function loadSnapshotPaths(): Promise<Map<string, string> | undefined> {
+  try {
+    const response = await axios.get<SnapshotManifest>(`${SNAPSHOT_BASE_URL}/manifest.json`, {
+      timeout: SNAPSHOT_TIMEOUT_MS,
+    });
+    return new Map(
+      Object.values(response.data.scopes).flatMap((scope) =>
+        Object.entries(scope.files).map(([logical, entry]): [string, string] => [logical, entry.path])
+      )
+    );
+  } catch {
+    return undefined;
+  }
+}
+
+async function resolveSnapshotPath(path: string): Promise<string | undefined> {
+  if (!snapshotPaths || Date.now() - snapshotPathsLoadedAt > SNAPSHOT_MANIFEST_TTL_MS) {
+    snapshotPathsLoadedAt = Date.now();
+    snapshotPaths = loadSnapshotPaths();
+  }
+  return (await snapshotPaths)?.get(path);
+}
+
+async function fromSnapshot<T>(path: string): Promise<T | undefined> {
+  if (!SNAPSHOT_BASE_URL) return undefined;
+
+  const resolved = await resolveSnapshotPath(path);
+  if (!resolved) return undefined;
+
+  try {
+    const response = await axios.get<T>(`${SNAPSHOT_BASE_URL}/${resolved}`, {
+      timeout: SNAPSHOT_TIMEOUT_MS,
+    });
+    return response.data;
+  } catch {
+    return undefined;
+  }
+}
 
 export interface ActivityStatistic {
   wing_id: number;
@@ -18,15 +70,48 @@ export interface ActivityStatisticsResponse {
 
 export interface PaginationOptions {
   limit?: number;
-  offset?: number;
+  cursor?: string | null;
+}
+
+export interface ActivityFilterOptions extends PaginationOptions {
+  year?: number;
+  dateFrom?: string;
+  dateTo?: string;
+  hasReport?: boolean;
+}
+
+function activityFilterParams(options: ActivityFilterOptions) {
+  const { limit = 100, cursor, year, dateFrom, dateTo, hasReport } = options;
+  return {
+    limit,
+    ...(cursor ? { cursor } : {}),
+    ...(year !== undefined ? { year } : {}),
+    ...(dateFrom ? { date_from: dateFrom } : {}),
+    ...(dateTo ? { date_to: dateTo } : {}),
+    ...(hasReport !== undefined ? { has_report: hasReport } : {}),
+  };
+}
+
+export interface SearchOptions extends PaginationOptions {
+  wing?: string;
+  dateFrom?: string;
+  dateTo?: string;
 }
 
 export async function getAllWings(): Promise<Wing[]> {
+  const snapshot = await fromSnapshot<Wing[]>('api/wings.json');
+  if (snapshot) return snapshot;
+
   const response = await api.get<Wing[]>('/api/wings');
   return response.data;
 }
 
 export async function getWingBySlug(slug: string): Promise<WingWithRelations> {
+  const snapshot = await fromSnapshot<WingWithRelations>(
+    `api/wings/${encodeURIComponent(slug)}.json`
+  );
+  if (snapshot) return snapshot;
+
   const response = await api.get<WingWithRelations>(`/api/wings/${encodeURIComponent(slug)}`);
   return response.data;
 }
@@ -34,18 +119,22 @@ export async function getWingBySlug(slug: string): Promise<WingWithRelations> {
 export async function getWingPhotos(
   slug: string,
   options: PaginationOptions = {}
-): Promise<Photo[]> {
-  const { limit = 100, offset = 0 } = options;
+): Promise<PhotoPage> {
+  const { limit = 100, cursor } = options;
   
-  const response = await api.get<Photo[]>(`/api/wings/${encodeURIComponent(slug)}/photos`, {
-    params: { limit, offset },
+  const response = await api.get<PhotoPage>(`/api/wings/${encodeURIComponent(slug)}/photos`, {
+    params: cursor ? { limit, cursor } : { limit },
   });
   return response.data;
 }
 
-export async function getWingActivities(slug: string): Promise<Activity[]> {
-  const response = await api.get<Activity[]>(
-    `/api/wings/${encodeURIComponent(slug)}/activities`
+export async function getWingActivities(
+  slug: string,
+  options: ActivityFilterOptions = {}
+): Promise<ActivityPage> {
+  const response = await api.get<ActivityPage>(
+    `/api/wings/${encodeURIComponent(slug)}/activities`,
+    { params: activityFilterParams(options) }
   );
   return response.data;
 }
@@ -55,9 +144,14 @@ export async function getActivity(id: number): Promise<Activity> {
   return response.data;
 }
 
-export async function getAllActivities(limit: number = 1000): Promise<Activity[]> {
-  const response = await api.get<Activity[]>('/api/activities', {
-    params: { limit },
+export async function getAllActivities(
+  options: ActivityFilterOptions & { wings?: string[] } = {}
+): Promise<ActivityPage> {
+  const { wings, ...filters } = options;
+  
+  const response = await api.get<ActivityPage>('/api/activities', {
+    params: { ...activityFilterParams(filters), ...(wings?.length ? { wing: wings } : {}) },
+    paramsSerializer: { indexes: null },
   });
   return response.data;
 }
@@ -65,12 +159,36 @@ export async function getAllActivities(limit: number = 1000): Promise<Activity[]
 export async function getActivityStatistics(
   year?: number
 ): Promise<ActivityStatisticsResponse> {
+  const snapshot = await fromSnapshot<ActivityStatisticsResponse>(
+    year !== undefined ? `api/statistics/activities/${year}.json` : 'api/statistics/activities.json'
+  );
+  if (snapshot) return snapshot;
+
   const response = await api.get<ActivityStatisticsResponse>('/api/statistics/activities', {
     params: year !== undefined ? { year } : undefined,
   });
   return response.data;
 }
 
+export async function search(
+  query: string,
+  options: SearchOptions = {}
+): Promise<SearchResponse> {
+  const { limit = 20, cursor, wing, dateFrom, dateTo } = options;
+  
+  const response = await api.get<SearchResponse>('/api/search', {
+    params: {
+      q: query,
+      limit,
+      ...(cursor ? { cursor } : {}),
+      ...(wing ? { wing } : {}),
+      ...(dateFrom ? { date_from: dateFrom } : {}),
+      ...(dateTo ? { date_to: dateTo } : {}),
+    },
+  });
+  return response.data;
+}
+
 export const publicApi = {
   getAllWings,
   getWingBySlug,
@@ -79,4 +197,5 @@ export const publicApi = {
   getActivity,
   getAllActivities,
   getActivityStatistics,
+  search,
 };
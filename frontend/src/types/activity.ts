@@ -24,3 +24,26 @@ export interface ActivityUpdate {
   activity_date?: string;
   faculty_coordinator?: string;
 }
+
+export interface ActivityPage {
+  items: Activity[];
+  next_cursor: string | null;
+}
+
+export interface ActivitySearchHit extends Activity {
+  rank: number;
+}
+
+export interface WingSearchHit {
+  id: number;
+  name: string;
+  slug: string;
+  rank: number;
+}
+
+export interface SearchResponse {
+  query: string;
+  wings: WingSearchHit[];
+  activities: ActivitySearchHit[];
+  next_cursor: string | null;
+}
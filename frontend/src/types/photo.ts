@@ -1,7 +1,59 @@
+export interface PhotoDerivatives {
+  thumbnail: string;
+  medium: string;
+  full: string;
+  srcset: Record<string, string>;
+}
+
 export interface Photo {
   id: number;
   wing_id: number;
   url: string;
   cloudinary_id: string;
+  width: number | null;
+  height: number | null;
+  size_bytes: number | null;
+  format: string | null;
+  content_hash: string | null;
   uploaded_at: string;
+  derivatives: PhotoDerivatives;
+}
+
+export interface PhotoPage {
+  items: Photo[];
+  next_cursor: string | null;
+}
+
+export interface PhotoUploadFailure {
+  filename: string;
+  error: string;
+}
+
+export interface PhotoUploadResponse {
+  photos: Photo[];
+  failed: PhotoUploadFailure[];
+  duplicates: Photo[];
+}
+
+export interface PhotoHashLookupResponse {
+  existing: Record<string, Photo>;
+}
+
+export interface PhotoUploadSignature {
+  upload_url: string;
+  cloud_name: string;
+  api_key: string;
+  folder: string;
+  timestamp: number;
+  allowed_formats: string;
+  transformation: string;
+  signature: string;
+  expires_at: number;
+}
+
+export interface DirectUpload {
+  public_id: string;
+  version: number;
+  signature: string;
+  original_filename?: string;
 }
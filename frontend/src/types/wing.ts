@@ -13,4 +13,8 @@ export interface Wing {
 export interface WingWithRelations extends Wing {
   activities: Activity[];
   photos: Photo[];
+  activity_count: number;
+  photo_count: number;
+  activities_next_cursor: string | null;
+  photos_next_cursor: string | null;
 }